@@ -0,0 +1,187 @@
+"""CSC111 Project 1: Text Adventure Game - Command Registry
+
+Instructions (READ THIS FIRST!)
+===============================
+
+This Python module contains the command registry for Project 1, to be imported and used by
+ the `adventure` module. Menu commands and special events register their handlers here, and the
+ registry compiles them into one dispatch table per location.
+ Please consult the project handout for instructions and details.
+
+Copyright and Usage Information
+===============================
+
+This file is provided solely for the personal and private use of students
+taking CSC111 at the University of Toronto St. George campus. All forms of
+distribution of this code, whether as given or with any changes, are
+expressly prohibited. For more information on copyright for CSC111 materials,
+please consult our Course Syllabus.
+
+This file is Copyright (c) 2025 CSC111 Teaching Team
+"""
+from __future__ import annotations
+from collections.abc import Mapping
+from typing import Any, Callable, NamedTuple, Optional
+from command_trie import CommandTrie
+from game_entities import Item
+
+# A command handler is called with the game state, the (normalized) command and the list of output events to
+# append to, and returns the item involved in the command, or None if no item is involved.
+Handler = Callable[[Any, str, list], Optional[Item]]
+
+# The kinds of commands in a dispatch table
+MENU = "menu"  # available everywhere and does not take a move
+MOVE = "move"  # one of the location's available commands that leads to another location
+ITEM = "item"  # picks up or drops an item
+SPECIAL = "special"  # one of the location's available commands with a registered special event
+
+
+class Command(NamedTuple):
+    """An entry of a dispatch table.
+
+    Instance Attributes:
+        - handler: the function to call when the command is entered
+        - kind: the kind of command (MENU, MOVE, ITEM or SPECIAL)
+    """
+    handler: Handler
+    kind: str
+
+
+def normalize_command(text: str) -> str:
+    """Return text in the form used as a key of dispatch tables: lowercase, with single spaces between words.
+
+    >>> normalize_command("  Pick  up:   KEY ")
+    'pick up: key'
+    """
+
+    return " ".join(text.lower().split())
+
+
+class CommandRegistry:
+    """The handlers of every kind of command in the game.
+
+    Menu commands and special events register themselves with the menu and special decorators; the handlers for
+    moving between locations and for picking up and dropping items are given when the registry is created.
+
+    Instance Attributes:
+        - menu_commands: the names of the menu commands, in the order they were registered
+        - menu_trie: a trie of the menu commands that can be entered other than exactly
+    """
+
+    # Private Instance Attributes:
+    #   - _menu: a mapping from menu command to its handler
+    #   - _special: a mapping from special event command to its handler
+    #   - _move: the handler of available commands without a special event
+    #   - _pick_up: the handler of "pick up: <item>" commands
+    #   - _drop: the handler of "drop: <item>" commands
+    menu_trie: CommandTrie
+    _menu: dict[str, Handler]
+    _special: dict[str, Handler]
+    _move: Handler
+    _pick_up: Handler
+    _drop: Handler
+
+    def __init__(self, move: Handler, pick_up: Handler, drop: Handler) -> None:
+        """Initialize a registry with the given handlers for moving, picking up and dropping, and no menu
+        commands or special events."""
+
+        self.menu_trie = CommandTrie()
+        self._menu = {}
+        self._special = {}
+        self._move = move
+        self._pick_up = pick_up
+        self._drop = drop
+
+    @property
+    def menu_commands(self) -> list[str]:
+        """The names of the menu commands, in the order they were registered."""
+        return list(self._menu)
+
+    def menu(self, command: str, exact_only: bool = False) -> Callable[[Handler], Handler]:
+        """Return a decorator registering its function as the handler of the given menu command. If exact_only is
+        True, the command is left out of menu_trie, so it is never taken for a prefix or a typo of it."""
+
+        def register(handler: Handler) -> Handler:
+            self._menu[normalize_command(command)] = handler
+            if not exact_only:
+                self.menu_trie.add(normalize_command(command))
+            return handler
+
+        return register
+
+    def special(self, command: str) -> Callable[[Handler], Handler]:
+        """Return a decorator registering its function as the handler of the special event triggered by the given
+        available command, wherever that command is available."""
+
+        def register(handler: Handler) -> Handler:
+            self._special[normalize_command(command)] = handler
+            return handler
+
+        return register
+
+    def is_special(self, command: str) -> bool:
+        """Return whether command (in the form normalize_command returns) triggers a special event."""
+
+        return command in self._special
+
+    def compile(self, available_commands: Mapping[str, int], pick_up_options: Mapping[str, Item],
+                drop_options: Mapping[str, Item]) -> dict[str, Command]:
+        """Return the dispatch table of a location with the given available commands and "pick up: <item>"
+        commands, for a player with the given "drop: <item>" commands (see Location.pick_up_options and
+        Player.drop_options).
+
+        The table maps every valid command to its Command: first the location's available commands, then the
+        "pick up: <item>" and "drop: <item>" commands (in that order), and finally the menu commands, which take
+        precedence over everything else.
+        """
+
+        table = {}
+        for command in available_commands:
+            special = self._special.get(command)
+            if special is None:
+                table[command] = Command(self._move, MOVE)
+            else:
+                table[command] = Command(special, SPECIAL)
+
+        table.update(dict.fromkeys(pick_up_options, Command(self._pick_up, ITEM)))
+        table.update(dict.fromkeys(drop_options, Command(self._drop, ITEM)))
+
+        for command, handler in self._menu.items():
+            table[command] = Command(handler, MENU)
+
+        return table
+
+    def resolve(self, command: str, available_commands: Mapping[str, int], pick_up_options: Mapping[str, Item],
+                drop_options: Mapping[str, Item]) -> Optional[Command]:
+        """Return the entry of command (in the form normalize_command returns) in the table compile would return
+        for the same arguments, or None if command is not valid there, without compiling the table.
+
+        >>> registry = CommandRegistry(print, print, print)
+        >>> registry.resolve("pick up: key", {"go east": 2}, {"pick up: key": None}, {}).kind
+        'item'
+        >>> registry.resolve("go west", {"go east": 2}, {}, {}) is None
+        True
+        """
+
+        handler = self._menu.get(command)
+        if handler is not None:
+            return Command(handler, MENU)
+        if command in drop_options:
+            return Command(self._drop, ITEM)
+        if command in pick_up_options:
+            return Command(self._pick_up, ITEM)
+        if command in available_commands:
+            special = self._special.get(command)
+            return Command(self._move, MOVE) if special is None else Command(special, SPECIAL)
+        return None
+
+
+if __name__ == "__main__":
+    # When you are ready to check your work with python_ta, uncomment the following lines.
+    # (Delete the "#" and space before each line.)
+    # IMPORTANT: keep this code indented inside the "if __name__ == '__main__'" block
+    import python_ta
+    python_ta.check_all(config={
+        'max-line-length': 120,
+        'disable': ['R1705', 'E9998', 'E9999']
+    })
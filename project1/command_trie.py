@@ -0,0 +1,274 @@
+"""CSC111 Project 1: Text Adventure Game - Command Trie
+
+Instructions (READ THIS FIRST!)
+===============================
+
+This Python module contains the command trie of Project 1, which lets the game understand
+ commands the player did not type exactly: a unique prefix of a valid command, or a near-miss
+ typo of one. Finding them takes time proportional to the length of what was typed rather than
+ to the number of commands available.
+ Please consult the project handout for instructions and details.
+
+Copyright and Usage Information
+===============================
+
+This file is provided solely for the personal and private use of students
+taking CSC111 at the University of Toronto St. George campus. All forms of
+distribution of this code, whether as given or with any changes, are
+expressly prohibited. For more information on copyright for CSC111 materials,
+please consult our Course Syllabus.
+
+This file is Copyright (c) 2025 CSC111 Teaching Team
+"""
+from __future__ import annotations
+from collections.abc import Iterable
+from typing import Optional
+
+# The largest number of typos (single-character insertions, deletions or substitutions) a command can be
+# corrected for
+MAX_EDIT_DISTANCE = 2
+
+# The number of characters a command must have per typo it can be corrected for
+CHARACTERS_PER_TYPO = 3
+
+# The fewest characters a command must be typed with to be taken as a command that changes the game (a move, an
+# item or a special event) it is a prefix or a near-miss typo of (see CommandTrie.min_match_length)
+MIN_MATCH_LENGTH = 4
+
+
+class _TrieNode:
+    """A node of a CommandTrie, standing for the prefix spelled by the path from the root to it.
+
+    Instance Attributes:
+        - children: a mapping from the next character to the node of the longer prefix
+        - count: the number of commands of the trie starting with this node's prefix
+        - terminal: whether this node's prefix is itself a command of the trie
+
+    Representation Invariants:
+        - self.count == int(self.terminal) + sum(child.count for child in self.children.values())
+    """
+
+    __slots__ = ('children', 'count', 'terminal')
+    children: dict[str, _TrieNode]
+    count: int
+    terminal: bool
+
+    def __init__(self) -> None:
+        """Initialize a node with no commands under it."""
+
+        self.children = {}
+        self.count = 0
+        self.terminal = False
+
+
+class CommandTrie:
+    """A set of commands stored as a trie, for finding the commands starting with a prefix and the commands within
+    a small edit distance of a text.
+
+    Instance Attributes:
+        - min_match_length: the fewest characters a text must have for match_command to take it as one of this
+          trie's commands it is not exactly
+
+    Representation Invariants:
+        - self.min_match_length >= 0
+
+    >>> trie = CommandTrie(["go east", "go west", "look"])
+    >>> trie.count_prefix("go "), trie.complete("go e")
+    (2, 'go east')
+    >>> trie.within("go eat", 2)
+    [(1, 'go east'), (2, 'go west')]
+    >>> trie.discard("go east")
+    >>> "go east" in trie, len(trie)
+    (False, 2)
+    """
+
+    min_match_length: int
+
+    # Private Instance Attributes:
+    #   - _root: the node of the empty prefix
+    _root: _TrieNode
+
+    def __init__(self, commands: Iterable[str] = (), min_match_length: int = 0) -> None:
+        """Initialize a trie holding the given commands.
+
+        Preconditions:
+            - min_match_length >= 0
+        """
+
+        self.min_match_length = min_match_length
+        self._root = _TrieNode()
+        for command in commands:
+            self.add(command)
+
+    def __len__(self) -> int:
+        """Return the number of commands in this trie."""
+
+        return self._root.count
+
+    def __contains__(self, command: object) -> bool:
+        """Return whether command is a command of this trie."""
+
+        node = self._node(command) if isinstance(command, str) else None
+        return node is not None and node.terminal
+
+    def _node(self, prefix: str) -> Optional[_TrieNode]:
+        """Return the node of prefix, or None if no command of this trie starts with prefix."""
+
+        node = self._root
+        for char in prefix:
+            node = node.children.get(char)
+            if node is None:
+                return None
+        return node
+
+    def add(self, command: str) -> None:
+        """Add command to this trie, if it is not already in it."""
+
+        if command in self:
+            return
+        node = self._root
+        node.count += 1
+        for char in command:
+            child = node.children.get(char)
+            if child is None:
+                child = node.children[char] = _TrieNode()
+            node = child
+            node.count += 1
+        node.terminal = True
+
+    def discard(self, command: str) -> None:
+        """Remove command from this trie, if it is in it."""
+
+        if command not in self:
+            return
+        node = self._root
+        node.count -= 1
+        for char in command:
+            child = node.children[char]
+            if child.count == 1:
+                del node.children[char]
+                return
+            node = child
+            node.count -= 1
+        node.terminal = False
+
+    def count_prefix(self, prefix: str) -> int:
+        """Return the number of commands of this trie starting with prefix (including prefix itself)."""
+
+        node = self._node(prefix)
+        return 0 if node is None else node.count
+
+    def complete(self, prefix: str) -> Optional[str]:
+        """Return the shortest command of this trie starting with prefix (the first in alphabetical order among
+        the shortest), or None if there is none."""
+
+        node = self._node(prefix)
+        if node is None:
+            return None
+        level = [(prefix, node)]
+        while level:
+            finished = [text for text, node in level if node.terminal]
+            if finished:
+                return min(finished)
+            level = [(text + char, child) for text, node in level for char, child in node.children.items()]
+        return None
+
+    def within(self, text: str, max_distance: int) -> list[tuple[int, str]]:
+        """Return the (edit distance, command) of every command of this trie at most max_distance single-character
+        insertions, deletions or substitutions away from text, closest first.
+
+        The edit distances to text of the prefixes of the commands are computed one row of the Levenshtein table
+        per node, and only in the band of max_distance cells either side of the diagonal (the others are always
+        too far). No node is visited under a prefix already more than max_distance away from every prefix of
+        text, so only the few branches close to text are explored.
+        """
+
+        width = len(text) + 1
+        too_far = max_distance + 1
+        found = []
+        stack = [(self._root, "", [min(j, too_far) for j in range(width)])]
+        while stack:
+            node, prefix, row = stack.pop()
+            if node.terminal and row[-1] <= max_distance:
+                found.append((row[-1], prefix))
+            depth = len(prefix) + 1
+            low, high = max(1, depth - max_distance), min(width, depth + max_distance + 1)
+            for char, child in node.children.items():
+                next_row = [too_far] * width
+                next_row[0] = min(depth, too_far)
+                best = next_row[0] if low == 1 else too_far
+                for j in range(low, high):
+                    cost = min(next_row[j - 1] + 1, row[j] + 1, row[j - 1] + (text[j - 1] != char), too_far)
+                    next_row[j] = cost
+                    best = min(best, cost)
+                if best <= max_distance:
+                    stack.append((child, prefix + char, next_row))
+        found.sort()
+        return found
+
+
+def typo_allowance(command: str) -> int:
+    """Return the number of typos command can be corrected for: one per CHARACTERS_PER_TYPO characters, and at most
+    MAX_EDIT_DISTANCE.
+
+    >>> typo_allowance("go"), typo_allowance("lok"), typo_allowance("pick up: mgu")
+    (0, 1, 2)
+    """
+
+    return min(MAX_EDIT_DISTANCE, len(command) // CHARACTERS_PER_TYPO)
+
+
+def match_command(command: str, tries: Iterable[CommandTrie]) -> Optional[str]:
+    """Return the command of tries that command stands for: command itself if it is in one of tries, or else the
+    only command of tries starting with command, or else (if no command starts with it) the only command closest
+    to command within typo_allowance(command) typos. Return None if there is no such command, or more than one,
+    or if command is shorter than the min_match_length of the trie of the command it stands for.
+
+    Typos are searched for one more at a time, so most lookups only explore the branches one typo away.
+
+    >>> tries = [CommandTrie(["look", "log"]), CommandTrie(["go east", "go west", "talk"], MIN_MATCH_LENGTH)]
+    >>> match_command("go e", tries), match_command("lo", tries), match_command("go", tries)
+    ('go east', None, None)
+    >>> match_command("loo", tries), match_command("lok", tries), match_command("go westt", tries)
+    ('look', None, 'go west')
+    >>> match_command("ta", tries), match_command("tallk", tries)
+    (None, 'talk')
+    """
+
+    tries = list(tries)
+    if any(command in trie for trie in tries):
+        return command
+
+    counts = [trie.count_prefix(command) for trie in tries]
+    if any(counts):
+        if max(counts) > 1:
+            return None
+        return _only_match(command, {trie.complete(command): trie.min_match_length
+                                     for trie, count in zip(tries, counts) if count == 1})
+
+    for distance in range(1, typo_allowance(command) + 1):
+        found = {match: trie.min_match_length for trie in tries for _, match in trie.within(command, distance)}
+        if found:
+            return _only_match(command, found)
+    return None
+
+
+def _only_match(command: str, found: dict[str, int]) -> Optional[str]:
+    """Return the command command stands for, given found, a mapping from every command it may stand for to the
+    min_match_length of its trie: the only one, if command is long enough for it, or else None."""
+
+    if len(found) != 1:
+        return None
+    match, min_length = found.popitem()
+    return match if len(command) >= min_length else None
+
+
+if __name__ == "__main__":
+    # When you are ready to check your work with python_ta, uncomment the following lines.
+    # (Delete the "#" and space before each line.)
+    # IMPORTANT: keep this code indented inside the "if __name__ == '__main__'" block
+    import python_ta
+    python_ta.check_all(config={
+        'max-line-length': 120,
+        'disable': ['R1705', 'E9998', 'E9999']
+    })
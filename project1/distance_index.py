@@ -0,0 +1,414 @@
+"""CSC111 Project 1: Text Adventure Game - Distance Index
+
+Instructions (READ THIS FIRST!)
+===============================
+
+This Python module contains the distance index for Project 1, to be imported and used by
+ the `game_world` and `adventure` modules. The index answers how many moves it takes to get
+ from one location to another by available commands, and which locations are reachable within
+ a number of moves, without searching the map again for every question.
+ Please consult the project handout for instructions and details.
+
+Copyright and Usage Information
+===============================
+
+This file is provided solely for the personal and private use of students
+taking CSC111 at the University of Toronto St. George campus. All forms of
+distribution of this code, whether as given or with any changes, are
+expressly prohibited. For more information on copyright for CSC111 materials,
+please consult our Course Syllabus.
+
+This file is Copyright (c) 2025 CSC111 Teaching Team
+"""
+from __future__ import annotations
+from array import array
+from bisect import bisect_right
+from collections.abc import Callable, Iterable
+from heapq import heappop, heappush
+from typing import Optional
+
+# The distance between two locations when one cannot be reached from the other
+UNREACHABLE = -1
+
+
+def _bfs(n: int, edges: list[set[int]], source: int) -> array:
+    """Return the distance from source to every node of a graph with n nodes and the given adjacency sets (or
+    UNREACHABLE).
+
+    >>> list(_bfs(4, [{1}, {2}, set(), {0}], 0))
+    [0, 1, 2, -1]
+    """
+
+    dist = array('i', [UNREACHABLE]) * n
+    dist[source] = 0
+    frontier = [source]
+    d = 0
+    while frontier:
+        d += 1
+        next_frontier = []
+        for u in frontier:
+            for v in edges[u]:
+                if dist[v] == UNREACHABLE:
+                    dist[v] = d
+                    next_frontier.append(v)
+        frontier = next_frontier
+    return dist
+
+
+class DistanceIndex:
+    """The number of moves between any two locations of a map, where a move follows one available command.
+
+    Locations are numbered by slot, from 0 to len(self) - 1. Maps with at most exact_limit locations store the
+    distance from every location to every other one (one breadth-first search per location), so distances are
+    exact and looked up in O(1). Larger maps store the distances from and to a few landmark locations instead:
+    distance then returns the length of the shortest route through a landmark, which is an upper bound of the
+    real distance, and lower_bound a lower bound derived from the triangle inequality.
+
+    A copy shares its distance rows and adjacency sets with the index it was copied from, and copies a row only
+    when an update changes it (copy on write), so copying takes O(n) rather than O(n^2).
+
+    Instance Attributes:
+        - exact: whether this index stores every distance exactly
+
+    >>> index = DistanceIndex(4, lambda slot: [(slot + 1) % 3])
+    >>> index.distance(0, 2), index.distance(2, 1), index.distance(0, 3)
+    (2, 2, -1)
+    >>> index.reachable_within(0, 1)
+    [0, 1]
+    >>> index.add_edge(0, 2)
+    >>> index.distance(0, 2), index.distance(1, 0)
+    (1, 2)
+    >>> index.remove_edge(0, 2)
+    >>> index.distance(0, 2)
+    2
+    """
+
+    # Private Instance Attributes:
+    #   - _out: the locations each location has a command leading to
+    #   - _in: the locations that have a command leading to each location
+    #   - _rows: if exact, the distance from each location to every location
+    #   - _sorted: a cache of (distances, locations) sorted by distance, from some locations
+    #   - _landmarks: if not exact, the landmark locations
+    #   - _from_landmarks: if not exact, the distance from each landmark to every location
+    #   - _to_landmarks: if not exact, the distance from every location to each landmark
+    #   - _owned: the ids of the rows this index may change in place (every other row may be shared with a copy)
+    exact: bool
+    _out: list[set[int]]
+    _in: list[set[int]]
+    _rows: list[array]
+    _sorted: dict[int, tuple[list[int], list[int]]]
+    _landmarks: list[int]
+    _from_landmarks: list[array]
+    _to_landmarks: list[array]
+    _owned: set[int]
+
+    def __init__(self, n: int, neighbours: Callable[[int], Iterable[int]], exact_limit: int = 1000,
+                 n_landmarks: int = 16) -> None:
+        """Initialize the index of a map of n locations, where neighbours(slot) returns the slots of the locations
+        the commands of the location in that slot lead to.
+
+        Preconditions:
+            - n >= 0
+            - exact_limit >= 0
+            - n_landmarks >= 1
+        """
+
+        self._out = [set(neighbours(slot)) for slot in range(n)]
+        self._in = [set() for _ in range(n)]
+        for u, targets in enumerate(self._out):
+            for v in targets:
+                self._in[v].add(u)
+
+        self.exact = n <= exact_limit
+        self._sorted = {}
+        self._rows = []
+        self._landmarks = []
+        self._from_landmarks = []
+        self._to_landmarks = []
+        self._owned = set()
+        if self.exact:
+            self._rows = [_bfs(n, self._out, source) for source in range(n)]
+        elif n > 0:
+            self._choose_landmarks(min(n_landmarks, n))
+
+    def __len__(self) -> int:
+        """Return the number of locations of the map."""
+
+        return len(self._out)
+
+    def _choose_landmarks(self, count: int) -> None:
+        """Choose count landmarks spread out over the map (each as far as possible from the ones before it) and
+        compute the distances from and to them."""
+
+        landmark = 0
+        nearest = array('i', [UNREACHABLE]) * len(self)
+        for _ in range(count):
+            self._landmarks.append(landmark)
+            from_landmark = _bfs(len(self), self._out, landmark)
+            self._from_landmarks.append(from_landmark)
+            self._to_landmarks.append(_bfs(len(self), self._in, landmark))
+
+            best = UNREACHABLE
+            for slot, d in enumerate(from_landmark):
+                if d != UNREACHABLE and (nearest[slot] == UNREACHABLE or d < nearest[slot]):
+                    nearest[slot] = d
+                if nearest[slot] == UNREACHABLE:  # not reached by any landmark yet: the best next landmark
+                    best, landmark = len(self), slot
+                elif nearest[slot] > best:
+                    best, landmark = nearest[slot], slot
+            if best <= 0:  # every location is a landmark
+                break
+
+    def distance(self, source: int, target: int) -> int:
+        """Return the number of moves from the location in slot source to the one in slot target, or UNREACHABLE.
+
+        If not self.exact, this is the length of the shortest route through a landmark, which may be longer than
+        the shortest route (and UNREACHABLE if no landmark route exists).
+        """
+
+        if self.exact:
+            return self._rows[source][target]
+        if source == target:
+            return 0
+
+        best = UNREACHABLE
+        for to_landmark, from_landmark in zip(self._to_landmarks, self._from_landmarks):
+            d1, d2 = to_landmark[source], from_landmark[target]
+            if d1 != UNREACHABLE and d2 != UNREACHABLE and (best == UNREACHABLE or d1 + d2 < best):
+                best = d1 + d2
+        return best
+
+    def lower_bound(self, source: int, target: int) -> int:
+        """Return a number of moves that getting from the location in slot source to the one in slot target takes
+        at least (the exact distance if self.exact), or UNREACHABLE if it is certainly impossible."""
+
+        if self.exact:
+            return self._rows[source][target]
+
+        bound = 0
+        for to_landmark, from_landmark in zip(self._to_landmarks, self._from_landmarks):
+            # d(source, target) >= d(landmark, target) - d(landmark, source) and >= d(source, l) - d(target, l)
+            if from_landmark[source] != UNREACHABLE:
+                if from_landmark[target] == UNREACHABLE:
+                    return UNREACHABLE
+                bound = max(bound, from_landmark[target] - from_landmark[source])
+            if to_landmark[target] != UNREACHABLE:
+                if to_landmark[source] == UNREACHABLE:
+                    return UNREACHABLE
+                bound = max(bound, to_landmark[source] - to_landmark[target])
+        return bound
+
+    def reachable_within(self, source: int, moves: int) -> list[int]:
+        """Return the slots of the locations that can be reached from the location in slot source in at most
+        moves moves, closest first.
+
+        If self.exact this takes O(log n) plus the size of the answer once the locations have been sorted by their
+        distance from source; otherwise it searches the locations within moves moves of source.
+        """
+
+        if not self.exact:
+            return self._search_within(source, moves)
+
+        if source not in self._sorted:
+            row = self._rows[source]
+            order = sorted((d, slot) for slot, d in enumerate(row) if d != UNREACHABLE)
+            self._sorted[source] = ([d for d, _ in order], [slot for _, slot in order])
+        distances, slots = self._sorted[source]
+        return slots[:bisect_right(distances, moves)]
+
+    def can_reach_within(self, source: int, targets: Iterable[int], moves: int) -> bool:
+        """Return whether some location with a slot in targets can be reached from the location in slot source in
+        at most moves moves.
+
+        If not self.exact, the answer is False only if that is certain.
+        """
+
+        for target in targets:
+            d = self.lower_bound(source, target)
+            if d != UNREACHABLE and d <= moves:
+                return True
+        return False
+
+    def _search_within(self, source: int, moves: int) -> list[int]:
+        """Return the slots of the locations within moves moves of the location in slot source, closest first, by
+        a breadth-first search that stops after moves moves."""
+
+        seen = {source}
+        found = [source]
+        frontier = [source]
+        for _ in range(moves):
+            next_frontier = []
+            for u in frontier:
+                for v in self._out[u]:
+                    if v not in seen:
+                        seen.add(v)
+                        next_frontier.append(v)
+            found.extend(next_frontier)
+            frontier = next_frontier
+        return found
+
+    def copy(self) -> DistanceIndex:
+        """Return a copy of this index that can be updated independently of it."""
+
+        self._owned = set()  # every row is now shared with the copy
+        other = DistanceIndex.__new__(DistanceIndex)
+        other.exact = self.exact
+        other._out = list(self._out)
+        other._in = list(self._in)
+        other._rows = list(self._rows)
+        other._sorted = dict(self._sorted)
+        other._landmarks = list(self._landmarks)
+        other._from_landmarks = list(self._from_landmarks)
+        other._to_landmarks = list(self._to_landmarks)
+        other._owned = set()
+        return other
+
+    def update(self, slot: int, targets: Iterable[int]) -> None:
+        """Update this index after the commands of the location in the given slot changed to lead to targets."""
+
+        targets = set(targets)
+        for v in self._out[slot] - targets:
+            self.remove_edge(slot, v)
+        for v in targets - self._out[slot]:
+            self.add_edge(slot, v)
+
+    def add_edge(self, u: int, v: int) -> None:
+        """Update this index after the location in slot u gained a command leading to the location in slot v."""
+
+        if v in self._out[u]:
+            return
+        self._out[u] = self._out[u] | {v}  # a new set, since the old one may be shared with a copy
+        self._in[v] = self._in[v] | {u}
+        self._sorted.clear()
+
+        if self.exact:
+            _rows_after_add(self._rows, self._out, u, v, self._owned)
+        else:
+            _rows_after_add(self._from_landmarks, self._out, u, v, self._owned)
+            _rows_after_add(self._to_landmarks, self._in, v, u, self._owned)
+
+    def remove_edge(self, u: int, v: int) -> None:
+        """Update this index after the location in slot u lost its commands leading to the location in slot v."""
+
+        if v not in self._out[u]:
+            return
+        self._out[u] = self._out[u] - {v}
+        self._in[v] = self._in[v] - {u}
+        self._sorted.clear()
+
+        if self.exact:
+            _rows_after_remove(self._rows, self._out, self._in, u, v, self._owned)
+        else:
+            _rows_after_remove(self._from_landmarks, self._out, self._in, u, v, self._owned)
+            _rows_after_remove(self._to_landmarks, self._in, self._out, v, u, self._owned)
+
+
+def _own_row(rows: list[array], i: int, owned: Optional[set[int]]) -> array:
+    """Return rows[i], replacing it with a copy first unless owned is None or holds its id (see
+    DistanceIndex._owned), so that it can be changed in place."""
+
+    row = rows[i]
+    if owned is not None and id(row) not in owned:
+        row = rows[i] = array('i', row)
+        owned.add(id(row))
+    return row
+
+
+def _rows_after_add(rows: list[array], edges: list[set[int]], u: int, v: int,
+                    owned: Optional[set[int]] = None) -> None:
+    """Update rows, the distances from some sources by edges, after the edge from u to v was added to edges. The
+    rows that change are copied first unless their ids are in owned (see _own_row).
+
+    A distance can only get shorter through the new edge, so each row is only searched from v, and only through
+    the nodes whose distance got shorter.
+
+    >>> edges = [{1}, {2}, set()]
+    >>> rows = [_bfs(3, edges, 0)]
+    >>> edges[0].add(2)
+    >>> _rows_after_add(rows, edges, 0, 2)
+    >>> list(rows[0])
+    [0, 1, 1]
+    """
+
+    for i, row in enumerate(rows):
+        to_u = row[u]
+        if to_u == UNREACHABLE or (row[v] != UNREACHABLE and row[v] <= to_u + 1):
+            continue
+        row = _own_row(rows, i, owned)
+        row[v] = to_u + 1
+        frontier = [v]
+        d = to_u + 1
+        while frontier:
+            d += 1
+            next_frontier = []
+            for x in frontier:
+                for y in edges[x]:
+                    if row[y] == UNREACHABLE or row[y] > d:
+                        row[y] = d
+                        next_frontier.append(y)
+            frontier = next_frontier
+
+
+def _rows_after_remove(rows: list[array], edges: list[set[int]], reverse_edges: list[set[int]], u: int,
+                       v: int, owned: Optional[set[int]] = None) -> None:
+    """Update rows, the distances from some sources by edges, after the edge from u to v was removed from edges
+    (reverse_edges being edges reversed). The rows that change are copied first unless their ids are in owned
+    (see _own_row).
+
+    A node's distance only gets longer if every one of its shortest routes used the removed edge. Those nodes
+    are found by following shortest routes from v, and only their distances are computed again.
+
+    >>> edges = [{1, 2}, {2}, set()]
+    >>> rows = [_bfs(3, edges, 0)]
+    >>> edges[0].discard(2)
+    >>> _rows_after_remove(rows, edges, [set(), {0}, {1}], 0, 2)
+    >>> list(rows[0])
+    [0, 1, 2]
+    """
+
+    for i, row in enumerate(rows):
+        if row[u] == UNREACHABLE or row[v] != row[u] + 1:
+            continue
+
+        # the nodes whose shortest routes all used the edge, found level by level
+        affected = set()
+        level = [v]
+        while level:
+            next_level = []
+            for x in level:
+                if not any(w not in affected and row[w] != UNREACHABLE and row[w] + 1 == row[x]
+                           for w in reverse_edges[x]):
+                    affected.add(x)
+                    next_level.extend(y for y in edges[x] if row[y] == row[x] + 1)
+            level = list(dict.fromkeys(y for y in next_level if y not in affected))
+        if not affected:
+            continue
+
+        row = _own_row(rows, i, owned)
+        # each affected node is now reached from an unaffected node, through affected nodes only
+        for x in affected:
+            row[x] = UNREACHABLE
+        queue = []
+        for x in affected:
+            best = min((row[w] + 1 for w in reverse_edges[x] if row[w] != UNREACHABLE), default=UNREACHABLE)
+            if best != UNREACHABLE:
+                heappush(queue, (best, x))
+        while queue:
+            d, x = heappop(queue)
+            if row[x] != UNREACHABLE:
+                continue
+            row[x] = d
+            for y in edges[x]:
+                if y in affected and row[y] == UNREACHABLE:
+                    heappush(queue, (d + 1, y))
+
+
+if __name__ == "__main__":
+    # When you are ready to check your work with python_ta, uncomment the following lines.
+    # (Delete the "#" and space before each line.)
+    # IMPORTANT: keep this code indented inside the "if __name__ == '__main__'" block
+    import python_ta
+    python_ta.check_all(config={
+        'max-line-length': 120,
+        'disable': ['R1705', 'E9998', 'E9999']
+    })
@@ -0,0 +1,376 @@
+"""CSC111 Project 1: Text Adventure Game - Event Journal
+
+Instructions (READ THIS FIRST!)
+===============================
+
+This Python module contains the event journal for Project 1, to be imported and used by
+ the `proj1_event_logger` and `game_engine` modules. An event log can write every event added to
+ it, every undo and every answer to a minigame prompt, to an append-only binary file, so that a
+ game can be recovered by replaying the file if the process playing it dies.
+ Please consult the project handout for instructions and details.
+
+Copyright and Usage Information
+===============================
+
+This file is provided solely for the personal and private use of students
+taking CSC111 at the University of Toronto St. George campus. All forms of
+distribution of this code, whether as given or with any changes, are
+expressly prohibited. For more information on copyright for CSC111 materials,
+please consult our Course Syllabus.
+
+This file is Copyright (c) 2025 CSC111 Teaching Team
+"""
+from __future__ import annotations
+import os
+import random
+import struct
+import threading
+import time
+from dataclasses import dataclass
+from typing import Optional
+from game_entities import Player
+
+# The first bytes of every journal file, followed by the file header: the seed of the game's random numbers
+MAGIC = b"DDJ2"
+_FILE_HEADER = struct.Struct('<q')
+
+# The kinds of journal records
+EVENT = 0  # an event was added to the log
+UNDO = 1  # the last event was removed from the log
+STRING = 2  # a command or item name, numbered in the order of these records
+PROMPT = 3  # a command started a minigame prompt
+ANSWER = 4  # the player answered a minigame prompt
+
+# When a journal forces its records to disk with fsync
+FSYNC_ALWAYS = "always"  # after every record: no event is ever lost, but every event waits for the disk
+FSYNC_GROUP = "group"  # after every group of records: at most one group is lost
+FSYNC_NEVER = "never"  # never: the operating system writes the records to disk when it chooses
+
+# Every record starts with the length of its body and its kind, and the body of an EVENT record is the location
+# id, the command string id (-1 if none), the item string id (-1 if none) and the player's score. The body of a
+# PROMPT or ANSWER record is the string id of the command or answer.
+_HEADER = struct.Struct('<IB')
+_EVENT = struct.Struct('<iiii')
+_TEXT = struct.Struct('<i')
+
+
+@dataclass(slots=True)
+class JournalRecord:
+    """An event added to, or removed from, an event log, or a minigame prompt and its answer, as read back from a
+    journal.
+
+    Instance Attributes:
+        - kind: EVENT, UNDO, PROMPT or ANSWER
+        - location_id: the id of the event's location (-1 for the other kinds)
+        - command: the command that led to the event, None if it is the first event; the command that started the
+          prompt for PROMPT; the answer for ANSWER; None for UNDO
+        - item_name: the name of the item involved in the event, None if there is none (or for the other kinds)
+        - score: the player's score when the event was added (0 for the other kinds)
+    """
+
+    kind: int
+    location_id: int
+    command: Optional[str] = None
+    item_name: Optional[str] = None
+    score: int = 0
+
+
+def _scan(data: bytes) -> tuple[list[str], list[JournalRecord], int]:
+    """Return the strings and the records of the journal data, and the length of its complete records.
+
+    A record cut short (the process died while writing it) ends the journal.
+
+    Preconditions:
+        - _header_seed(data) is not None
+    """
+
+    strings, records = [], []
+    names = {-1: None}  # the string of each string id, and None for -1
+    unpack_header, unpack_event = _HEADER.unpack_from, _EVENT.unpack_from
+    position = _HEADER_END
+    while position + _HEADER.size <= len(data):
+        length, kind = unpack_header(data, position)
+        body = position + _HEADER.size
+        if body + length > len(data):
+            break
+        if kind == EVENT:
+            location_id, command_id, item_id, score = unpack_event(data, body)
+            records.append(JournalRecord(EVENT, location_id, names[command_id], names[item_id], score))
+        elif kind == UNDO:
+            records.append(JournalRecord(UNDO, -1))
+        elif kind == STRING:
+            names[len(strings)] = data[body:body + length].decode()
+            strings.append(names[len(strings)])
+        else:
+            records.append(JournalRecord(kind, -1, names[_TEXT.unpack_from(data, body)[0]]))
+        position = body + length
+    return strings, records, position
+
+
+# The length of MAGIC and the file header, where the records of a journal start
+_HEADER_END = len(MAGIC) + _FILE_HEADER.size
+
+
+def _header_seed(data: bytes, filename: str) -> Optional[int]:
+    """Return the seed in the file header of the journal data read from filename, or None if the file header is
+    not all there (the process died while creating the journal, which then holds no records).
+
+    Raise ValueError if data is not the start of a journal.
+    """
+
+    if data[:len(MAGIC)] != MAGIC[:len(data)]:
+        raise ValueError(f"{filename} is not an event journal")
+    if len(data) < _HEADER_END:
+        return None
+    return _FILE_HEADER.unpack_from(data, len(MAGIC))[0]
+
+
+def _read(filename: str) -> bytes:
+    """Return the contents of filename, or no bytes if it does not exist."""
+
+    try:
+        with open(filename, 'rb') as file:
+            return file.read()
+    except FileNotFoundError:
+        return b""
+
+
+def journal_seed(filename: str) -> Optional[int]:
+    """Return the seed of the game written to the journal in filename, or None if the journal is new (it does not
+    exist, is empty, or was cut short before its file header was written).
+
+    Raise ValueError if filename is not an event journal.
+    """
+
+    return _header_seed(_read(filename), filename)
+
+
+def read_journal(filename: str) -> list[JournalRecord]:
+    """Return the records of the journal in filename, in the order they were written. A new journal (see
+    journal_seed) has no records.
+
+    Raise ValueError if filename is not an event journal.
+    """
+
+    data = _read(filename)
+    if _header_seed(data, filename) is None:
+        return []
+    return _scan(data)[1]
+
+
+class EventJournal:
+    """An append-only journal file of the events added to and removed from an event log.
+
+    The file starts with the seed of the game's random numbers, written (and, unless the policy is FSYNC_NEVER,
+    forced to disk) when the file is created, so that replaying the journal draws the same numbers. Command and
+    item names are written once, the first time they are used, and referred to by number after that.
+
+    Records are written in groups (group commit): a group is written with one system call and, with the
+    FSYNC_GROUP policy, forced to disk with one fsync. A group ends when it holds group_size records, and at the
+    end of every turn once commit_delay seconds have passed since the last commit (see end_turn). If the process
+    dies, the records not committed yet are lost, and a record cut short is ignored (and overwritten) when the
+    journal is opened again.
+
+    A commit may run in another thread (so that the thread adding records does not wait for the disk), as long as
+    no records are added meanwhile; commits and closing never overlap.
+
+    Instance Attributes:
+        - filename: the name of the journal file
+        - seed: the seed of the random numbers of the game written to the journal
+        - group_size: the largest number of records written together
+        - commit_delay: the least number of seconds between the commits at the end of turns
+        - fsync: when records are forced to disk (FSYNC_ALWAYS, FSYNC_GROUP or FSYNC_NEVER)
+        - player: the player whose score is written with each event, or None to write 0
+
+    Representation Invariants:
+        - self.group_size >= 1
+        - self.commit_delay >= 0
+        - self.fsync in {FSYNC_ALWAYS, FSYNC_GROUP, FSYNC_NEVER}
+
+    >>> import tempfile
+    >>> filename = os.path.join(tempfile.mkdtemp(), 'game.journal')
+    >>> journal = EventJournal(filename)
+    >>> journal.record_event(1, None, None)
+    >>> journal.record_event(2, "go east", None)
+    >>> journal.record_undo()
+    >>> journal.close()
+    >>> [(record.kind, record.location_id, record.command) for record in read_journal(filename)]
+    [(0, 1, None), (0, 2, 'go east'), (1, -1, None)]
+    >>> journal_seed(filename) == journal.seed
+    True
+    """
+
+    filename: str
+    seed: int
+    group_size: int
+    commit_delay: float
+    fsync: str
+    player: Optional[Player]
+
+    # Private Instance Attributes:
+    #   - _fd: the file descriptor the journal is appended to, or -1 once closed
+    #   - _string_ids: the number of each command and item name written so far
+    #   - _buffer: the records not written yet
+    #   - _pending: the number of records in _buffer other than STRING records
+    #   - _last_commit: the time.monotonic() of the last commit
+    #   - _lock: held while records are written, so that commits from different threads never overlap
+    _fd: int
+    _string_ids: dict[str, int]
+    _buffer: bytearray
+    _pending: int
+    _last_commit: float
+    _lock: threading.Lock
+
+    def __init__(self, filename: str, group_size: int = 64, fsync: str = FSYNC_GROUP,
+                 player: Optional[Player] = None, seed: Optional[int] = None, commit_delay: float = 0.0) -> None:
+        """Open the journal in filename to append records to it.
+
+        A new journal (see journal_seed) is created with the given seed, or a random one if seed is None. An
+        existing journal keeps its seed, and if the file ends with a record cut short, that record is removed.
+
+        Raise ValueError if filename is not an event journal, or if seed is not None and differs from the seed of
+        the existing journal.
+
+        Preconditions:
+            - group_size >= 1
+            - commit_delay >= 0
+            - fsync in {FSYNC_ALWAYS, FSYNC_GROUP, FSYNC_NEVER}
+        """
+
+        self.filename = filename
+        self.group_size = group_size
+        self.commit_delay = commit_delay
+        self.fsync = fsync
+        self.player = player
+        self._string_ids = {}
+        self._buffer = bytearray()
+        self._pending = 0
+        self._lock = threading.Lock()
+
+        data = _read(filename)
+        existing_seed = _header_seed(data, filename)
+        if existing_seed is not None:
+            if seed is not None and seed != existing_seed:
+                raise ValueError(f"{filename} is the journal of a game with another seed")
+            self.seed = existing_seed
+            strings, _, length = _scan(data)
+            self._string_ids = {string: i for i, string in enumerate(strings)}
+            if length < len(data):
+                os.truncate(filename, length)
+            self._fd = os.open(filename, os.O_WRONLY | os.O_APPEND)
+        else:
+            self.seed = random.SystemRandom().getrandbits(63) if seed is None else seed
+            self._fd = os.open(filename, os.O_WRONLY | os.O_APPEND | os.O_CREAT | os.O_TRUNC, 0o644)
+            self._buffer += MAGIC + _FILE_HEADER.pack(self.seed)
+            self.commit()
+        self._last_commit = time.monotonic()
+
+    def _string_id(self, string: Optional[str]) -> int:
+        """Return the number of string (or -1 if it is None), adding a STRING record for it if it is new."""
+
+        if string is None:
+            return -1
+        string_id = self._string_ids.get(string)
+        if string_id is None:
+            string_id = self._string_ids[string] = len(self._string_ids)
+            encoded = string.encode()
+            self._buffer += _HEADER.pack(len(encoded), STRING)
+            self._buffer += encoded
+        return string_id
+
+    def record_event(self, location_id: int, command: Optional[str], item_name: Optional[str]) -> None:
+        """Record that an event at the location with id location_id, involving the item named item_name (if any),
+        was added to the log by command (None for the first event)."""
+
+        command_id = self._string_id(command)
+        item_id = self._string_id(item_name)
+        self._buffer += _HEADER.pack(_EVENT.size, EVENT)
+        self._buffer += _EVENT.pack(location_id, command_id, item_id,
+                                    0 if self.player is None else self.player.score)
+        self._added()
+
+    def record_undo(self) -> None:
+        """Record that the last event was removed from the log."""
+
+        self._buffer += _HEADER.pack(0, UNDO)
+        self._added()
+
+    def record_prompt(self, command: str) -> None:
+        """Record that command started a minigame prompt."""
+
+        self._record_text(PROMPT, command)
+
+    def record_answer(self, answer: str) -> None:
+        """Record that the player gave answer to the current minigame prompt."""
+
+        self._record_text(ANSWER, answer)
+
+    def _record_text(self, kind: int, text: str) -> None:
+        """Record a PROMPT or ANSWER record of the given text."""
+
+        text_id = self._string_id(text)
+        self._buffer += _HEADER.pack(_TEXT.size, kind)
+        self._buffer += _TEXT.pack(text_id)
+        self._added()
+
+    def _added(self) -> None:
+        """Commit the records written so far if they fill a group, or after every record with FSYNC_ALWAYS."""
+
+        self._pending += 1
+        if self._pending >= self.group_size or self.fsync == FSYNC_ALWAYS:
+            self.commit()
+
+    def end_turn(self) -> None:
+        """Commit the records of the turns played since the last commit, unless it was less than commit_delay
+        seconds ago.
+
+        Preconditions:
+            - this journal is not closed
+        """
+
+        if self._pending and time.monotonic() - self._last_commit >= self.commit_delay:
+            self.commit()
+
+    def commit(self) -> None:
+        """Write every record not written yet, and force them to disk unless self.fsync is FSYNC_NEVER.
+
+        Preconditions:
+            - this journal is not closed
+        """
+
+        with self._lock:
+            if self._buffer:
+                view = memoryview(self._buffer)
+                while view:
+                    view = view[os.write(self._fd, view):]
+                view.release()
+                self._buffer.clear()
+                if self.fsync != FSYNC_NEVER:
+                    os.fsync(self._fd)
+            self._pending = 0
+            self._last_commit = time.monotonic()
+
+    @property
+    def closed(self) -> bool:
+        """Whether this journal is closed."""
+        return self._fd == -1
+
+    def close(self) -> None:
+        """Commit the records not written yet and close the journal file. Closing it again does nothing."""
+
+        if self._fd != -1:
+            self.commit()
+            with self._lock:
+                os.close(self._fd)
+                self._fd = -1
+
+
+if __name__ == "__main__":
+    # When you are ready to check your work with python_ta, uncomment the following lines.
+    # (Delete the "#" and space before each line.)
+    # IMPORTANT: keep this code indented inside the "if __name__ == '__main__'" block
+    import python_ta
+    python_ta.check_all(config={
+        'max-line-length': 120,
+        'disable': ['R1705', 'E9998', 'E9999']
+    })
@@ -0,0 +1,902 @@
+"""CSC111 Project 1: Text Adventure Game - Game Engine
+
+Instructions (READ THIS FIRST!)
+===============================
+
+This Python module contains the game rules for Project 1. The whole game is played through the
+ step function, which applies one command to a GameState and returns what happened as a list of
+ OutputEvents, without reading input or printing. The command line game (adventure.py), the
+ simulator and any server all play the game through step.
+ Please consult the project handout for instructions and details.
+
+Copyright and Usage Information
+===============================
+
+This file is provided solely for the personal and private use of students
+taking CSC111 at the University of Toronto St. George campus. All forms of
+distribution of this code, whether as given or with any changes, are
+expressly prohibited. For more information on copyright for CSC111 materials,
+please consult our Course Syllabus.
+
+This file is Copyright (c) 2025 CSC111 Teaching Team
+"""
+from __future__ import annotations
+import functools
+from dataclasses import dataclass, field, replace
+from typing import Callable, Optional
+from adventure import AdventureGame
+from command_registry import ITEM, MENU, Command, CommandRegistry, normalize_command
+from command_trie import MIN_MATCH_LENGTH, CommandTrie, match_command
+from distance_index import UNREACHABLE
+from event_journal import EVENT, FSYNC_GROUP, UNDO, EventJournal, journal_seed, read_journal
+from game_entities import Item, Location, Player
+from instrumentation import (ANSWER, DISPATCH_PHASE, EVENT_PHASE, FAILED, LOG_PHASE, NO_TURN, VALIDATE_PHASE,
+                             Instrumentation, TurnTimer)
+from minigames import Prompt
+from proj1_event_logger import Event, EventList
+
+# The items the player needs to submit their work
+NECESSARY_ITEMS = ["laptop charger", "mug", "usb drive", "potion"]
+
+# The command that submits the work, and the command that gets the player teleported by Premier Ford
+SUBMIT_COMMAND = "put down items to submit work"
+TELEPORT_COMMAND = "ford, ford, teleport"
+
+# The command that gives the player extra moves, and the number of moves it gives
+HOTDOG_COMMAND = "buy hotdog"
+HOTDOG_MOVES = 5
+
+# The commands that start a minigame the player wins points for
+USB_DRIVE_COMMAND = "get usb drive"
+LAPTOP_CHARGER_COMMAND = "get laptop charger"
+
+# The kinds of output events
+MESSAGE = "message"  # text to show the player
+INVALID = "invalid"  # the command was not valid, and the game did not change
+PROMPT = "prompt"  # a question the next command must answer
+ITEM_DESCRIPTION = "item"  # the description of the item involved in the command
+LOCATION = "location"  # the new event: its location (location_id) and description
+END = "end"  # text shown when the game ends
+
+# The outcomes of a finished game
+QUIT = "quit"
+LOST = "lost"
+WON = "won"
+
+
+@dataclass
+class OutputEvent:
+    """Something the game shows the player as the result of a command.
+
+    Instance Attributes:
+        - kind: what kind of output this is (MESSAGE, INVALID, PROMPT, ITEM_DESCRIPTION, LOCATION or END)
+        - text: the text of this output
+        - location_id: the id of the location of a LOCATION event, None for every other kind
+    """
+
+    kind: str
+    text: str
+    location_id: Optional[int] = None
+
+
+@dataclass
+class GameState:
+    """Everything about one game being played.
+
+    Instance Attributes:
+        - game: the game being played
+        - player: the player playing the game
+        - log: the log of the game's events
+        - win_condition: the items the player needs to submit their work
+        - outcome: how the game ended (QUIT, LOST or WON), or None if it is still being played
+        - pending: the prompt the next command must answer, or None if the next command is a regular command
+        - puzzle_points: the points for winning a minigame
+        - special_points: the points for finding the secret location
+        - necessary_items_points: the points for each necessary item when the work is submitted
+        - instruments: the instrumentation recording the turns of this game, or None if they are not recorded
+        - winnable: whether the player could still win after the last turn, as far as still_winnable can tell
+
+    Representation Invariants:
+        - (self.outcome is None) == self.game.ongoing
+        - self.pending is None or self.outcome is None
+    """
+
+    # Private Instance Attributes:
+    #   - _pending_turn: the (command, command kind, item involved) of the command waiting for self.pending to be
+    #                    answered before its event is created
+    #   - _table_key: the (location id, location version, inventory version) _table was compiled for
+    #   - _table: the dispatch table of the current location
+    #   - _drop_trie: the inventory version and a trie of the player's drop options
+    #   - _history: a snapshot of the game and a copy of the player taken before each event after the first, in
+    #               order, that undo restores
+
+    game: AdventureGame
+    player: Player
+    log: EventList
+    win_condition: WinCondition
+    outcome: Optional[str] = None
+    pending: Optional[Prompt] = None
+    puzzle_points: int = 20
+    special_points: int = 30
+    necessary_items_points: int = 20
+    instruments: Optional[Instrumentation] = None
+    winnable: bool = True
+    _pending_turn: Optional[tuple[str, str, Optional[Item]]] = None
+    _table_key: tuple = ()
+    _table: dict[str, Command] = field(default_factory=dict)
+    _drop_trie: tuple[int, Optional[CommandTrie]] = (-1, None)
+    _history: list[tuple[tuple, Player]] = field(default_factory=list)
+
+    def dispatch_table(self) -> dict[str, Command]:
+        """Return the dispatch table of the current location, compiling it again only if the location, its
+        commands or items, or the player's inventory changed since it was last compiled."""
+
+        location = self.game.get_location()
+        key = (self.game.current_location_id, location.version, self.player.inventory_version)
+        if key != self._table_key:
+            self._table = commands.compile(location.available_commands, location.pick_up_options,
+                                           self.player.drop_options)
+            self._table_key = key
+        return self._table
+
+    def command(self, choice: str) -> Optional[Command]:
+        """Return the entry of choice (in the form normalize_command returns) in the dispatch table of the current
+        location, or None if it is not a valid command there.
+
+        Unlike dispatch_table, nothing is compiled: the location's available commands and pick up options and the
+        player's drop options are looked up directly, and the options are only built again after the location's
+        items or the player's inventory change.
+        """
+
+        location = self.game.get_location()
+        return commands.resolve(choice, location.available_commands, location.pick_up_options,
+                                self.player.drop_options)
+
+    def match(self, choice: str) -> Optional[str]:
+        """Return the valid command at the current location that choice (in the form normalize_command returns)
+        stands for: the only one starting with choice, or else the only one closest to choice within a few typos
+        (see command_trie.match_command), or None if there is none or more than one. "undo" and "quit" are only
+        taken when entered exactly, and a command that changes the game (a move, an item or a special event) only
+        when choice has at least MIN_MATCH_LENGTH characters.
+
+        The lookups take time proportional to the length of choice rather than to the number of valid commands:
+        the location keeps tries of its commands and pick up options, and the trie of the drop options is only
+        built again after the inventory changes.
+        """
+
+        if self._drop_trie[0] != self.player.inventory_version:
+            self._drop_trie = (self.player.inventory_version, CommandTrie(self.player.drop_options, MIN_MATCH_LENGTH))
+        return match_command(choice, (commands.menu_trie, *self.game.get_location().command_tries,
+                                      self._drop_trie[1]))
+
+    def clear_history(self) -> None:
+        """Forget the snapshots taken before each event, so that no event played so far can be undone."""
+
+        self._history.clear()
+
+    def copy(self) -> GameState:
+        """Return a copy of this state, with its own game, player and log (writing to no journal), that plays
+        exactly as this state would.
+
+        Preconditions:
+            - self.pending is None
+        """
+
+        return replace(self, game=self.game.copy(), player=self.player.copy(), log=self.log.copy(), _table_key=(),
+                       _table={}, _history=list(self._history))
+
+
+# ==================================================================
+# =================special event functions==========================
+
+
+def first_event_initializer(key_items: list[str], game_player: Player) -> Event:
+    """Initialize the first event."""
+
+    intro = ("The submission deadline is at 4PM. You promised your friend you would get it done, but you are missing "
+             "key, items: " + ', '.join(key_items) + "\nFind them before the deadline to save you grade and the project"
+                                                     "!\n")
+
+    command_intro = ("\nCOMMANDS:\nlook: to get a long description of your location\ninventory: to check items in your "
+                     "inventory\nscore: to check you game score\nundo: to go back to the last event (location change or"
+                     " item pick up/drop\nlog: to get game log\nquit: quit the game\n\nAt certain locations, you can "
+                     "pick up items. You will also be able to drop items.\n\nCertain locations will have special "
+                     "command options.\nMaximum number of moves (each command takes 1 move): "
+                     + str(game_player.moves_left))
+
+    first_event = Event(id_num=1, description=intro + command_intro)
+    return first_event
+
+
+class WinCondition:
+    """The items a player must have in their inventory to submit their work and win the game.
+
+    Instance Attributes:
+        - required_items: the names of the required items, without duplicates
+
+    Representation Invariants:
+        - len(set(self.required_items)) == len(self.required_items)
+    """
+
+    required_items: tuple[str, ...]
+
+    def __init__(self, required_items: list[str]) -> None:
+        """Initialize a new win condition requiring every item named in required_items."""
+
+        self.required_items = tuple(dict.fromkeys(required_items))
+
+    def is_met(self, game_player: Player) -> bool:
+        """Return whether game_player has every required item in their inventory."""
+
+        return all(game_player.has_item(name) for name in self.required_items)
+
+    def missing_items(self, game_player: Player) -> list[str]:
+        """Return the names of the required items that are not in game_player's inventory."""
+
+        return [name for name in self.required_items if not game_player.has_item(name)]
+
+
+def submit_work(game_player: Player, win_condition: WinCondition, out: list[OutputEvent]) -> bool:
+    """Return whether the player has all the items required by win_condition in their inventory."""
+
+    if not win_condition.is_met(game_player):
+        out.append(OutputEvent(MESSAGE, "You don't have everything you need to submit!"))
+
+        return False
+    return True
+
+
+class TeleportPrompt(Prompt):
+    """Premier Ford asking the player where to teleport them.
+
+    Instance Attributes:
+        - current_game: the game whose current location is changed
+        - target_id: the id of the location the player chose, or None if they have not chosen a valid one yet
+        - winnable_at: a function returning whether the player may still win after teleporting to the location with
+          the given id, or None if the chosen location is not checked
+    """
+
+    # Private Instance Attributes:
+    #   - _asked: whether the player has answered at least once
+
+    current_game: AdventureGame
+    target_id: Optional[int]
+    winnable_at: Optional[Callable[[int], bool]]
+    _asked: bool
+
+    def __init__(self, current_game: AdventureGame, winnable_at: Optional[Callable[[int], bool]] = None) -> None:
+        """Initialize a new teleport prompt for current_game, warning the player when winnable_at (if not None)
+        says they cannot win from the location they chose."""
+
+        super().__init__()
+        self.current_game = current_game
+        self.target_id = None
+        self.winnable_at = winnable_at
+        self._asked = False
+
+    def question(self) -> str:
+        """Ask for the id of a location."""
+
+        if not self._asked:
+            return "Hey Premier Ford! Teleport me to location... (Enter desired location id)"
+        return "Invalid Location id. Try again:"
+
+    def answer(self, text: str) -> list[str]:
+        """Teleport the player to the location with id text, if there is one."""
+
+        self._asked = True
+        try:
+            answer = int(text)
+        except ValueError:
+            return []
+
+        if not self.current_game.has_location(answer):
+            return []
+
+        self.target_id = answer
+        self.current_game.current_location_id = answer
+        self.finished = True
+        if self.winnable_at is not None and not self.winnable_at(answer):
+            return ["Premier Ford frowns: from there, you will never make it before the deadline."]
+        return []
+
+
+def ford_ford_teleport(current_game: AdventureGame, game_player: Player, points: int, out: list[OutputEvent],
+                       winnable_at: Optional[Callable[[int], bool]] = None) -> TeleportPrompt:
+    """Special function for Location 10: Queen's Park. Return the prompt teleporting the player to any location
+    they ask for, warning them if winnable_at (if not None) says they cannot win from there."""
+
+    out.append(OutputEvent(MESSAGE, "You unlocked the secret location! +" + str(points) + "points."))
+    game_player.score += points
+
+    for line in current_game.basic_locations():
+        out.append(OutputEvent(MESSAGE, line))
+
+    return TeleportPrompt(current_game, winnable_at)
+
+
+def talk_with_sadia(current_game: AdventureGame, location_id: int, command: str, command_id: int,
+                    out: list[OutputEvent]) -> None:
+    """Show message from Sadia."""
+    out.append(OutputEvent(MESSAGE, "Sadia tells you that she had found a left-behind charger after the morning "
+                                    "lecture and that she brought itto her office! She tells you go to second floor "
+                                    "Bahen to retrieve it."))
+
+    current_game.add_location_command(location_id, command, command_id)
+
+
+def buy_hotdog(current_game: AdventureGame, game_player: Player, game_loc_id: int, out: list[OutputEvent]) -> None:
+    """Special event for buying hotdog"""
+
+    out.append(OutputEvent(MESSAGE, f"You rushed to the hotdog station and took a free hotdog! It gives you "
+                                    f"{HOTDOG_MOVES} extra moves!"))
+    current_game.remove_location_command(game_loc_id, HOTDOG_COMMAND)
+    game_player.moves_left += HOTDOG_MOVES
+
+
+def buy_potion(current_game: AdventureGame, game_player: Player, out: list[OutputEvent]) -> None:
+    """Special event for buying potion"""
+
+    out.append(OutputEvent(MESSAGE, "You are desperately looking for something useful at T&T, and suddenly you came "
+                                    "across a special desk sellingrepairing potion - that might be helpful! There's a "
+                                    "line up in front of the desk and there is only a few left. 'Please be quick....' "
+                                    "you thought. Finally it's your turn and you managed to take the last bottle of "
+                                    "potion!"))
+
+    current_game.remove_location_command(11, "buy potion")
+    game_player.add_inventory_item(current_game.get_item("potion"))
+
+
+def get_usb_drive(current_game: AdventureGame, game_player: Player, location_id: int,
+                  win_points: int, out: list[OutputEvent]) -> Optional[Prompt]:
+    """Put the USB drive in the friend's dorm and return the minigame the player plays for it, if they have the key
+    in their inventory. Return None otherwise."""
+
+    if game_player.has_item("key"):
+        out.append(OutputEvent(MESSAGE, "You unlock your friend's door and step inside."))
+        current_game.get_location(location_id).add_item(current_game.get_item("usb drive"))
+        current_game.remove_location_command(location_id, USB_DRIVE_COMMAND)
+        return current_game.lying_backpacks_game(game_player, "usb drive", win_points)
+    else:
+        out.append(OutputEvent(MESSAGE, "You can't enter your friend's dorm without his key!"))
+        return None
+
+
+def get_laptop_charger(current_game: AdventureGame, game_player: Player, location_id: int,
+                       win_points: int, out: list[OutputEvent]) -> Prompt:
+    """Put the laptop charger in Sadia's office and return the puzzle the player solves for it."""
+
+    out.append(OutputEvent(MESSAGE, "You pushed the door and go inside the office. There are three magic drawers."))
+
+    current_game.get_location(location_id).add_item(current_game.get_item("laptop charger"))
+    current_game.remove_location_command(location_id, LAPTOP_CHARGER_COMMAND)
+    return current_game.shuffling_drawers_game(game_player, "laptop charger", win_points)
+
+# ==================================================================
+# =================function for menu commands============================
+
+
+def undo(state: GameState, out: list[OutputEvent]) -> None:
+    """Remove the last event, putting the game and the player back in the state they were in before it (apart
+    from the moves the player has left, which are not given back)."""
+
+    last_event = state.log.last
+    if last_event is state.log.first:
+        last_loc = state.game.get_location(last_event.id_num)
+        out.append(OutputEvent(MESSAGE, "You cannot undo the first event."))
+        out.append(OutputEvent(MESSAGE, f"You are back at Location {last_loc.id_num}: {last_loc.name}"))
+    else:
+        game_snapshot, player_snapshot = state._history.pop()
+        moves_left = state.player.moves_left
+        state.game.restore(game_snapshot)
+        state.player.restore(player_snapshot)
+        state.player.moves_left = moves_left
+        state.log.remove_last_event()
+
+        location = state.game.get_location()
+        item = last_event.item_involved
+        if item is not None and state.player.has_item(item.name):
+            out.append(OutputEvent(MESSAGE, f"{item.name} from Location {location.id_num}: {location.name} is back "
+                                            f"in your inventory."))
+        elif item is not None and location.get_item(item.name) is not None:
+            out.append(OutputEvent(MESSAGE, f"{item.name} is back at Location {location.id_num}: {location.name}"))
+        else:
+            out.append(OutputEvent(MESSAGE, f"You are back at Location {location.id_num}: {location.name}"))
+
+    out.append(OutputEvent(MESSAGE, state.player.inventory_to_string()))
+
+
+def pick_up(new_item: Item, current_location: Location, p: Player) -> None:
+    """Add new_item to p's inventory and remove it from current_location"""
+
+    p.add_inventory_item(new_item)
+    current_location.remove_item(new_item)
+
+
+def drop(drop_item: Item, current_location: Location, p: Player) -> None:
+    """Remove new_item from p_inventory and add it from current_location"""
+
+    p.remove_inventory_item(drop_item)
+    current_location.add_item(drop_item)
+
+# ==================================================================
+# =================command handlers=================================
+
+
+def _move(state: GameState, choice: str, out: list[OutputEvent]) -> None:
+    """Go to the location the available command choice leads to."""
+
+    state.game.current_location_id = state.game.get_location().available_commands[choice]
+    out.append(OutputEvent(MESSAGE, f"You decided to: {choice}."))
+
+
+def _pick_up(state: GameState, choice: str, _out: list[OutputEvent]) -> Item:
+    """Pick up the item named in the "pick up: <item>" command choice."""
+
+    item = state.game.get_item(choice[choice.find(": ") + 2:])
+    pick_up(item, state.game.get_location(), state.player)
+    return item
+
+
+def _drop(state: GameState, choice: str, _out: list[OutputEvent]) -> Item:
+    """Drop the item named in the "drop: <item>" command choice."""
+
+    item = state.game.get_item(choice[choice.find(": ") + 2:])
+    drop(item, state.game.get_location(), state.player)
+    return item
+
+
+commands = CommandRegistry(_move, _pick_up, _drop)
+
+
+@commands.menu("look")
+def _look(state: GameState, _choice: str, out: list[OutputEvent]) -> None:
+    """Show the long description of the current location."""
+    out.append(OutputEvent(MESSAGE, state.game.get_location().descriptions[1]))
+
+
+@commands.menu("inventory")
+def _inventory(state: GameState, _choice: str, out: list[OutputEvent]) -> None:
+    """Show the player's inventory."""
+    out.append(OutputEvent(MESSAGE, state.player.inventory_to_string()))
+
+
+@commands.menu("score")
+def _score(state: GameState, _choice: str, out: list[OutputEvent]) -> None:
+    """Show the player's score."""
+    out.append(OutputEvent(MESSAGE, str(state.player.score)))
+
+
+@commands.menu("undo", exact_only=True)
+def _undo(state: GameState, _choice: str, out: list[OutputEvent]) -> None:
+    """Undo the last event."""
+    undo(state, out)
+
+
+@commands.menu("log")
+def _log(state: GameState, _choice: str, out: list[OutputEvent]) -> None:
+    """Show every event of the game so far."""
+
+    event_lst = state.log.display_events()
+    for i in range(len(event_lst) - 1):
+        loc_id = event_lst[i][0]
+        out.append(OutputEvent(MESSAGE, f"Location: {state.game.get_location(loc_id).name} (id: {loc_id}), you chose "
+                                        f"to {event_lst[i][1]}"))
+    out.append(OutputEvent(MESSAGE, f"You are currently at Location {event_lst[-1][0]}: "
+                                    f"{state.game.get_location(event_lst[-1][0]).name}"))
+
+
+@commands.menu("quit", exact_only=True)
+def _quit(state: GameState, _choice: str, out: list[OutputEvent]) -> None:
+    """End the game without winning."""
+    state.game.ongoing = False
+    state.outcome = QUIT
+    out.append(OutputEvent(END, "Thanks for playing!"))
+
+
+@commands.special("talk to sadia")
+def _talk_to_sadia(state: GameState, _choice: str, out: list[OutputEvent]) -> None:
+    """Talk with Sadia on Front Campus, which opens the way to her office."""
+    talk_with_sadia(current_game=state.game, location_id=3, command="go upstairs", command_id=30, out=out)
+    state.game.remove_location_command(location_id=8, command="talk to sadia")
+
+
+@commands.special(USB_DRIVE_COMMAND)
+def _get_usb_drive(state: GameState, _choice: str, out: list[OutputEvent]) -> None:
+    """Try to get the USB drive from the friend's dorm."""
+    state.pending = get_usb_drive(state.game, state.player, 70, state.puzzle_points, out)
+
+
+@commands.special(LAPTOP_CHARGER_COMMAND)
+def _get_laptop_charger(state: GameState, _choice: str, out: list[OutputEvent]) -> None:
+    """Play for the laptop charger in Sadia's office."""
+    state.pending = get_laptop_charger(state.game, state.player, 30, state.puzzle_points, out)
+
+
+@commands.special(HOTDOG_COMMAND)
+def _buy_hotdog(state: GameState, _choice: str, out: list[OutputEvent]) -> Optional[Item]:
+    """Buy a hotdog on St. George Street."""
+    buy_hotdog(state.game, state.player, 4, out)
+    return state.game.get_item("hotdog")
+
+
+@commands.special("buy potion")
+def _buy_potion(state: GameState, _choice: str, out: list[OutputEvent]) -> Optional[Item]:
+    """Buy the repairing potion at T&T."""
+    buy_potion(state.game, state.player, out)
+    return state.game.get_item("potion")
+
+
+@commands.special(TELEPORT_COMMAND)
+def _teleport(state: GameState, _choice: str, out: list[OutputEvent]) -> None:
+    """Get teleported by Premier Ford."""
+    state.pending = ford_ford_teleport(state.game, state.player, state.special_points, out,
+                                       functools.partial(_winnable_after_teleport, state))
+
+
+def _winnable_after_teleport(state: GameState, location_id: int) -> bool:
+    """Return whether the player of state may still win once teleported to the location with id location_id,
+    which takes the move of the teleport, and keep the answer in state.winnable so that the end of the turn does
+    not warn the player again."""
+
+    state.winnable = still_winnable(state, location_id, state.player.moves_left - 1)
+    return state.winnable
+
+
+@commands.special(SUBMIT_COMMAND)
+def _submit(state: GameState, _choice: str, out: list[OutputEvent]) -> None:
+    """Submit the work, winning the game if the player has every item they need."""
+    if submit_work(state.player, state.win_condition, out):
+        state.game.ongoing = False
+
+
+@commands.special("get on the streetcar")
+def _get_on_streetcar(state: GameState, choice: str, out: list[OutputEvent]) -> None:
+    """Board the streetcar to T&T, which needs a PRESTO card."""
+    if not state.player.has_item("presto card"):
+        out.append(OutputEvent(MESSAGE, "You are not allowed to board a streetcar without a PRESTO card!"))
+    else:
+        _move(state, choice, out)
+
+# ==================================================================
+# =========================the engine===============================
+
+
+def new_game(game_data_file: str = 'game_data.json', initial_location_id: int = 1,
+             unlock_location_points: int = 10, necessary_items: Optional[list[str]] = None,
+             journal: Optional[EventJournal] = None, seed: Optional[int] = None,
+             instruments: Optional[Instrumentation] = None) -> tuple[GameState, list[OutputEvent]]:
+    """Return a new game loaded from game_data_file, starting at the location with id initial_location_id, and the
+    output introducing it. The game's minigames are played with a random number generator seeded with seed (see
+    AdventureGame). If journal is not None, every event of the game, and every minigame prompt and answer, is
+    written to it, and the game is seeded with the journal's seed; the first event is committed like the end of a
+    turn (see EventJournal.end_turn). If instruments is not None, every turn of the game is recorded by it (see
+    step).
+
+    Raise ValueError if journal and seed are both not None and seed is not the journal's seed.
+
+    Preconditions:
+        - game_data_file is the filename of a valid game data JSON file
+    """
+
+    if necessary_items is None:
+        necessary_items = NECESSARY_ITEMS
+    if journal is not None:
+        if seed is not None and seed != journal.seed:
+            raise ValueError(f"{journal.filename} is the journal of a game with another seed")
+        seed = journal.seed
+
+    state = GameState(AdventureGame(game_data_file, initial_location_id, unlock_location_points, seed), Player(),
+                      EventList(journal), WinCondition(necessary_items), instruments=instruments)
+    if journal is not None:
+        journal.player = state.player
+    state.log.add_event(first_event_initializer(necessary_items, state.player))
+    if journal is not None:
+        journal.end_turn()
+
+    first_location = state.game.get_location()
+    return state, [OutputEvent(MESSAGE, f"Game Start! \nLocation {first_location.id_num}: {first_location.name}"),
+                   OutputEvent(MESSAGE, state.log.last.description)]
+
+
+def recover_game(journal_file: str, game_data_file: str = 'game_data.json', initial_location_id: int = 1,
+                 unlock_location_points: int = 10, necessary_items: Optional[list[str]] = None,
+                 fsync: str = FSYNC_GROUP) -> GameState:
+    """Return the game written to journal_file, by playing it again from the seed of the journal: its commands,
+    the answers to its minigame prompts and its undos, in the order they were played. Unless the game is over, its
+    log writes to journal_file again so that it can be continued. A new journal (see journal_seed) holds a game
+    that has not started yet: a new game writing to it is returned.
+
+    Raise ValueError if playing the journal again does not lead, after every event, to the location and score
+    written with it.
+
+    >>> import os
+    >>> import tempfile
+    >>> filename = os.path.join(tempfile.mkdtemp(), 'game.journal')
+    >>> state, _ = new_game(journal=EventJournal(filename))
+    >>> for command in ["go east", "go upstairs", "pick up: key", "undo", "pick up: key", "go downstairs",
+    ...                 "go east", "go east", "talk to sadia", "go north", "go to dorm", "get usb drive"]:
+    ...     _ = step(state, command)
+    >>> state.log.journal = None  # the process playing state dies here, without closing the journal
+    >>> recovered = recover_game(filename)
+    >>> recovered.game.state_key() == state.game.state_key() and recovered.player == state.player
+    True
+    >>> recovered.log.get_id_log() == state.log.get_id_log() and recovered.pending is not None
+    True
+    >>> step(recovered, "2")[1] == step(state, "2")[1]  # the minigame draws the same random numbers
+    True
+    >>> recovered.log.journal.close()
+
+    Preconditions:
+        - game_data_file is the filename of a valid game data JSON file
+        - journal_file is the name of a journal of a game started with the same arguments
+    """
+
+    records = read_journal(journal_file)
+    if not records:
+        return new_game(game_data_file, initial_location_id, unlock_location_points, necessary_items,
+                        journal=EventJournal(journal_file, fsync=fsync))[0]
+
+    state, _ = new_game(game_data_file, initial_location_id, unlock_location_points, necessary_items,
+                        seed=journal_seed(journal_file))
+    mismatch = ValueError(f"{journal_file} is not the journal of a game of {game_data_file}")
+    if records[0].kind != EVENT or records[0].location_id != state.game.current_location_id:
+        raise mismatch
+
+    win_points = len(state.win_condition.required_items) * state.necessary_items_points
+    events = 1  # the number of events in the log once the records read so far are played
+    for record in records[1:]:
+        out = []
+        if record.kind == UNDO:
+            events -= 1
+            _, out = step(state, "undo")
+        elif record.kind != EVENT:
+            _, out = step(state, record.command)
+        else:
+            events += 1
+            if len(state.log) < events:  # else the answer to its prompt created the event
+                _, out = step(state, record.command)
+            bonus = win_points if state.outcome == WON else 0
+            if (len(state.log) != events or state.game.current_location_id != record.location_id
+                    or state.player.score != record.score + bonus):
+                raise mismatch
+        if out and out[-1].kind == INVALID:
+            raise mismatch
+
+    if state.outcome is None:
+        state.log.journal = EventJournal(journal_file, fsync=fsync, player=state.player)
+    return state
+
+
+def available_actions(state: GameState) -> list[str]:
+    """Return the commands the player can enter at the current location besides the menu commands: its available
+    commands, then its items to pick up, then the items in the inventory to drop."""
+
+    return [action for action, command in state.dispatch_table().items() if command.kind != MENU]
+
+
+def moves_at_least(game: AdventureGame, source_id: int, target_id: int, teleport_ids: list[int]) -> int:
+    """Return a number of moves that getting from the location with id source_id to the one with id target_id
+    takes at least, walking or teleporting from a location in teleport_ids. Return 0 if target_id cannot be reached
+    with the current commands, since a special event may still open the way."""
+
+    bounds = [game.moves_at_least(source_id, target_id)]
+    for teleport_id in teleport_ids:
+        to_teleport = game.moves_at_least(source_id, teleport_id)
+        if to_teleport != UNREACHABLE:
+            bounds.append(to_teleport + 1)
+    reachable = [bound for bound in bounds if bound != UNREACHABLE]
+    return min(reachable) if reachable else 0
+
+
+def still_winnable(state: GameState, location_id: Optional[int] = None, moves_left: Optional[int] = None) -> bool:
+    """Return whether the player of state may still win from the location with id location_id (the current
+    location if None) with moves_left moves left (the moves the player has left if None).
+
+    Every missing item takes at least one move to get, one lying at a location takes at least the moves to get
+    there and then to a location where the work can be submitted, and submitting takes one more move. Anything
+    the current commands cannot reach is assumed reachable (a special event may still open the way), so False
+    means the game certainly cannot be won.
+
+    Nothing here goes through every location: the submit and teleport locations are found once per world (see
+    AdventureGame.command_location_ids), and each bound is a DistanceIndex.lower_bound query. With more moves left
+    than any bound can add up to, the answer is True without a single query.
+
+    Preconditions:
+        - location_id is None or state.game.has_location(location_id)
+    """
+
+    if state.outcome is not None:
+        return state.outcome == WON
+
+    game = state.game
+    location_id = game.current_location_id if location_id is None else location_id
+    moves_left = state.player.moves_left if moves_left is None else moves_left
+    missing = state.win_condition.missing_items(state.player)
+    if moves_left >= len(missing) + 1 + 2 * len(game):  # no bound (teleporting included) exceeds len(game)
+        return True
+
+    submit_ids, teleport_ids = game.command_location_ids(SUBMIT_COMMAND), game.command_location_ids(TELEPORT_COMMAND)
+
+    def to_submit(source_id: int) -> int:
+        """Return a number of moves getting from source_id to where the work can be submitted takes at least."""
+        return min((moves_at_least(game, source_id, submit_id, teleport_ids) for submit_id in submit_ids), default=0)
+
+    needed = to_submit(location_id)
+    for item_name in missing:
+        item_location = game.item_location(item_name)
+        if item_location is not None:
+            needed = max(needed, moves_at_least(game, location_id, item_location, teleport_ids)
+                         + to_submit(item_location))
+
+    return len(missing) + 1 + needed <= moves_left
+
+
+def step(state: GameState, command: str) -> tuple[GameState, list[OutputEvent]]:
+    """Play command in the game of state and return state and what the game shows the player as a result.
+
+    state is updated in place. If state is waiting for an answer to a prompt (state.pending), command is the
+    answer. A regular command that is not valid as entered is taken as the valid command it is a unique prefix
+    or a near-miss typo of (see GameState.match), if any, with a MESSAGE event saying so first. An invalid command
+    returns a single INVALID event and leaves state unchanged. If the game has instrumentation (state.instruments),
+    the turn and each of its phases are timed, and a turn that raises is still ended (as a FAILED turn). If the
+    game's log writes to a journal, the journal is committed at the end of the turn (see EventJournal.end_turn),
+    and closed when the game is over.
+    """
+
+    out = []
+    turn = NO_TURN if state.instruments is None else state.instruments.start_turn()
+    kind = FAILED
+    try:
+        kind = _play(state, command, out, turn)
+    finally:
+        turn.end(kind)
+
+    journal = state.log.journal
+    if journal is not None and not journal.closed:
+        if state.outcome is None:
+            journal.end_turn()
+        else:
+            journal.close()
+    return state, out
+
+
+def _play(state: GameState, command: str, out: list[OutputEvent], turn: TurnTimer) -> str:
+    """Play command in the game of state (see step), appending what the game shows the player to out, and return
+    the kind of the turn. The phases of the turn are timed by turn."""
+
+    if state.outcome is not None:
+        out.append(OutputEvent(INVALID, "The game is over."))
+        return INVALID
+
+    if state.pending is not None:
+        _answer_prompt(state, command, out, turn)
+        return ANSWER
+
+    choice = normalize_command(command)
+    entry = state.command(choice)
+    if entry is None:
+        match = state.match(choice)
+        if match is not None:
+            out.append(OutputEvent(MESSAGE, f"(Taking that as: {match})"))
+            choice, entry = match, state.command(match)
+    turn.mark(VALIDATE_PHASE)
+    if entry is None:
+        out.append(OutputEvent(INVALID, "That was an invalid option; try again."))
+        return INVALID
+
+    if entry.kind != MENU:
+        state._history.append((state.game.snapshot(), state.player.copy()))
+    item_involved = entry.handler(state, choice, out)
+    turn.mark(DISPATCH_PHASE)
+
+    if entry.kind == MENU:
+        return MENU
+
+    if state.pending is not None:
+        state._pending_turn = (choice, entry.kind, item_involved)
+        if state.log.journal is not None:
+            state.log.journal.record_prompt(choice)
+        for message in state.pending.start():
+            out.append(OutputEvent(MESSAGE, message))
+        out.append(OutputEvent(PROMPT, state.pending.question()))
+        return entry.kind
+
+    _finish_turn(state, choice, entry.kind, item_involved, out, turn)
+    return entry.kind
+
+
+def _answer_prompt(state: GameState, answer: str, out: list[OutputEvent], turn: TurnTimer) -> None:
+    """Answer the pending prompt of state, and finish the turn of the command that asked it if the prompt needs
+    no more answers. The phases of the turn are timed by turn."""
+
+    prompt = state.pending
+    if state.log.journal is not None:
+        state.log.journal.record_answer(answer.strip())
+    for message in prompt.answer(answer.strip()):
+        out.append(OutputEvent(MESSAGE, message))
+    turn.mark(DISPATCH_PHASE)
+
+    if not prompt.finished:
+        out.append(OutputEvent(PROMPT, prompt.question()))
+        return
+
+    state.pending = None
+    choice, kind, item_involved = state._pending_turn
+    state._pending_turn = None
+    _finish_turn(state, choice, kind, item_involved, out, turn)
+
+
+def _finish_turn(state: GameState, choice: str, kind: str, item_involved: Optional[Item],
+                 out: list[OutputEvent], turn: TurnTimer) -> None:
+    """Create the event of the (non-menu) command choice, take one move from the player and end the game if it was
+    won or the player ran out of moves, or else warn the player once they certainly cannot win any more (see
+    still_winnable). The phases of the turn are timed by turn."""
+
+    game, player = state.game, state.player
+
+    if item_involved:
+        out.append(OutputEvent(ITEM_DESCRIPTION, item_involved.description))
+
+    # create the next event
+    next_location = game.get_location()
+
+    if not item_involved:  # if location changed
+        if next_location.visited:
+            event_description = next_location.descriptions[0]
+        else:
+            event_description = next_location.descriptions[1]
+            next_location.visited = True
+            player.score += game.unlock_location_points
+    else:
+        if kind == ITEM:
+            event_description = choice
+        else:
+            event_description = f"Completed special event '{choice}'"
+
+    new_event = Event(id_num=next_location.id_num, description=event_description, item_involved=item_involved,
+                      score=player.score)
+    turn.mark(EVENT_PHASE)
+    state.log.add_event(new_event, choice)
+    turn.mark(LOG_PHASE)
+    out.append(OutputEvent(LOCATION, event_description, next_location.id_num))
+
+    # minus the player's moves left by 1
+    player.moves_left -= 1
+
+    if not game.ongoing:
+        state.outcome = WON
+        player.score += len(state.win_condition.required_items) * state.necessary_items_points
+        new_event.score = player.score
+        out.append(OutputEvent(END, "You open your laptop, plug the charger in as well as the USB drive and begin "
+                                    "uploading your files.After a while, your project is only 30% uploaded. You "
+                                    "glance at the clock: 3:50 PM! In the remaining 10 minutes, you frantically use "
+                                    "Reparo! on to fix your mug, wishing for luck. And it works! Your project is "
+                                    "ready! You promptly hit 'submit' at exactly 3:59 PM and let out a long sigh of "
+                                    "relief. Your grade is saved and your friendship is preserved. Great Work!"))
+        out.append(OutputEvent(END, "YOU SUCCESSFULLY COMPLETED THE GAME. Final score: " + str(player.score)))
+
+    elif player.moves_left == 0:
+        state.outcome = LOST
+        game.ongoing = False
+        out.append(OutputEvent(END, "\nYou ran out of moves. It's 4 PM and you missed the deadline. What will you "
+                                    "tell your friend..."))
+        out.append(OutputEvent(END, "GAME OVER."))
+
+    else:
+        winnable = still_winnable(state)
+        if state.winnable and not winnable:
+            out.append(OutputEvent(MESSAGE, "You glance at the clock: with the moves you have left, you can no "
+                                            "longer get everything and submit before 4 PM."))
+        state.winnable = winnable
+
+
+if __name__ == "__main__":
+    # When you are ready to check your work with python_ta, uncomment the following lines.
+    # (Delete the "#" and space before each line.)
+    # IMPORTANT: keep this code indented inside the "if __name__ == '__main__'" block
+    import python_ta
+    python_ta.check_all(config={
+        'max-line-length': 120,
+        'disable': ['R1705', 'E9998', 'E9999']
+    })
@@ -18,25 +18,47 @@ please consult our Course Syllabus.
 
 This file is Copyright (c) 2025 CSC111 Teaching Team
 """
-from dataclasses import dataclass
+from __future__ import annotations
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+from types import MappingProxyType
 from typing import Optional
 
+# The prefixes of the commands picking up and dropping an item, followed by the item's name
+PICK_UP_PREFIX = "pick up: "
+DROP_PREFIX = "drop: "
 
-@dataclass
+
+def item_options(prefix: str, items: Iterable[Item]) -> Mapping[str, Item]:
+    """Return a read-only mapping from prefix followed by the name of each item of items to that item, in order.
+
+    >>> key = Item("key", "The key to open door", (2, 70))
+    >>> dict(item_options(DROP_PREFIX, [key])) == {"drop: key": key}
+    True
+    """
+
+    return MappingProxyType({prefix + item.name: item for item in items})
+
+
+@dataclass(slots=True)
 class Item:
     """An item in our text adventure game world.
 
+    Items are part of a world's definition, which every game of the world shares, so an Item is never changed
+    once its world is loaded. Where an item lies during a game is kept by the game's session (see
+    game_world.SessionState, whose invariants cover it).
+
     Instance Attributes:
         - name: name of the item
-        - position: current position of the item
+        - position: the position the item starts at in every game (the same as start_position)
         - enabled: whether the item is still useful
         - start_position: the starting position/location of the item
         - target_position: the target position/location of the item
-        - target_points: the points earned when depositing item at target position
 
     Representation Invariants:
-        - self.position, self.start_position and self.target_position are valid location ids.
-        - self.target_points > 0
+        - self.position == self.start_position
+        - self.start_position is a valid location id
+        - self.target_position is None, 0 (no target) or a valid location id
     """
 
     # NOTES:
@@ -66,7 +88,7 @@ class Item:
         self.enabled = True
 
 
-@dataclass
+@dataclass(slots=True)
 class Location:
     """A location in our text adventure game world.
 
@@ -76,7 +98,8 @@ class Location:
                         first value is a brief description and whose second value is a long description
         - available_commands: a mapping of available commands at this location to
                               the location executing that command would lead to
-        - items: a list of available items at this location
+        - items: a tuple of the items at this location, in the order they were added. It is read-only: use add_item
+                 and remove_item, or assign a new list, to change the items at this location.
         - visited: whether the player has visited this location (for displaying description)
 
     Representation Invariants:
@@ -85,12 +108,20 @@ class Location:
         - values in self.available_commands are valid location ids.
     """
 
+    # Private Instance Attributes:
+    #   - _items: a mapping from item name to the items at this location, in the order they were added.
+    #             self.items is built from it, so that items can be found and removed by name in O(1).
+    #   - _version: a counter increased every time the items at this location change
+    #   - _pick_up_options: the version the cached pick_up_options were built for, and the options
+
     id_num: int
     name: str
     descriptions: tuple[str, str]
     available_commands: dict[str, int]
-    items: list[Item]
+    _items: dict[str, Item]
     visited: bool
+    _version: int = field(repr=False, compare=False)
+    _pick_up_options: tuple[int, Mapping[str, Item]] = field(repr=False, compare=False)
 
     def __init__(self, id_and_name: tuple[int, str], descriptions: tuple[str, str],
                  available_commands: dict[str, int], items: list[Item]) -> None:
@@ -100,41 +131,84 @@ class Location:
         self.name = id_and_name[1]
         self.descriptions = descriptions
         self.available_commands = available_commands
+        self._version = 0
+        self._pick_up_options = (-1, MappingProxyType({}))
         self.items = items
         self.visited = False
 
+    @property
+    def items(self) -> tuple[Item, ...]:
+        """A tuple of the items at this location, in the order they were added.
+
+        The tuple cannot be changed: use add_item and remove_item to change the items at this location.
+        """
+        return tuple(self._items.values())
+
+    @items.setter
+    def items(self, items: list[Item]) -> None:
+        """Replace the items at this location with the given items."""
+        self._items = {item.name: item for item in items}
+        self._version += 1
+
+    @property
+    def version(self) -> int:
+        """A number that changes every time the items at this location change."""
+        return self._version
+
+    @property
+    def pick_up_options(self) -> Mapping[str, Item]:
+        """A read-only mapping from the "pick up: <item>" command of every item at this location to the item, in the
+        order the items were added. It is only built again after the items at this location change.
+
+        >>> loc = Location((2, "Sidney Smith Hall"), ("brief", "long"), {"go west": 1}, [])
+        >>> loc.add_item(Item("key", "The key to open door", (2, 70)))
+        >>> list(loc.pick_up_options)
+        ['pick up: key']
+        >>> loc.pick_up_options is loc.pick_up_options
+        True
+        """
+
+        if self._pick_up_options[0] != self._version:
+            self._pick_up_options = (self._version, item_options(PICK_UP_PREFIX, self._items.values()))
+        return self._pick_up_options[1]
+
     def add_item(self, item: Item) -> None:
         """Add a new item to self.items"""
 
-        self.items.append(item)
+        self._items[item.name] = item
+        self._version += 1
 
     def remove_item(self, item: Item) -> None:
         """Remove given item of value item from self's items attributes.
 
         Preconditions:
         - item in self.items
+
+        >>> key = Item("key", "The key to open door", (2, 70))
+        >>> mug = Item("mug", "Your lucky mug", (9, 1))
+        >>> loc = Location((2, "Sidney Smith Hall"), ("brief", "long"), {"go west": 1}, [key, mug])
+        >>> loc.remove_item(key)
+        >>> loc.add_item(key)
+        >>> [item.name for item in loc.items]
+        ['mug', 'key']
         """
 
-        for i in range(len(self.items)):
-            if self.items[i].name == item.name:
-                self.items.pop(i)
+        del self._items[item.name]
+        self._version += 1
 
     def get_item(self, name: str) -> Optional[Item]:
         """Return the Item with name as its name. If none, return None."""
 
-        for i in range(len(self.items)):
-            if self.items[i].name == name:
-                return self.items[i]
-
-        return None
+        return self._items.get(name)
 
 
-@dataclass
+@dataclass(slots=True)
 class Player:
     """A player in the text adventure game world.
 
     Instance Attributes:
-        - inventory: the player's inventory
+        - inventory: a tuple of the items in the player's inventory, in the order they were added. It is read-only:
+                     use add_inventory_item and remove_inventory_item, or assign a new list, to change the inventory.
         - score: score of the player
         - moves_left: number of moves the player has left
 
@@ -144,26 +218,75 @@ class Player:
         - self.moves_left >= 0
     """
 
-    inventory: list[Item]
+    # Private Instance Attributes:
+    #   - _inventory: a mapping from item name to the items in the inventory, in the order they were added.
+    #                 self.inventory is built from it, so that items can be found and removed, and membership
+    #                 checked, by name in O(1).
+    #   - _inventory_version: a counter increased every time the inventory changes
+    #   - _drop_options: the inventory version the cached drop_options were built for, and the options
+
+    _inventory: dict[str, Item]
     score: int
     moves_left: int
+    _inventory_version: int = field(repr=False, compare=False)
+    _drop_options: tuple[int, Mapping[str, Item]] = field(repr=False, compare=False)
 
     def __init__(self) -> None:
         """Initialize a new player. The player starts with an empty inventory, score and 50 moves.
 
         >>> p = Player()
         >>> p.inventory
-        []
+        ()
         >>> p.score
         0
         >>> p.moves_left
         50
         """
 
-        self.inventory = []
+        self._inventory = {}
+        self._inventory_version = 0
+        self._drop_options = (-1, MappingProxyType({}))
         self.score = 0
         self.moves_left = 50
 
+    @property
+    def inventory(self) -> tuple[Item, ...]:
+        """A tuple of the items in the player's inventory, in the order they were added.
+
+        The tuple cannot be changed: use add_inventory_item and remove_inventory_item to change the inventory.
+
+        >>> Player().inventory.append(Item("key", "The key to open door", (0, 19)))
+        Traceback (most recent call last):
+        AttributeError: 'tuple' object has no attribute 'append'
+        """
+        return tuple(self._inventory.values())
+
+    @inventory.setter
+    def inventory(self, items: list[Item]) -> None:
+        """Replace the player's inventory with the given items."""
+        self._inventory = {item.name: item for item in items}
+        self._inventory_version += 1
+
+    @property
+    def inventory_version(self) -> int:
+        """A number that changes every time the player's inventory changes."""
+        return self._inventory_version
+
+    @property
+    def drop_options(self) -> Mapping[str, Item]:
+        """A read-only mapping from the "drop: <item>" command of every item in the inventory to the item, in the
+        order the items were added. It is only built again after the inventory changes.
+
+        >>> p = Player()
+        >>> p.add_inventory_item(Item("key", "The key to open door", (0, 19)))
+        >>> "drop: key" in p.drop_options, "drop: mug" in p.drop_options
+        (True, False)
+        """
+
+        if self._drop_options[0] != self._inventory_version:
+            self._drop_options = (self._inventory_version, item_options(DROP_PREFIX, self._inventory.values()))
+        return self._drop_options[1]
+
     def inventory_to_string(self) -> str:
         """List all items in inventory in a readable format
 
@@ -176,21 +299,36 @@ class Player:
         """
 
         str_inventory = "Your inventory: "
-        if not self.inventory:
+        if not self._inventory:
             str_inventory += "empty"
         else:
-            str_inventory += ", ".join(item.name for item in self.inventory)
+            str_inventory += ", ".join(self._inventory)
 
         return str_inventory
 
+    def add_inventory_item(self, item: Item) -> None:
+        """Add the given item to the end of self's inventory."""
+
+        self._inventory[item.name] = item
+        self._inventory_version += 1
+
+    def has_item(self, item_name: str) -> bool:
+        """Return whether the item named item_name is in self's inventory.
+
+        >>> p = Player()
+        >>> p.add_inventory_item(Item("keyboard", "A keyboard", (0, 19)))
+        >>> p.has_item("keyboard")
+        True
+        >>> p.has_item("key")
+        False
+        """
+
+        return item_name in self._inventory
+
     def get_inventory_item(self, item_name: str) -> Optional[Item]:
         """Return Item in self.inventory associated with item_name. Return None if none."""
 
-        for i in range(len(self.inventory)):
-            if self.inventory[i].name == item_name:
-
-                return self.inventory[i]
-        return None
+        return self._inventory.get(item_name)
 
     def remove_inventory_item(self, item: Item) -> None:
         """Remove given item of value item from self's items attributes.
@@ -199,9 +337,43 @@ class Player:
         - item in self.inventory
         """
 
-        for i in range(len(self.inventory)):
-            if self.inventory[i].name == item.name:
-                self.inventory.pop(i)
+        del self._inventory[item.name]
+        self._inventory_version += 1
+
+    def copy(self) -> Player:
+        """Return a copy of this player with its own inventory.
+
+        >>> p = Player()
+        >>> p.add_inventory_item(Item("key", "The key to open door", (0, 19)))
+        >>> q = p.copy()
+        >>> q.remove_inventory_item(q.get_inventory_item("key"))
+        >>> [p.has_item("key"), q.has_item("key")]
+        [True, False]
+        """
+
+        other = object.__new__(type(self))
+        other._inventory = dict(self._inventory)
+        other._inventory_version = self._inventory_version
+        other._drop_options = self._drop_options
+        other.score = self.score
+        other.moves_left = self.moves_left
+        return other
+
+    def restore(self, snapshot: Player) -> None:
+        """Give this player the inventory, score and moves left of snapshot, a copy of it taken earlier.
+
+        >>> p = Player()
+        >>> snapshot = p.copy()
+        >>> p.add_inventory_item(Item("key", "The key to open door", (0, 19)))
+        >>> p.restore(snapshot)
+        >>> p.inventory
+        ()
+        """
+
+        self._inventory = dict(snapshot._inventory)
+        self._inventory_version = max(self._inventory_version, snapshot._inventory_version) + 1
+        self.score = snapshot.score
+        self.moves_left = snapshot.moves_left
 
 
 if __name__ == "__main__":
@@ -0,0 +1,166 @@
+"""CSC111 Project 1: Text Adventure Game - Game Server
+
+Instructions (READ THIS FIRST!)
+===============================
+
+This Python module contains a server for Project 1 that hosts many games at once in one process.
+ Each TCP connection plays its own game, one line per command, and the server never blocks
+ waiting for a player: while one player is thinking, the others keep playing. Run it from the
+ project1 directory (so that game_data.json can be found) and connect with e.g. `nc localhost 8111`.
+ Please consult the project handout for instructions and details.
+
+Copyright and Usage Information
+===============================
+
+This file is provided solely for the personal and private use of students
+taking CSC111 at the University of Toronto St. George campus. All forms of
+distribution of this code, whether as given or with any changes, are
+expressly prohibited. For more information on copyright for CSC111 materials,
+please consult our Course Syllabus.
+
+This file is Copyright (c) 2025 CSC111 Teaching Team
+"""
+from __future__ import annotations
+import asyncio
+import math
+import os
+import uuid
+from typing import Optional
+import game_engine
+from adventure import world_cache
+from event_journal import EventJournal
+from instrumentation import RENDER_PHASE, Instrumentation, timed
+from renderer import Renderer
+
+# The default port of the server
+DEFAULT_PORT = 8111
+
+# Every reply of the server ends with one line starting with this mark, followed by the question the player
+# must answer next. Clients read until this line to know the server is waiting for them.
+PROMPT_MARK = "> "
+
+# The suffix of the name of the journal each game writes to, if the server journals its games
+JOURNAL_SUFFIX = ".journal"
+
+
+class GameServer:
+    """A server hosting one game per connected player.
+
+    Instance Attributes:
+        - game_data_file: the game data every game is loaded from
+        - initial_location_id: the id of the location every game starts at
+        - unlock_location_points: the points for visiting a location for the first time
+        - active_sessions: the number of games being played right now
+        - finished_sessions: the number of games that ended (or whose player disconnected) so far
+        - instruments: the instrumentation recording the turns of every game, or None if they are not recorded
+        - journal_directory: the directory where every game writes its own journal (see event_journal), so that
+          it can be recovered with game_engine.recover_game, or None if games are not journaled
+
+    Representation Invariants:
+        - self.active_sessions >= 0
+        - self.finished_sessions >= 0
+    """
+
+    game_data_file: str
+    initial_location_id: int
+    unlock_location_points: int
+    active_sessions: int
+    finished_sessions: int
+    instruments: Optional[Instrumentation]
+    journal_directory: Optional[str]
+
+    def __init__(self, game_data_file: str = 'game_data.json', initial_location_id: int = 1,
+                 unlock_location_points: int = 10, instruments: Optional[Instrumentation] = None,
+                 journal_directory: Optional[str] = None) -> None:
+        """Initialize a server for games loaded from game_data_file, with no players yet. If instruments is not
+        None, it records the turns of every game, and the time spent rendering them. If journal_directory is not
+        None, every game writes its journal to a new file in it.
+
+        Preconditions:
+            - journal_directory is None or journal_directory is the name of an existing directory
+        """
+
+        self.game_data_file = game_data_file
+        self.initial_location_id = initial_location_id
+        self.unlock_location_points = unlock_location_points
+        self.active_sessions = 0
+        self.finished_sessions = 0
+        self.instruments = instruments
+        self.journal_directory = journal_directory
+
+    async def handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Play one game with the player connected through reader and writer, until the game ends or the player
+        disconnects.
+
+        A minigame (or any other question the game asks) is just another line the session awaits: the game keeps
+        its pending prompt in its GameState, so no other game waits while this player decides. Likewise, if the
+        game is journaled, the records of each turn are committed (written and forced to disk) in a worker thread
+        before the reply is sent, so no other game waits for this one's disk flush.
+        """
+
+        self.active_sessions += 1
+        journal = None
+        try:
+            if self.journal_directory is not None:
+                # the journal never commits at the end of a turn itself (see EventJournal.end_turn)
+                journal = await asyncio.to_thread(
+                    EventJournal, os.path.join(self.journal_directory, uuid.uuid4().hex + JOURNAL_SUFFIX),
+                    commit_delay=math.inf)
+            state, events = game_engine.new_game(self.game_data_file, self.initial_location_id,
+                                                 self.unlock_location_points, journal=journal,
+                                                 instruments=self.instruments)
+            renderer = Renderer()
+            while True:
+                if journal is not None and not journal.closed:
+                    await asyncio.to_thread(journal.commit)
+                with timed(self.instruments, RENDER_PHASE):
+                    text, question = renderer.render(state, events)
+                    if question is not None:
+                        text += PROMPT_MARK + question + "\n"
+                writer.write(text.encode())
+                await writer.drain()
+
+                if question is None:
+                    break
+
+                line = await reader.readline()
+                if not line:  # the player disconnected
+                    break
+                state, events = game_engine.step(state, line.decode(errors='replace'))
+        except ConnectionError:
+            pass
+        finally:
+            self.active_sessions -= 1
+            self.finished_sessions += 1
+            if journal is not None:
+                journal.close()
+            writer.close()
+
+    async def start(self, host: str = 'localhost', port: int = DEFAULT_PORT) -> asyncio.Server:
+        """Start accepting players on host and port (any free port if 0) and return the running asyncio server.
+
+        The game data is loaded into the world cache once here, so no player waits for it.
+        """
+
+        world_cache.load(self.game_data_file)
+        return await asyncio.start_server(self.handle_client, host, port, backlog=4096)
+
+    async def serve_forever(self, host: str = 'localhost', port: int = DEFAULT_PORT) -> None:
+        """Accept players on host and port until cancelled."""
+
+        server = await self.start(host, port)
+        async with server:
+            await server.serve_forever()
+
+
+if __name__ == "__main__":
+    # When you are ready to check your work with python_ta, uncomment the following lines.
+    # (Delete the "#" and space before each line.)
+    # IMPORTANT: keep this code indented inside the "if __name__ == '__main__'" block
+    import python_ta
+    python_ta.check_all(config={
+        'max-line-length': 120,
+        'disable': ['R1705', 'E9998', 'E9999']
+    })
+
+    asyncio.run(GameServer().serve_forever())
@@ -0,0 +1,724 @@
+"""CSC111 Project 1: Text Adventure Game - Shared World and Session State
+
+Instructions (READ THIS FIRST!)
+===============================
+
+This Python module contains the read-only world definition shared by every game session, and the compact
+ per-session state layered on top of it, to be imported and used by the `adventure` module.
+ Please consult the project handout for instructions and details.
+
+Copyright and Usage Information
+===============================
+
+This file is provided solely for the personal and private use of students
+taking CSC111 at the University of Toronto St. George campus. All forms of
+distribution of this code, whether as given or with any changes, are
+expressly prohibited. For more information on copyright for CSC111 materials,
+please consult our Course Syllabus.
+
+This file is Copyright (c) 2025 CSC111 Teaching Team
+"""
+from __future__ import annotations
+import copy
+import hashlib
+import json
+import random
+from array import array
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from types import MappingProxyType
+from typing import Any, Optional
+from command_trie import MIN_MATCH_LENGTH, CommandTrie
+from distance_index import DistanceIndex
+from game_entities import PICK_UP_PREFIX, Item, Location, item_options
+
+# Position of an item that is not lying at any location (not spawned yet, or carried by the player)
+NOWHERE = -1
+
+# The number of locations whose visited bits are stored (and copied) together by a SessionState
+VISITED_PAGE_SIZE = 2048
+
+
+class WorldDefinition:
+    """The read-only part of a game world: location names, descriptions, the command graph and the items.
+
+    A WorldDefinition is shared by every session playing the world and must never be mutated. Locations are
+    stored in parallel tuples indexed by a dense "slot" number, in the order they appear in the data file.
+
+    Instance Attributes:
+        - location_ids: the id of the location in each slot
+        - names: the name of the location in each slot
+        - descriptions: the (brief, long) descriptions of the location in each slot
+        - commands: the initial available commands of the location in each slot
+        - items: every item in the world
+        - initial_items: the indexes (in self.items) of the items initially lying at the location in each slot
+        - initial_positions: the id of the location each item initially lies at, or NOWHERE
+
+    Representation Invariants:
+        - len(self.location_ids) == len(self.names) == len(self.descriptions) == len(self.commands)
+        - len(self.initial_items) == len(self.location_ids)
+        - all(0 <= i < len(self.items) for slot_items in self.initial_items for i in slot_items)
+    """
+
+    # Private Instance Attributes:
+    #   - _slots: a mapping from location id to its slot
+    #   - _item_indexes: a mapping from item name to its index in self.items
+    #   - _distances: the distance index of the initial command graph, once it has been needed
+    #   - _command_slots: a mapping from each command looked up with command_slots to the slots of the locations
+    #                     where it is initially available
+    #   - _digest: the digest of this world's contents, once it has been needed
+    location_ids: tuple[int, ...]
+    names: tuple[str, ...]
+    descriptions: tuple[tuple[str, str], ...]
+    commands: tuple[Mapping[str, int], ...]
+    items: tuple[Item, ...]
+    initial_items: tuple[tuple[int, ...], ...]
+    initial_positions: array
+    _slots: dict[int, int]
+    _item_indexes: dict[str, int]
+    _distances: Optional[DistanceIndex]
+    _command_slots: dict[str, tuple[int, ...]]
+    _digest: Optional[str]
+
+    def __init__(self, locations: dict[int, Location], items: list[Item]) -> None:
+        """Initialize a world definition from freshly loaded locations and items.
+
+        The given objects become part of the shared world and must not be mutated afterwards.
+        """
+
+        self.location_ids = tuple(locations)
+        self.names = tuple(loc.name for loc in locations.values())
+        self.descriptions = tuple(loc.descriptions for loc in locations.values())
+        self.commands = tuple(MappingProxyType(dict(loc.available_commands)) for loc in locations.values())
+        self.items = tuple(items)
+        self._slots = {loc_id: slot for slot, loc_id in enumerate(self.location_ids)}
+        self._item_indexes = {item.name: i for i, item in enumerate(self.items)}
+        self.initial_items = tuple(tuple(self._item_indexes[item.name] for item in loc.items)
+                                   for loc in locations.values())
+        self.initial_positions = array('i', [NOWHERE] * len(self.items))
+        for slot, slot_items in enumerate(self.initial_items):
+            for i in slot_items:
+                self.initial_positions[i] = self.location_ids[slot]
+        self._distances = None
+        self._command_slots = {}
+        self._digest = None
+
+    def __len__(self) -> int:
+        """Return the number of locations in this world."""
+
+        return len(self.location_ids)
+
+    def slot_of(self, location_id: int) -> int:
+        """Return the slot of the location with the given id.
+
+        Preconditions:
+            - location_id in self.location_ids
+        """
+
+        return self._slots[location_id]
+
+    def has_location(self, location_id: int) -> bool:
+        """Return whether this world has a location with the given id."""
+
+        return location_id in self._slots
+
+    def target_slots(self, commands: Mapping[str, int]) -> list[int]:
+        """Return the slots of the locations (of this world) the given available commands lead to."""
+
+        return [self._slots[target] for target in commands.values() if target in self._slots]
+
+    def distances(self) -> DistanceIndex:
+        """Return the distance index of this world's initial command graph, building it the first time."""
+
+        if self._distances is None:
+            self._distances = DistanceIndex(len(self), lambda slot: self.target_slots(self.commands[slot]))
+        return self._distances
+
+    def command_slots(self, command: str) -> tuple[int, ...]:
+        """Return the slots of the locations where command is initially available, finding them the first time it
+        is asked for."""
+
+        if command not in self._command_slots:
+            self._command_slots[command] = tuple(slot for slot, commands in enumerate(self.commands)
+                                                 if command in commands)
+        return self._command_slots[command]
+
+    def item_index(self, item_name: str) -> Optional[int]:
+        """Return the index in self.items of the item with the given name, or None if there is no such item."""
+
+        return self._item_indexes.get(item_name)
+
+    def is_current(self) -> bool:
+        """Return whether this world still matches the files it was built from, besides its own data file (which
+        world_cache.WorldCache checks itself). A world loaded from a single file always does."""
+
+        return True
+
+    def digest(self) -> str:
+        """Return a hex digest of this world's locations, commands and items, computing it the first time.
+
+        Two worlds have the same digest exactly when they have the same contents, whichever files they were loaded
+        from, so the digest can key results computed on a world.
+        """
+
+        if self._digest is None:
+            contents = [list(self.location_ids), list(self.names), [list(pair) for pair in self.descriptions],
+                        [sorted(commands.items()) for commands in self.commands],
+                        [(item.name, item.description, item.start_position, item.target_position)
+                         for item in self.items],
+                        [list(indexes) for indexes in self.initial_items]]
+            self._digest = hashlib.sha256(json.dumps(contents).encode()).hexdigest()
+        return self._digest
+
+
+class _Overlay:
+    """A mapping from int to int that is changed a few keys at a time and copied often, over a read-only base
+    sequence (the value of key i, for the keys not changed, is base[i]).
+
+    The keys changed since the last copy are kept in a dict of their own, in front of the read-only layers of
+    the keys changed before, which are shared with the copies. Copying takes O(log n) time rather than O(n): a
+    layer is merged with the one behind it whenever it is at least as large, so there are O(log n) layers to look
+    a key up in, and every change is copied O(log n) times over all the merges.
+
+    >>> positions = _Overlay(array('i', [1, 1, 2]))
+    >>> snapshot = positions.copy()
+    >>> positions[0] = 3
+    >>> [positions[0], snapshot[0]], positions.get(5, -1), positions.to_array().tolist()
+    ([3, 1], -1, [3, 1, 2])
+    """
+
+    # Private Instance Attributes:
+    #   - _top: the keys changed since the last copy and their values
+    #   - _layers: the read-only layers of keys changed before, newest first, each larger than the one before it
+    #   - _base: the values of the keys not changed
+    __slots__ = ('_top', '_layers', '_base')
+    _top: dict[int, int]
+    _layers: tuple[dict[int, int], ...]
+    _base: Sequence[int]
+
+    def __init__(self, base: Sequence[int] = ()) -> None:
+        """Initialize a mapping of key i to base[i], which must not change afterwards."""
+
+        self._top = {}
+        self._layers = ()
+        self._base = base
+
+    def __getitem__(self, key: int) -> int:
+        """Return the value of key, raising IndexError if it was never changed and base has no index key."""
+
+        if key in self._top:
+            return self._top[key]
+        for layer in self._layers:
+            if key in layer:
+                return layer[key]
+        return self._base[key]
+
+    def get(self, key: int, default: int) -> int:
+        """Return the value of key, or default if it was never changed and base has no index key."""
+
+        if key in self._top:
+            return self._top[key]
+        for layer in self._layers:
+            if key in layer:
+                return layer[key]
+        return self._base[key] if 0 <= key < len(self._base) else default
+
+    def __setitem__(self, key: int, value: int) -> None:
+        """Set the value of key."""
+
+        self._top[key] = value
+
+    def to_array(self) -> array:
+        """Return the value of every index of base, as an array of ints."""
+
+        values = array('i', self._base)
+        for layer in reversed((self._top, *self._layers)):
+            for key, value in layer.items():
+                if key < len(values):
+                    values[key] = value
+        return values
+
+    def copy(self) -> _Overlay:
+        """Return a copy of this mapping that can be changed independently of it."""
+
+        if self._top:
+            top, layers = self._top, self._layers
+            while layers and len(layers[0]) <= len(top):
+                top = {**layers[0], **top}
+                layers = layers[1:]
+            self._top, self._layers = {}, (top, *layers)
+        other = _Overlay.__new__(_Overlay)
+        other._top, other._layers, other._base = {}, self._layers, self._base
+        return other
+
+
+class SessionState:
+    """The mutable state of one game session played on a shared WorldDefinition.
+
+    Only what a session changes is stored: a visited bit per location (in pages of VISITED_PAGE_SIZE locations,
+    only for pages with a visited location), the current position of every item, the item lists of locations whose
+    items changed, and the commands added to or removed from each location.
+
+    Copies share their containers (copy-on-write): copying a session copies no container, and a session copies a
+    container (or one page of visited bits, or the items or commands of one location) the first time it changes
+    it after being copied. The item positions and location versions, which change every turn, are overlays
+    instead (see _Overlay): a copy only freezes the changes since the last one. A copy taken before every change
+    therefore only costs what changes.
+
+    Instance Attributes:
+        - world: the world this session is played on
+        - visited: a mapping from page number to a bitset of the page's locations, with bit
+                   slot % VISITED_PAGE_SIZE of page slot // VISITED_PAGE_SIZE set when the location in that slot
+                   has been visited
+        - item_positions: a mapping from the index of each item of the world to the id of the location it lies at,
+                          or NOWHERE
+        - added_commands: a mapping from slot to the commands added to that location
+        - removed_commands: a mapping from slot to the initial commands removed from that location
+        - version: a counter increased every time the items or commands of a location change
+        - location_versions: a mapping from slot to the value of version when the items or commands of that location
+                             last changed, only for locations that changed
+        - rng: the random number generator of this session's minigames, copied (in its current state) with the
+               session so that a copy plays exactly as the original would
+
+    Representation Invariants:
+        - all(len(page) * 8 == VISITED_PAGE_SIZE for page in self.visited.values())
+        - all(position == NOWHERE or self.world.has_location(position) for position in self.item_positions.to_array())
+
+    >>> world = WorldDefinition({1: Location((1, "Gate"), ("", ""), {"go east": 2}, []),
+    ...                          2: Location((2, "Hall"), ("", ""), {"go west": 1}, [])}, [])
+    >>> session = SessionState(world)
+    >>> snapshot = session.copy()
+    >>> session.set_visited(1, True)
+    >>> session.add_command(0, "go north", 2)
+    >>> [session.is_visited(1), snapshot.is_visited(1)], "go north" in snapshot.commands_at(0)
+    ([True, False], False)
+    """
+
+    # Private Instance Attributes:
+    #   - _location_items: a mapping from slot to the indexes of the items at that location (as the keys of a dict,
+    #                      in the order they were added), only for locations whose items differ from the
+    #                      world's initial items
+    #   - _merged_commands: a cache of the available commands of locations with added or removed commands
+    #   - _pick_up_options: a cache of the location version and the pick up options of each location they were
+    #                       asked for, never shared with a copy
+    #   - _command_tries: the location version and the tries of the available commands and of the pick up options
+    #                     of each location they were asked for, kept up to date as the location changes and never
+    #                     shared with a copy
+    #   - _rng: the random number generator returned by self.rng
+    #   - _shared: the names of the attributes whose containers may be shared with a copy of this session
+    #   - _owned: the (attribute name, key) of the containers in visited (by page), added_commands, removed_commands
+    #             and _location_items (by slot) that this session changed since it was last copied
+    __slots__ = ('world', 'visited', 'item_positions', 'added_commands', 'removed_commands', 'version',
+                 'location_versions', '_location_items', '_merged_commands', '_pick_up_options', '_command_tries',
+                 '_rng', '_shared', '_owned')
+    world: WorldDefinition
+    visited: dict[int, bytearray]
+    item_positions: _Overlay
+    added_commands: dict[int, dict[str, int]]
+    removed_commands: dict[int, set[str]]
+    version: int
+    location_versions: _Overlay
+    _location_items: dict[int, dict[int, None]]
+    _merged_commands: dict[int, Mapping[str, int]]
+    _pick_up_options: dict[int, tuple[int, Mapping[str, Item]]]
+    _command_tries: dict[int, tuple[int, CommandTrie, CommandTrie]]
+    _rng: random.Random
+    _shared: frozenset[str]
+    _owned: frozenset[tuple[str, int]]
+
+    def __init__(self, world: WorldDefinition, seed: Optional[int] = None) -> None:
+        """Initialize a new session in its starting state on the given world, with its random number generator
+        seeded with seed (or from the operating system's randomness if None)."""
+
+        self.world = world
+        self.visited = {}
+        self.item_positions = _Overlay(world.initial_positions)
+        self.added_commands = {}
+        self.removed_commands = {}
+        self.version = 0
+        self.location_versions = _Overlay()
+        self._location_items = {}
+        self._merged_commands = {}
+        self._pick_up_options = {}
+        self._command_tries = {}
+        self._rng = random.Random(seed)
+        self._shared = frozenset()
+        self._owned = frozenset()
+
+    @property
+    def rng(self) -> random.Random:
+        """This session's own random number generator, to be drawn from."""
+        return self._own('_rng')
+
+    def _own(self, name: str) -> Any:
+        """Return the container in the attribute name of this session, copying it first if it may be shared."""
+
+        if name in self._shared:
+            self._shared = self._shared - {name}
+            setattr(self, name, copy.copy(getattr(self, name)))
+        return getattr(self, name)
+
+    def _own_at(self, name: str, key: int, default: Callable[[], Any]) -> Any:
+        """Return the container at key in the mapping in the attribute name of this session, copying it first if it
+        may be shared, or creating it with default if there is none."""
+
+        containers = self._own(name)
+        if (name, key) not in self._owned:
+            self._owned = self._owned | {(name, key)}
+            containers[key] = copy.copy(containers[key]) if key in containers else default()
+        return containers[key]
+
+    def is_visited(self, slot: int) -> bool:
+        """Return whether the location in the given slot has been visited."""
+
+        page = self.visited.get(slot // VISITED_PAGE_SIZE)
+        return page is not None and bool(page[slot % VISITED_PAGE_SIZE >> 3] & (1 << (slot & 7)))
+
+    def set_visited(self, slot: int, value: bool) -> None:
+        """Set whether the location in the given slot has been visited."""
+
+        if value != self.is_visited(slot):
+            page = self._own_at('visited', slot // VISITED_PAGE_SIZE, lambda: bytearray(VISITED_PAGE_SIZE // 8))
+            page[slot % VISITED_PAGE_SIZE >> 3] ^= 1 << (slot & 7)
+
+    def items_at(self, slot: int) -> tuple[Item, ...]:
+        """Return the items currently at the location in the given slot, in the order they were added."""
+
+        indexes = self._location_items.get(slot, self.world.initial_items[slot])
+        return tuple(self.world.items[i] for i in indexes)
+
+    def add_item(self, slot: int, item: Item) -> None:
+        """Add the given item to the location in the given slot.
+
+        Preconditions:
+            - self.world.item_index(item.name) is not None
+        """
+
+        i = self.world.item_index(item.name)
+        tries = self._current_tries(slot)
+        self._own_items(slot)[i] = None
+        self._changed(slot, tries)
+        if tries is not None:
+            tries[1].add(PICK_UP_PREFIX + item.name)
+        self.item_positions[i] = self.world.location_ids[slot]
+
+    def remove_item(self, slot: int, item: Item) -> None:
+        """Remove the given item from the location in the given slot.
+
+        Preconditions:
+            - item in self.items_at(slot)
+        """
+
+        i = self.world.item_index(item.name)
+        tries = self._current_tries(slot)
+        del self._own_items(slot)[i]
+        self._changed(slot, tries)
+        if tries is not None:
+            tries[1].discard(PICK_UP_PREFIX + item.name)
+        self.item_positions[i] = NOWHERE
+
+    def location_version(self, slot: int) -> int:
+        """Return a number that changes every time the items or commands of the location in the given slot change.
+
+        Every change of this session gets a new number, so a number stands for one state of the location even
+        across copies of this session taken before the change and restored after it.
+        """
+
+        return self.location_versions.get(slot, 0)
+
+    def pick_up_options(self, slot: int) -> Mapping[str, Item]:
+        """Return a read-only mapping from the "pick up: <item>" command of every item currently at the location in
+        the given slot to the item, in the order they were added. It is only built again after the items or
+        commands of the location change."""
+
+        version = self.location_versions.get(slot, 0)
+        cached = self._pick_up_options.get(slot)
+        if cached is None or cached[0] != version:
+            cached = (version, item_options(PICK_UP_PREFIX, self.items_at(slot)))
+            self._pick_up_options[slot] = cached
+        return cached[1]
+
+    def command_tries(self, slot: int) -> tuple[CommandTrie, CommandTrie]:
+        """Return tries of the commands available at the location in the given slot and of its pick up options.
+
+        They are built the first time they are asked for, and then updated one command at a time as the commands
+        and items of the location change.
+        """
+
+        tries = self._current_tries(slot)
+        if tries is None:
+            tries = (CommandTrie(self.commands_at(slot), MIN_MATCH_LENGTH),
+                     CommandTrie(self.pick_up_options(slot), MIN_MATCH_LENGTH))
+            self._command_tries[slot] = (self.location_versions.get(slot, 0), *tries)
+        return tries
+
+    def changed_command_slots(self) -> list[int]:
+        """Return the slots of the locations whose commands were changed in this session."""
+
+        return list(self._merged_commands)
+
+    def commands_at(self, slot: int) -> Mapping[str, int]:
+        """Return a read-only mapping of the commands currently available at the location in the given slot."""
+
+        if slot not in self._merged_commands:
+            return self.world.commands[slot]
+        return self._merged_commands[slot]
+
+    def add_command(self, slot: int, command: str, target_id: int) -> None:
+        """Make command (leading to the location with id target_id) available at the location in the given slot."""
+
+        tries = self._current_tries(slot)
+        if command in self.removed_commands.get(slot, ()):
+            self._own_at('removed_commands', slot, set).discard(command)
+        self._own_at('added_commands', slot, dict)[command] = target_id
+        self._merge_commands(slot, tries)
+        if tries is not None:
+            tries[0].add(command)
+
+    def remove_command(self, slot: int, command: str) -> None:
+        """Remove command from the commands available at the location in the given slot.
+
+        Preconditions:
+            - command in self.commands_at(slot)
+        """
+
+        tries = self._current_tries(slot)
+        if command in self.added_commands.get(slot, {}):
+            del self._own_at('added_commands', slot, dict)[command]
+        if command in self.world.commands[slot]:
+            self._own_at('removed_commands', slot, set).add(command)
+        self._merge_commands(slot, tries)
+        if tries is not None:
+            tries[0].discard(command)
+
+    def item_at(self, slot: int, item_name: str) -> Optional[Item]:
+        """Return the item named item_name if it is at the location in the given slot, or None otherwise."""
+
+        i = self.world.item_index(item_name)
+        if i is None or self.item_positions[i] != self.world.location_ids[slot]:
+            return None
+        return self.world.items[i]
+
+    def copy(self) -> SessionState:
+        """Return a copy of this session on the same world that can be changed independently of it.
+
+        No container is copied: this session and the copy share them until either changes one, and its overlays
+        are copied in O(log n) time.
+        """
+
+        other = SessionState.__new__(SessionState)
+        other.world = self.world
+        other.visited = self.visited
+        other.item_positions = self.item_positions.copy()
+        other.added_commands = self.added_commands
+        other.removed_commands = self.removed_commands
+        other.version = self.version
+        other.location_versions = self.location_versions.copy()
+        other._location_items = self._location_items
+        other._merged_commands = self._merged_commands
+        other._pick_up_options = {}
+        other._command_tries = {}
+        other._rng = self._rng
+        self._shared = other._shared = _SHARED_FIELDS
+        self._owned = other._owned = frozenset()
+        return other
+
+    def key(self) -> tuple:
+        """Return a hashable summary of the position of every item and the commands of every location whose
+        commands changed, i.e. of this session's state apart from the visited locations, the order of the
+        items at each location and the state of its random number generator."""
+
+        changed = tuple(sorted((slot, tuple(sorted(commands.items())))
+                               for slot, commands in self._merged_commands.items()
+                               if commands != self.world.commands[slot]))
+        return self.item_positions.to_array().tobytes(), changed
+
+    def _own_items(self, slot: int) -> dict[int, None]:
+        """Return this session's own (mutable) item indexes of the location in the given slot."""
+
+        return self._own_at('_location_items', slot, lambda: dict.fromkeys(self.world.initial_items[slot]))
+
+    def _merge_commands(self, slot: int, tries: Optional[tuple[CommandTrie, CommandTrie]]) -> None:
+        """Recompute the cached available commands of the location in the given slot, whose tries (to be updated by
+        the caller) are tries, or None if they are not up to date."""
+
+        removed = self.removed_commands.get(slot, set())
+        merged = {command: target for command, target in self.world.commands[slot].items()
+                  if command not in removed}
+        merged.update(self.added_commands.get(slot, {}))
+        self._own('_merged_commands')[slot] = MappingProxyType(merged)
+        self._changed(slot, tries)
+
+    def _current_tries(self, slot: int) -> Optional[tuple[CommandTrie, CommandTrie]]:
+        """Return the cached command tries of the location in the given slot, or None if there are none or they
+        were built for an earlier state of the location."""
+
+        cached = self._command_tries.get(slot)
+        if cached is None or cached[0] != self.location_versions.get(slot, 0):
+            return None
+        return cached[1], cached[2]
+
+    def _changed(self, slot: int, tries: Optional[tuple[CommandTrie, CommandTrie]] = None) -> None:
+        """Record that the items or commands of the location in the given slot changed. tries are its command
+        tries (to be updated by the caller) if they were up to date before the change, or None."""
+
+        self.version += 1
+        self.location_versions[slot] = self.version
+        if tries is not None:
+            self._command_tries[slot] = (self.version, *tries)
+
+
+# The attributes of a SessionState holding the containers it shares with its copies
+_SHARED_FIELDS = frozenset({'visited', 'added_commands', 'removed_commands', '_location_items', '_merged_commands',
+                            '_rng'})
+
+
+class LocationView:
+    """One location of a session, with the same attributes and methods as Location.
+
+    Static data is read from the shared world and state is read from and written to the session, so views are
+    cheap to create and hold nothing of their own.
+
+    Instance Attributes:
+        - id_num: integer id for this location
+        - name: name of this location
+        - descriptions: tuple of the brief and long descriptions of this location
+        - available_commands: a read-only mapping of available commands at this location to
+                              the location executing that command would lead to
+        - items: a tuple of the items at this location
+        - visited: whether the player has visited this location (for displaying description)
+        - version: a number that changes every time the items or available commands of this location change
+        - pick_up_options: a read-only mapping from the "pick up: <item>" command of every item at this location to
+                           the item
+        - command_tries: tries of the available commands and of the pick up options of this location
+    """
+
+    # Private Instance Attributes:
+    #   - _session: the session this view reads and writes
+    #   - _slot: the slot of this location in the session's world
+    __slots__ = ('_session', '_slot')
+    _session: SessionState
+    _slot: int
+
+    def __init__(self, session: SessionState, slot: int) -> None:
+        """Initialize a view of the location in the given slot of session."""
+
+        self._session = session
+        self._slot = slot
+
+    def __repr__(self) -> str:
+        """Return a string representation of this location view."""
+
+        return f"LocationView(id_num={self.id_num}, name={self.name!r})"
+
+    @property
+    def id_num(self) -> int:
+        """The id of this location."""
+        return self._session.world.location_ids[self._slot]
+
+    @property
+    def name(self) -> str:
+        """The name of this location."""
+        return self._session.world.names[self._slot]
+
+    @property
+    def descriptions(self) -> tuple[str, str]:
+        """The (brief, long) descriptions of this location."""
+        return self._session.world.descriptions[self._slot]
+
+    @property
+    def available_commands(self) -> Mapping[str, int]:
+        """The commands currently available at this location."""
+        return self._session.commands_at(self._slot)
+
+    @property
+    def items(self) -> tuple[Item, ...]:
+        """The items currently at this location (read-only: use add_item and remove_item to change them)."""
+        return self._session.items_at(self._slot)
+
+    @property
+    def version(self) -> int:
+        """A number that changes every time the items or available commands of this location change."""
+        return self._session.location_version(self._slot)
+
+    @property
+    def pick_up_options(self) -> Mapping[str, Item]:
+        """The "pick up: <item>" commands of the items currently at this location, mapped to the items."""
+        return self._session.pick_up_options(self._slot)
+
+    @property
+    def command_tries(self) -> tuple[CommandTrie, CommandTrie]:
+        """Tries of the commands currently available at this location and of its pick up options."""
+        return self._session.command_tries(self._slot)
+
+    @property
+    def visited(self) -> bool:
+        """Whether the player has visited this location."""
+        return self._session.is_visited(self._slot)
+
+    @visited.setter
+    def visited(self, value: bool) -> None:
+        """Set whether the player has visited this location."""
+        self._session.set_visited(self._slot, value)
+
+    def add_item(self, item: Item) -> None:
+        """Add a new item to self.items"""
+
+        self._session.add_item(self._slot, item)
+
+    def remove_item(self, item: Item) -> None:
+        """Remove given item of value item from self's items attributes.
+
+        Preconditions:
+        - item in self.items
+        """
+
+        self._session.remove_item(self._slot, item)
+
+    def get_item(self, name: str) -> Optional[Item]:
+        """Return the Item with name as its name. If none, return None."""
+
+        return self._session.item_at(self._slot, name)
+
+
+class SessionLocations(Mapping):
+    """A read-only mapping from location id to a LocationView of that location in a session."""
+
+    # Private Instance Attributes:
+    #   - _session: the session whose locations this mapping holds
+    _session: SessionState
+
+    def __init__(self, session: SessionState) -> None:
+        """Initialize the mapping of the locations of session."""
+
+        self._session = session
+
+    def __getitem__(self, location_id: int) -> LocationView:
+        """Return a view of the location with the given id."""
+
+        return LocationView(self._session, self._session.world.slot_of(location_id))
+
+    def __iter__(self) -> Iterator[int]:
+        """Iterate over the location ids of the session's world."""
+
+        return iter(self._session.world.location_ids)
+
+    def __len__(self) -> int:
+        """Return the number of locations in the session's world."""
+
+        return len(self._session.world)
+
+    def __contains__(self, location_id: object) -> bool:
+        """Return whether the session's world has a location with the given id."""
+
+        return self._session.world.has_location(location_id)
+
+
+if __name__ == "__main__":
+    # When you are ready to check your work with python_ta, uncomment the following lines.
+    # (Delete the "#" and space before each line.)
+    # IMPORTANT: keep this code indented inside the "if __name__ == '__main__'" block
+    import python_ta
+    python_ta.check_all(config={
+        'max-line-length': 120,
+        'disable': ['R1705', 'E9998', 'E9999']
+    })
@@ -0,0 +1,460 @@
+"""CSC111 Project 1: Text Adventure Game - Instrumentation
+
+Instructions (READ THIS FIRST!)
+===============================
+
+This Python module contains the opt-in instrumentation of Project 1. An Instrumentation attached
+ to a game (GameState.instruments) counts the commands of each kind it plays and records their
+ latencies, and the time spent in each phase of a turn, in histograms that can be written as JSON
+ or in the Prometheus text format. Hooks attached to it (such as a cProfile or tracemalloc
+ session) are told when each turn starts and ends. A game without instrumentation pays nothing
+ more than one check per turn.
+ Please consult the project handout for instructions and details.
+
+Copyright and Usage Information
+===============================
+
+This file is provided solely for the personal and private use of students
+taking CSC111 at the University of Toronto St. George campus. All forms of
+distribution of this code, whether as given or with any changes, are
+expressly prohibited. For more information on copyright for CSC111 materials,
+please consult our Course Syllabus.
+
+This file is Copyright (c) 2025 CSC111 Teaching Team
+"""
+from __future__ import annotations
+import cProfile
+import json
+import pstats
+import time
+import tracemalloc
+from bisect import bisect_left
+from collections.abc import Iterator
+from contextlib import contextmanager, nullcontext
+from typing import ContextManager, Optional, Protocol
+
+# The phases of a turn:
+#   - VALIDATE_PHASE: normalizing the command and finding it in the dispatch table
+#   - DISPATCH_PHASE: running the command's handler
+#   - EVENT_PHASE: creating the event of the turn
+#   - LOG_PHASE: adding the event to the game's EventList
+#   - RENDER_PHASE: showing the output of the turn to the player (timed by whoever shows it, see timed)
+VALIDATE_PHASE = "validate"
+DISPATCH_PHASE = "dispatch"
+EVENT_PHASE = "event"
+LOG_PHASE = "log"
+RENDER_PHASE = "render"
+
+# The kind of a turn answering a prompt (the other kinds of turns are the command kinds of command_registry, and
+# game_engine.INVALID for an invalid command or any command once the game is over)
+ANSWER = "answer"
+
+# The kind of a turn that raised an exception before it could end
+FAILED = "failed"
+
+# The upper bounds (in nanoseconds) of the buckets of latency histograms, the last bucket having no bound
+LATENCY_BOUNDS = (1000, 2000, 5000, 10000, 20000, 50000, 100000, 200000, 500000, 1000000, 10000000, 100000000)
+
+# The upper bounds (in bytes) of the buckets of the histogram of the memory allocated in each turn
+MEMORY_BOUNDS = (0, 1024, 4096, 16384, 65536, 262144, 1048576)
+
+# The prefix of the name of every metric in the Prometheus text format
+METRIC_PREFIX = "deadline_dash"
+
+
+class Histogram:
+    """A histogram of values, counted in buckets with fixed upper bounds.
+
+    Instance Attributes:
+        - bounds: the upper bound (inclusive) of each bucket but the last, which holds every larger value
+        - counts: the number of values in each bucket
+        - total: the sum of the values
+        - count: the number of values
+
+    Representation Invariants:
+        - len(self.counts) == len(self.bounds) + 1
+        - sum(self.counts) == self.count
+
+    >>> histogram = Histogram((10, 100))
+    >>> for value in (5, 10, 50, 500):
+    ...     histogram.add(value)
+    >>> histogram.counts, histogram.total, histogram.count
+    ([2, 1, 1], 565, 4)
+    """
+
+    __slots__ = ('bounds', 'counts', 'total', 'count')
+
+    bounds: tuple[int, ...]
+    counts: list[int]
+    total: int
+    count: int
+
+    def __init__(self, bounds: tuple[int, ...]) -> None:
+        """Initialize an empty histogram with buckets of the given upper bounds.
+
+        Preconditions:
+            - list(bounds) == sorted(set(bounds))
+        """
+
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.total = 0
+        self.count = 0
+
+    def add(self, value: int) -> None:
+        """Count value in its bucket."""
+
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.total += value
+        self.count += 1
+
+    def merge(self, other: Histogram) -> None:
+        """Add the values counted by other to this histogram.
+
+        Preconditions:
+            - other.bounds == self.bounds
+        """
+
+        self.counts = [a + b for a, b in zip(self.counts, other.counts)]
+        self.total += other.total
+        self.count += other.count
+
+    def to_json(self) -> dict:
+        """Return this histogram as a JSON object."""
+
+        return {'bounds': list(self.bounds), 'counts': self.counts, 'total': self.total, 'count': self.count}
+
+
+class Hook:
+    """Something attached to an Instrumentation, told when it is attached and detached and when each turn of its
+    games starts and ends. Every method does nothing unless overridden."""
+
+    def attach(self) -> None:
+        """Start, as this hook is attached."""
+
+    def detach(self) -> None:
+        """Stop, as this hook is detached."""
+
+    def before_turn(self) -> None:
+        """Prepare for a turn that is starting."""
+
+    def after_turn(self, kind: str) -> None:
+        """Record a turn of the given kind that just ended."""
+
+
+class ProfileHook(Hook):
+    """A cProfile session profiling every turn played while it is attached, and nothing in between (such as the
+    time a game waits for the player).
+
+    Instance Attributes:
+        - profile: the profiler
+    """
+
+    profile: cProfile.Profile
+
+    def __init__(self) -> None:
+        """Initialize a hook with a profiler that has not profiled anything yet."""
+
+        self.profile = cProfile.Profile()
+
+    def before_turn(self) -> None:
+        """Start profiling."""
+
+        self.profile.enable()
+
+    def after_turn(self, kind: str) -> None:
+        """Stop profiling."""
+
+        self.profile.disable()
+
+    def stats(self, sort: str = 'cumulative') -> pstats.Stats:
+        """Return the statistics of the profiled turns, sorted by sort (see pstats.Stats.sort_stats)."""
+
+        return pstats.Stats(self.profile).sort_stats(sort)
+
+
+class TracemallocHook(Hook):
+    """A tracemalloc session tracing the memory allocated while it is attached, counting the memory each turn
+    leaves allocated in a histogram and taking a snapshot of every allocation when it is detached.
+
+    Instance Attributes:
+        - frames: the number of frames of the traceback stored for each allocation
+        - allocated: the histogram of the number of bytes (but 0 for fewer) each turn left allocated
+        - snapshot: the allocations traced when this hook was detached, or None if it has not been yet
+
+    Representation Invariants:
+        - self.frames >= 1
+    """
+
+    frames: int
+    allocated: Histogram
+    snapshot: Optional[tracemalloc.Snapshot]
+
+    # Private Instance Attributes:
+    #   - _started: whether this hook started tracing (and must stop it when it is detached)
+    #   - _before: the number of bytes traced when the current turn started
+    _started: bool
+    _before: int
+
+    def __init__(self, frames: int = 1) -> None:
+        """Initialize a hook tracing frames frames of each allocation, which has not traced anything yet."""
+
+        self.frames = frames
+        self.allocated = Histogram(MEMORY_BOUNDS)
+        self.snapshot = None
+        self._started = False
+        self._before = 0
+
+    def attach(self) -> None:
+        """Start tracing, unless something else already is."""
+
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+            self._started = True
+
+    def detach(self) -> None:
+        """Take a snapshot of the traced allocations, and stop tracing if this hook started it."""
+
+        self.snapshot = tracemalloc.take_snapshot()
+        if self._started:
+            tracemalloc.stop()
+            self._started = False
+
+    def before_turn(self) -> None:
+        """Remember the memory traced before the turn."""
+
+        self._before = tracemalloc.get_traced_memory()[0]
+
+    def after_turn(self, kind: str) -> None:
+        """Count the memory the turn left allocated."""
+
+        self.allocated.add(max(0, tracemalloc.get_traced_memory()[0] - self._before))
+
+    def top(self, limit: int = 10) -> list[str]:
+        """Return the limit lines of code that had the most memory allocated when this hook was detached.
+
+        Preconditions:
+            - self.snapshot is not None
+        """
+
+        return [str(statistic) for statistic in self.snapshot.statistics('lineno')[:limit]]
+
+
+class Instrumentation:
+    """The counters and latency histograms of the turns of the games it is attached to.
+
+    Instance Attributes:
+        - commands: the number of turns of each kind (see ANSWER)
+        - latencies: the histogram of the latency (in nanoseconds) of the turns of each kind
+        - phases: the histogram of the time (in nanoseconds) spent in each phase of a turn
+        - hooks: the hooks attached, in the order they were attached
+
+    Representation Invariants:
+        - set(self.commands) == set(self.latencies)
+        - all(self.commands[kind] == self.latencies[kind].count for kind in self.commands)
+    """
+
+    commands: dict[str, int]
+    latencies: dict[str, Histogram]
+    phases: dict[str, Histogram]
+    hooks: list[Hook]
+
+    def __init__(self) -> None:
+        """Initialize an instrumentation that has not recorded any turn, with no hooks."""
+
+        self.commands = {}
+        self.latencies = {}
+        self.phases = {}
+        self.hooks = []
+
+    def attach(self, hook: Hook) -> None:
+        """Attach hook, which is told about every turn from now on."""
+
+        hook.attach()
+        self.hooks.append(hook)
+
+    def detach(self, hook: Hook) -> None:
+        """Detach hook, which is not told about turns anymore.
+
+        Preconditions:
+            - hook in self.hooks
+        """
+
+        self.hooks.remove(hook)
+        hook.detach()
+
+    def start_turn(self) -> Turn:
+        """Return the timer of a turn that is starting now."""
+
+        for hook in self.hooks:
+            hook.before_turn()
+        return Turn(self)
+
+    def record_phase(self, phase: str, duration: int) -> None:
+        """Record that a phase of a turn took duration nanoseconds."""
+
+        histogram = self.phases.get(phase)
+        if histogram is None:
+            histogram = self.phases[phase] = Histogram(LATENCY_BOUNDS)
+        histogram.add(duration)
+
+    def record_turn(self, kind: str, duration: int) -> None:
+        """Record that a turn of the given kind took duration nanoseconds, and tell the hooks it ended."""
+
+        for hook in reversed(self.hooks):
+            hook.after_turn(kind)
+        histogram = self.latencies.get(kind)
+        if histogram is None:
+            histogram = self.latencies[kind] = Histogram(LATENCY_BOUNDS)
+            self.commands[kind] = 0
+        histogram.add(duration)
+        self.commands[kind] += 1
+
+    @contextmanager
+    def phase(self, phase: str) -> Iterator[None]:
+        """Return a context manager recording the time spent in it as the given phase."""
+
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.record_phase(phase, time.perf_counter_ns() - start)
+
+    def merge(self, other: Instrumentation) -> None:
+        """Add the turns recorded by other to this instrumentation (but not its hooks)."""
+
+        for kind, histogram in other.latencies.items():
+            if kind not in self.latencies:
+                self.latencies[kind] = Histogram(LATENCY_BOUNDS)
+                self.commands[kind] = 0
+            self.latencies[kind].merge(histogram)
+            self.commands[kind] += other.commands[kind]
+        for phase, histogram in other.phases.items():
+            self.phases.setdefault(phase, Histogram(LATENCY_BOUNDS)).merge(histogram)
+
+    def to_json(self) -> dict:
+        """Return the counters and histograms of this instrumentation as a JSON object (latencies in nanoseconds).
+        """
+
+        return {'commands': dict(self.commands),
+                'latencies': {kind: histogram.to_json() for kind, histogram in self.latencies.items()},
+                'phases': {phase: histogram.to_json() for phase, histogram in self.phases.items()}}
+
+    def to_prometheus(self) -> str:
+        """Return the counters and histograms of this instrumentation in the Prometheus text format (latencies
+        in seconds).
+
+        >>> instruments = Instrumentation()
+        >>> instruments.record_turn("move", 1500)
+        >>> print(instruments.to_prometheus().splitlines()[2])
+        deadline_dash_commands_total{kind="move"} 1
+        """
+
+        lines = [f"# HELP {METRIC_PREFIX}_commands_total Turns played, by kind.",
+                 f"# TYPE {METRIC_PREFIX}_commands_total counter"]
+        lines.extend(f'{METRIC_PREFIX}_commands_total{{kind="{kind}"}} {count}'
+                     for kind, count in self.commands.items())
+        for name, label, histograms, description in (
+                ('command_latency_seconds', 'kind', self.latencies, "Latency of turns, by kind."),
+                ('phase_seconds', 'phase', self.phases, "Time spent in each phase of a turn.")):
+            lines.append(f"# HELP {METRIC_PREFIX}_{name} {description}")
+            lines.append(f"# TYPE {METRIC_PREFIX}_{name} histogram")
+            for key, histogram in histograms.items():
+                cumulative = 0
+                for bound, count in zip(histogram.bounds + (None,), histogram.counts):
+                    cumulative += count
+                    le = "+Inf" if bound is None else f"{bound / 1e9:g}"
+                    lines.append(f'{METRIC_PREFIX}_{name}_bucket{{{label}="{key}",le="{le}"}} {cumulative}')
+                lines.append(f'{METRIC_PREFIX}_{name}_sum{{{label}="{key}"}} {histogram.total / 1e9:g}')
+                lines.append(f'{METRIC_PREFIX}_{name}_count{{{label}="{key}"}} {histogram.count}')
+        return "\n".join(lines) + "\n"
+
+    def dump(self, filename: str) -> None:
+        """Write the counters and histograms of this instrumentation to filename, in the Prometheus text format if
+        filename ends with ".prom" and as JSON otherwise."""
+
+        with open(filename, 'w', encoding='utf-8') as file:
+            if filename.endswith(".prom"):
+                file.write(self.to_prometheus())
+            else:
+                json.dump(self.to_json(), file, indent=2)
+
+
+class TurnTimer(Protocol):
+    """The timer of one turn of a game: a Turn, or NO_TURN for a game without instrumentation."""
+
+    def mark(self, phase: str) -> None:
+        """Record the time since the last mark (or the start of the turn) as the given phase."""
+
+    def end(self, kind: str) -> None:
+        """Record the turn, of the given kind, as ending now."""
+
+
+class Turn:
+    """The timer of one turn of a game with instrumentation, which records the time between its marks as phases.
+
+    Instance Attributes:
+        - instruments: the instrumentation the turn is recorded by
+        - start: the time (in nanoseconds, from time.perf_counter_ns) the turn started
+    """
+
+    __slots__ = ('instruments', 'start', '_last')
+
+    instruments: Instrumentation
+    start: int
+
+    # Private Instance Attributes:
+    #   - _last: the time of the last mark (or of the start of the turn)
+    _last: int
+
+    def __init__(self, instruments: Instrumentation) -> None:
+        """Initialize the timer of a turn of a game with the given instrumentation, starting now."""
+
+        self.instruments = instruments
+        self.start = self._last = time.perf_counter_ns()
+
+    def mark(self, phase: str) -> None:
+        """Record the time since the last mark (or the start of the turn) as the given phase."""
+
+        now = time.perf_counter_ns()
+        self.instruments.record_phase(phase, now - self._last)
+        self._last = now
+
+    def end(self, kind: str) -> None:
+        """Record the turn, of the given kind, as ending now."""
+
+        self.instruments.record_turn(kind, time.perf_counter_ns() - self.start)
+
+
+class _NullTurn:
+    """The timer of a turn of a game without instrumentation, which records nothing (a TurnTimer, like Turn)."""
+
+    __slots__ = ()
+
+    def mark(self, phase: str) -> None:
+        """Do nothing."""
+
+    def end(self, kind: str) -> None:
+        """Do nothing."""
+
+
+# The timer of every turn of a game without instrumentation
+NO_TURN = _NullTurn()
+
+
+def timed(instruments: Optional[Instrumentation], phase: str) -> ContextManager:
+    """Return a context manager recording the time spent in it as the given phase in instruments, or doing nothing
+    if instruments is None."""
+
+    return nullcontext() if instruments is None else instruments.phase(phase)
+
+
+if __name__ == "__main__":
+    # When you are ready to check your work with python_ta, uncomment the following lines.
+    # (Delete the "#" and space before each line.)
+    # IMPORTANT: keep this code indented inside the "if __name__ == '__main__'" block
+    import python_ta
+    python_ta.check_all(config={
+        'max-line-length': 120,
+        'disable': ['R1705', 'E9998', 'E9999']
+    })
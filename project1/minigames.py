@@ -0,0 +1,233 @@
+"""CSC111 Project 1: Text Adventure Game - Minigames
+
+Instructions (READ THIS FIRST!)
+===============================
+
+This Python module contains the minigames for Project 1, to be imported and used by
+ the `adventure` module. A minigame never reads input or prints: it is a prompt that is
+ answered one line at a time, and returns the messages to show the player.
+ Please consult the project handout for instructions and details.
+
+Copyright and Usage Information
+===============================
+
+This file is provided solely for the personal and private use of students
+taking CSC111 at the University of Toronto St. George campus. All forms of
+distribution of this code, whether as given or with any changes, are
+expressly prohibited. For more information on copyright for CSC111 materials,
+please consult our Course Syllabus.
+
+This file is Copyright (c) 2025 CSC111 Teaching Team
+"""
+from __future__ import annotations
+import random
+from typing import Optional
+from game_entities import Player
+
+
+class Prompt:
+    """A question the game asks the player, which must be answered before they can enter another command.
+
+    Instance Attributes:
+        - finished: whether the prompt needs no more answers
+    """
+
+    finished: bool
+
+    def __init__(self) -> None:
+        """Initialize a new unanswered prompt."""
+
+        self.finished = False
+
+    def start(self) -> list[str]:
+        """Return the messages to show the player before the first question."""
+
+        return []
+
+    def question(self) -> str:
+        """Return the question the player must answer next.
+
+        Preconditions:
+            - not self.finished
+        """
+
+        raise NotImplementedError
+
+    def answer(self, text: str) -> list[str]:
+        """Answer the current question with text and return the messages to show the player.
+
+        Preconditions:
+            - not self.finished
+        """
+
+        raise NotImplementedError
+
+
+def _parse_guess(text: str) -> Optional[int]:
+    """Return text as an integer guess, or None if it is not an integer.
+
+    >>> _parse_guess(" 2 ")
+    2
+    >>> _parse_guess("two") is None
+    True
+    """
+
+    try:
+        return int(text)
+    except ValueError:
+        return None
+
+
+class ShufflingDrawersGame(Prompt):
+    """A shuffling drawers puzzle for retrieving an item. The item is in one of three drawers, which are reshuffled
+    before each guess, and the player has three guesses.
+
+    Instance Attributes:
+        - game_player: the player playing the minigame
+        - target_item_name: the name of the item in the drawers
+        - win_points: the points the player gets for guessing right
+        - guesses_left: the number of guesses the player has left
+        - won: whether the player guessed right
+
+    Representation Invariants:
+        - 0 <= self.guesses_left <= 3
+    """
+
+    game_player: Player
+    target_item_name: str
+    win_points: int
+    guesses_left: int
+    won: bool
+
+    # Private Instance Attributes:
+    #   - _rng: the random number generator shuffling the drawers
+    _rng: random.Random
+
+    def __init__(self, game_player: Player, target_item_name: str, win_points: int,
+                 rng: Optional[random.Random] = None) -> None:
+        """Initialize a new shuffling drawers game, shuffling with rng (or the random module if None)."""
+
+        super().__init__()
+        self.game_player = game_player
+        self.target_item_name = target_item_name
+        self.win_points = win_points
+        self.guesses_left = 3
+        self.won = False
+        self._rng = random if rng is None else rng
+
+    def start(self) -> list[str]:
+        """Return the rules of the minigame."""
+
+        return [f"The {self.target_item_name} is in one of the three drawers. You must guess which drawer. "
+                f"Reshuffling occurs after each incorrect guess."]
+
+    def question(self) -> str:
+        """Ask for the next guess."""
+
+        return f"Enter guess (1, 2 or 3). You have {self.guesses_left} chance(s): "
+
+    def answer(self, text: str) -> list[str]:
+        """Guess the drawer numbered text.
+
+        >>> p = Player()
+        >>> game = ShufflingDrawersGame(p, "laptop charger", 20, random.Random(6))
+        >>> [game.answer("1"), game.answer("1"), game.finished, p.score]
+        [['Wrong! Reshuffled.'], ['You Win! The laptop charger shows up. +20points!'], True, 20]
+        """
+
+        guess = _parse_guess(text)
+        if guess is None:
+            return ["That was an invalid option; try again."]
+
+        correct_guess = self._rng.randint(1, 3)
+        if guess == correct_guess:
+            self.game_player.score += self.win_points
+            self.won = True
+            self.finished = True
+            return [f"You Win! The {self.target_item_name} shows up. +" + str(self.win_points) + "points!"]
+
+        self.guesses_left -= 1
+        if self.guesses_left > 0:
+            return ["Wrong! Reshuffled."]
+
+        self.finished = True
+        return ["Wrong! Reshuffled.",
+                f"The drawers feel bad for you... the {self.target_item_name} reveals itself in disappointment. "
+                f"+0 points"]
+
+
+class LyingBackpacksGame(Prompt):
+    """A lying backpacks game for retrieving an item. Only one of three backpacks tells the truth, and the player
+    has one guess at which backpack holds the item.
+
+    Instance Attributes:
+        - game_player: the player playing the minigame
+        - target_item_name: the name of the item in the backpacks
+        - win_points: the points the player gets for guessing right
+        - won: whether the player guessed right
+    """
+
+    # The backpack holding the item
+    ANSWER = 2
+
+    game_player: Player
+    target_item_name: str
+    win_points: int
+    won: bool
+
+    def __init__(self, game_player: Player, target_item_name: str, win_points: int) -> None:
+        """Initialize a new lying backpacks game."""
+
+        super().__init__()
+        self.game_player = game_player
+        self.target_item_name = target_item_name
+        self.win_points = win_points
+        self.won = False
+
+    def start(self) -> list[str]:
+        """Return the labels of the backpacks."""
+
+        return [f"You entered the messy room and found three backpacks on the floor. The {self.target_item_name} is "
+                f"in one of the backpacks.",
+                f"Backpack 1 was labelled with 'The {self.target_item_name} is in me!'",
+                f"Backpack 2 was labelled with 'The {self.target_item_name} is in not in me!'",
+                f"Backpack 3 was labelled with 'The {self.target_item_name} is not in Backpack 1!'",
+                "Only one of the backpacks is telling the truth. Where is the key?"]
+
+    def question(self) -> str:
+        """Ask for the guess."""
+
+        return "Enter guess (1, 2 or 3), you have only one chance: "
+
+    def answer(self, text: str) -> list[str]:
+        """Guess the backpack numbered text.
+
+        >>> p = Player()
+        >>> game = LyingBackpacksGame(p, "usb drive", 20)
+        >>> [game.answer("2"), game.finished, p.score]
+        [['You are so smart! The usb drive shows up. +20points!'], True, 20]
+        """
+
+        guess = _parse_guess(text)
+        if guess is None:
+            return ["That was an invalid option; try again."]
+
+        self.finished = True
+        if guess == self.ANSWER:
+            self.game_player.score += self.win_points
+            self.won = True
+            return [f"You are so smart! The {self.target_item_name} shows up. +" + str(self.win_points) + "points!"]
+
+        return [f"Haha, you're deceived by the backpacks! The {self.target_item_name} reveals itself in "
+                f"disappointment. +0 points"]
+
+
+if __name__ == "__main__":
+    # When you are ready to check your work with python_ta, uncomment the following lines.
+    # (Delete the "#" and space before each line.)
+    # IMPORTANT: keep this code indented inside the "if __name__ == '__main__'" block
+    import python_ta
+    python_ta.check_all(config={
+        'max-line-length': 120,
+        'disable': ['R1705', 'E9998', 'E9999']
+    })
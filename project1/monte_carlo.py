@@ -0,0 +1,366 @@
+"""CSC111 Project 1: Text Adventure Game - Monte Carlo Simulation
+
+Instructions (READ THIS FIRST!)
+===============================
+
+This Python module contains a Monte Carlo simulator for Project 1, which plays the minigames and
+ whole games millions of times with NumPy to estimate win rates and score distributions under
+ different player policies. The game is first turned into a graph of its states by the route
+ solver (which plays it through game_engine.step), and every simulated player then walks that
+ graph at once, one move per NumPy operation.
+ Please consult the project handout for instructions and details.
+
+Copyright and Usage Information
+===============================
+
+This file is provided solely for the personal and private use of students
+taking CSC111 at the University of Toronto St. George campus. All forms of
+distribution of this code, whether as given or with any changes, are
+expressly prohibited. For more information on copyright for CSC111 materials,
+please consult our Course Syllabus.
+
+This file is Copyright (c) 2025 CSC111 Teaching Team
+"""
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Optional
+import numpy
+from game_engine import GameState
+from minigames import LyingBackpacksGame, ShufflingDrawersGame
+from route_solver import RouteSolver
+
+# The player policies
+RANDOM_WALK = "random walk"  # every available command is equally likely
+GREEDY = "greedy"  # the command with the highest expected immediate gain, ties broken at random
+SOLVER = "solver"  # the route solver's shortest winning route (or highest-scoring route if the game cannot be won)
+
+# The kinds of minigames in the game graph
+_NO_MINIGAME = 0
+_DRAWERS = 1
+_BACKPACKS = 2
+
+
+def simulate_drawers(rng: numpy.random.Generator, n_games: int, chances: int = 3) -> numpy.ndarray:
+    """Return whether each of n_games shuffling drawers games is won, guessing with the given number of chances.
+
+    The drawers are reshuffled before every guess, so every guess is right with probability 1/3 whatever the
+    player guesses.
+
+    >>> wins = simulate_drawers(numpy.random.default_rng(0), 100000)
+    >>> round(float(wins.mean()), 2)  # 1 - (2/3) ** 3
+    0.7
+    """
+
+    guesses = rng.integers(1, 4, (n_games, chances))
+    drawers = rng.integers(1, 4, (n_games, chances))
+    return (guesses == drawers).any(axis=1)
+
+
+def simulate_backpacks(rng: numpy.random.Generator, n_games: int, knows_answer: bool = False) -> numpy.ndarray:
+    """Return whether each of n_games lying backpacks games is won, by a player who knows the answer or who guesses
+    a backpack at random.
+
+    >>> bool(simulate_backpacks(numpy.random.default_rng(0), 10, knows_answer=True).all())
+    True
+    """
+
+    if knows_answer:
+        return numpy.ones(n_games, dtype=bool)
+    return rng.integers(1, 4, n_games) == LyingBackpacksGame.ANSWER
+
+
+@dataclass
+class MonteCarloResult:
+    """The outcome of many simulated games.
+
+    Instance Attributes:
+        - policy: the policy the simulated players followed
+        - scores: the final score of every game
+        - won: whether every game was won
+
+    Representation Invariants:
+        - len(self.scores) == len(self.won)
+    """
+
+    policy: str
+    scores: numpy.ndarray
+    won: numpy.ndarray
+
+    def win_rate(self) -> float:
+        """Return the fraction of the games that were won."""
+
+        return float(self.won.mean())
+
+    def histogram(self, bin_width: int = 10) -> tuple[numpy.ndarray, numpy.ndarray]:
+        """Return the number of games whose final score falls in each bin of bin_width points, and the edges of
+        the bins.
+
+        Preconditions:
+            - bin_width >= 1
+        """
+
+        low = int(self.scores.min()) // bin_width * bin_width
+        high = int(self.scores.max()) // bin_width * bin_width + bin_width
+        return numpy.histogram(self.scores, bins=numpy.arange(low, high + 1, bin_width))
+
+
+class GameSimulator:
+    """A simulator of many games played at once from the same start state.
+
+    The transitions of the route solver's graph of the game are stored as flat NumPy arrays, node after node,
+    each node having width slots for its transitions (padded to the node with the most transitions), so that
+    choosing and taking a move for every simulated player is a handful of array operations. The solver's graph
+    never drops items nor picks up items that no command checks for, so neither do the simulated players.
+
+    Instance Attributes:
+        - n_nodes: the number of nodes of the game graph
+        - width: the number of transitions of the node with the most transitions
+    """
+
+    n_nodes: int
+    width: int
+
+    # Private Instance Attributes:
+    #   - _start: the state every game starts from
+    #   - _solver: the route solver that found the graph
+    #   - _next: the next node of each transition, or 0 for padding
+    #   - _n_transitions: the number of transitions of each node
+    #   - _n_commands: the number of commands of each node (a command answered in many ways, like a teleport,
+    #                  has one transition per answer)
+    #   - _command_first: the index in its node of the first transition of each command, command_width slots per
+    #                     node
+    #   - _command_size: the number of transitions of each command, command_width slots per node
+    #   - _command_width: the number of commands of the node with the most commands
+    #   - _gain: the score gained by each transition, without visit and minigame points
+    #   - _greedy_value: the value of each transition to a greedy player, without visit points (-inf for padding)
+    #   - _moves: the change in moves left of each transition
+    #   - _wins: whether each transition wins the game
+    #   - _slot: the slot of the location each transition visits, or -1
+    #   - _visit_word: the word of the visited bitmask holding the slot each transition visits (0 if none)
+    #   - _visit_bit: the bit of the slot each transition visits in its word (0 if none)
+    #   - _minigame: the kind of minigame played by each transition
+    #   - _minigame_points: the points of winning the minigame played by each transition
+    #   - _start_visited: the bitmasks of the slots of the locations visited in the start state, 64 slots per word
+    _start: GameState
+    _solver: RouteSolver
+    _next: numpy.ndarray
+    _n_transitions: numpy.ndarray
+    _n_commands: numpy.ndarray
+    _command_first: numpy.ndarray
+    _command_size: numpy.ndarray
+    _command_width: int
+    _gain: numpy.ndarray
+    _greedy_value: numpy.ndarray
+    _moves: numpy.ndarray
+    _wins: numpy.ndarray
+    _slot: numpy.ndarray
+    _visit_word: numpy.ndarray
+    _visit_bit: numpy.ndarray
+    _minigame: numpy.ndarray
+    _minigame_points: numpy.ndarray
+    _start_visited: numpy.ndarray
+
+    def __init__(self, state: GameState) -> None:
+        """Initialize a simulator of games starting from state, finding the graph of the game.
+
+        Preconditions:
+            - state.outcome is None
+            - state.pending is None
+        """
+
+        self._start = state
+        self._solver = RouteSolver(state)
+        graph = self._solver.reachable_transitions()
+        self.n_nodes = max(graph) + 1
+        self.width = max(1, max(len(transitions) for transitions in graph.values()))
+        size = self.n_nodes * self.width
+
+        self._next = numpy.zeros(size, dtype=numpy.int64)
+        self._n_transitions = numpy.zeros(self.n_nodes, dtype=numpy.int64)
+        self._gain = numpy.zeros(size, dtype=numpy.int64)
+        self._moves = numpy.zeros(size, dtype=numpy.int64)
+        self._wins = numpy.zeros(size, dtype=bool)
+        self._slot = numpy.full(size, -1, dtype=numpy.int64)
+        self._minigame = numpy.full(size, _NO_MINIGAME, dtype=numpy.int8)
+        self._minigame_points = numpy.zeros(size, dtype=numpy.int64)
+        self._greedy_value = numpy.full(size, -numpy.inf)
+
+        # the transitions of the same command are next to each other, since the solver plays each command once
+        commands_of = {node: [transition[0][0] for transition in transitions] for node, transitions in graph.items()}
+        self._command_width = max(1, max(len(set(commands)) for commands in commands_of.values()))
+        self._n_commands = numpy.zeros(self.n_nodes, dtype=numpy.int64)
+        self._command_first = numpy.zeros(self.n_nodes * self._command_width, dtype=numpy.int64)
+        self._command_size = numpy.zeros(self.n_nodes * self._command_width, dtype=numpy.int64)
+
+        for node, transitions in graph.items():
+            self._n_transitions[node] = len(transitions)
+            for i, command in enumerate(commands_of[node]):
+                if i == 0 or command != commands_of[node][i - 1]:
+                    group = node * self._command_width + self._n_commands[node]
+                    self._command_first[group] = i
+                    self._n_commands[node] += 1
+                self._command_size[group] += 1
+
+            for i, (_, next_node, slot, gain, moves, wins, minigame) in enumerate(transitions):
+                t = node * self.width + i
+                self._next[t] = next_node
+                self._moves[t] = moves
+                self._wins[t] = wins
+                self._slot[t] = slot
+                self._gain[t] = gain
+                chance = 0.0  # the chance of a player guessing at random to win the minigame
+                if isinstance(minigame, ShufflingDrawersGame):
+                    self._minigame[t] = _DRAWERS
+                    chance = 1 - (2 / 3) ** minigame.guesses_left if not minigame.won else 1 - (2 / 3) ** 3
+                elif isinstance(minigame, LyingBackpacksGame):
+                    self._minigame[t] = _BACKPACKS
+                    chance = 1 / 3
+                    self._gain[t] -= minigame.win_points if minigame.won else 0
+                if minigame is not None:
+                    self._minigame_points[t] = minigame.win_points
+                self._greedy_value[t] = numpy.inf if wins else self._gain[t] + chance * self._minigame_points[t]
+
+        visits = self._slot >= 0
+        self._visit_word = numpy.where(visits, self._slot // 64, 0)
+        self._visit_bit = numpy.where(visits, numpy.left_shift(numpy.uint64(1), (self._slot % 64).astype(numpy.uint64)),
+                                      numpy.uint64(0))
+
+        location_ids = state.game.all_location_ids()
+        self._start_visited = numpy.zeros((len(location_ids) + 63) // 64, dtype=numpy.uint64)
+        for slot, loc_id in enumerate(location_ids):
+            if state.game.get_location(loc_id).visited:
+                self._start_visited[slot // 64] |= numpy.uint64(1 << slot % 64)
+
+    def simulate(self, n_games: int, policy: str = RANDOM_WALK,
+                 rng: Optional[numpy.random.Generator] = None) -> MonteCarloResult:
+        """Play n_games games from the start state with every player following policy, and return their final
+        scores and whether they won. rng draws every random choice (a new unseeded generator if None).
+
+        Only the players still playing are kept in the arrays of each move: the ones whose game ended are taken
+        out of them.
+
+        Preconditions:
+            - n_games >= 1
+            - policy in {RANDOM_WALK, GREEDY, SOLVER}
+        """
+
+        if rng is None:
+            rng = numpy.random.default_rng()
+        route = self._route_choices() if policy == SOLVER else []
+        unlock_points = self._start.game.unlock_location_points
+        final_scores = numpy.full(n_games, self._start.player.score, dtype=numpy.int64)
+        won = numpy.zeros(n_games, dtype=bool)
+
+        # the players still playing, and their node, moves left, score and visited locations
+        players = numpy.arange(n_games) if self._n_transitions[0] > 0 else numpy.arange(0)
+        node = numpy.zeros(len(players), dtype=numpy.int64)
+        moves_left = numpy.full(len(players), self._start.player.moves_left, dtype=numpy.int64)
+        scores = numpy.full(len(players), self._start.player.score, dtype=numpy.int64)
+        visited = numpy.tile(self._start_visited, (len(players), 1))
+
+        for turn in range(len(route)) if policy == SOLVER else iter(int, 1):
+            if len(players) == 0:
+                break
+            if policy == SOLVER:
+                t = node * self.width + route[turn]
+            elif policy == GREEDY:
+                t = node * self.width + self._greedy_choices(rng, node, visited)
+            else:  # every command is equally likely, and so is every answer to it
+                draw = rng.random(len(players)) * self._n_commands[node]
+                command = draw.astype(numpy.int64)
+                group = node * self._command_width + command
+                # the fraction of the draw left after choosing the command chooses the answer
+                t = node * self.width + self._command_first[group] \
+                    + ((draw - command) * self._command_size[group]).astype(numpy.int64)
+
+            scores += self._gain[t]
+            moves_left += self._moves[t]
+            bits = self._visit_bit[t]
+            if visited.shape[1] == 1:
+                first = bits & ~visited[:, 0]
+                visited[:, 0] |= bits
+            else:
+                rows, words = numpy.arange(len(players)), self._visit_word[t]
+                first = bits & ~visited[rows, words]
+                visited[rows, words] |= bits
+            scores += (first != 0) * unlock_points
+
+            minigame = self._minigame[t]
+            drawers = numpy.flatnonzero(minigame == _DRAWERS)
+            if len(drawers) > 0:
+                scores[drawers] += self._minigame_points[t[drawers]] * simulate_drawers(rng, len(drawers))
+            backpacks = numpy.flatnonzero(minigame == _BACKPACKS)
+            if len(backpacks) > 0:
+                scores[backpacks] += self._minigame_points[t[backpacks]] * simulate_backpacks(
+                    rng, len(backpacks), policy == SOLVER)
+
+            node = self._next[t]
+            wins = self._wins[t]
+            over = wins | (moves_left <= 0) | (self._n_transitions[node] == 0)
+            if over.any():
+                final_scores[players[over]] = scores[over]
+                won[players[over]] = wins[over]
+                keep = ~over
+                players, node, moves_left, scores, visited = (
+                    players[keep], node[keep], moves_left[keep], scores[keep], visited[keep])
+
+        final_scores[players] = scores  # the players whose route ended before their game did
+        return MonteCarloResult(policy, final_scores, won)
+
+    def _greedy_choices(self, rng: numpy.random.Generator, node: numpy.ndarray,
+                        visited: numpy.ndarray) -> numpy.ndarray:
+        """Return the index of the transition each player at node chooses greedily, given the bitmasks of the
+        locations they visited.
+
+        Winning is worth more than anything else; otherwise a transition is worth its score plus the points of a
+        first visit and the expected points of its minigame (for a player guessing at random).
+        """
+
+        # the transitions are compared one index at a time, among the players whose node has that many, so that
+        # players at nodes with few transitions cost little
+        n_transitions = self._n_transitions[node]
+        best = numpy.zeros(len(node), dtype=numpy.int64)
+        best_value = numpy.full(len(node), -numpy.inf)
+        for i in range(self.width):
+            players = numpy.flatnonzero(n_transitions > i)
+            if len(players) == 0:
+                break
+            t = node[players] * self.width + i
+            bits = self._visit_bit[t]
+            if visited.shape[1] == 1:
+                first = bits & ~visited[players, 0]
+            else:
+                first = bits & ~visited[players, self._visit_word[t]]
+            value = self._greedy_value[t] + (first != 0) * self._start.game.unlock_location_points \
+                + rng.random(len(players)) * 1e-3  # ties are broken at random
+            better = value > best_value[players]
+            best[players[better]] = i
+            best_value[players[better]] = value[better]
+        return best
+
+    def _route_choices(self) -> list[int]:
+        """Return the index of the transition taken at each node of the route followed by the SOLVER policy."""
+
+        route = self._solver.shortest_win()
+        commands = (route if route is not None else self._solver.max_score_route()).commands
+        choices = []
+        node, i = 0, 0
+        while i < len(commands):
+            transitions = self._solver.transitions(node)
+            index = next(j for j, transition in enumerate(transitions)
+                         if list(transition[0]) == commands[i:i + len(transition[0])])
+            choices.append(index)
+            node = transitions[index][1]
+            i += len(transitions[index][0])
+        return choices
+
+
+if __name__ == "__main__":
+    # When you are ready to check your work with python_ta, uncomment the following lines.
+    # (Delete the "#" and space before each line.)
+    # IMPORTANT: keep this code indented inside the "if __name__ == '__main__'" block
+    import python_ta
+    python_ta.check_all(config={
+        'max-line-length': 120,
+        'disable': ['R1705', 'E9998', 'E9999']
+    })
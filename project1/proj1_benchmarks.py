@@ -0,0 +1,1175 @@
+"""CSC111 Project 1: Text Adventure Game - Benchmarks
+
+Instructions (READ THIS FIRST!)
+===============================
+
+This Python module contains timing and memory benchmarks for Project 1. Run it from the project1
+directory (so that game_data.json can be found) to print the measurements.
+
+Copyright and Usage Information
+===============================
+
+This file is provided solely for the personal and private use of students
+taking CSC111 at the University of Toronto St. George campus. All forms of
+distribution of this code, whether as given or with any changes, are
+expressly prohibited. For more information on copyright for CSC111 materials,
+please consult our Course Syllabus.
+
+This file is Copyright (c) 2025 CSC111 Teaching Team
+"""
+from __future__ import annotations
+import asyncio
+import difflib
+import functools
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import tempfile
+import time
+import tracemalloc
+from typing import Callable, Iterator, Optional
+import numpy
+import game_engine
+from adventure import AdventureGame, load_game_data, world_cache
+from distance_index import DistanceIndex
+from event_journal import FSYNC_ALWAYS, FSYNC_GROUP, FSYNC_NEVER, EventJournal, read_journal
+from game_entities import DROP_PREFIX, PICK_UP_PREFIX, Item, Location, Player, item_options
+from game_engine import WON, GameState, new_game, recover_game, step
+from game_server import PROMPT_MARK, GameServer
+from game_world import SessionState, WorldDefinition
+from instrumentation import Instrumentation, ProfileHook
+from monte_carlo import GREEDY, RANDOM_WALK, SOLVER, GameSimulator, simulate_backpacks, simulate_drawers
+from proj1_event_logger import Event, EventList
+from proj1_simulation import AdventureGameSimulation, simulate_batch
+from renderer import NullRenderer, Renderer
+from replay_cache import ReplayCache
+from replay_log import ReplayLog, ReplayLogWriter
+from route_solver import RouteSolver
+from world_generator import WORDS_FILE, write_world
+from world_loader import load_world, write_json_lines
+from world_store import LazyWorld, compile_world, index_filename
+
+# The time (in seconds) the RouteSolver may take for each of its searches on game_data.json
+ROUTE_SOLVER_TIME_LIMIT = 0.1
+
+# Recorded playthroughs used as the workload of the batch benchmarks
+BENCHMARK_PLAYTHROUGHS = [
+    ["go east", "go upstairs", "pick up: key", "go downstairs", "go east", "go east", "talk to sadia", "go north",
+     "go to dorm", "go downstairs", "go south", "go south", "pick up: mug", "go west", "go west", "go east",
+     "go south", "pick up: presto card", "get on the streetcar", "buy potion", "go back to campus", "go north",
+     "go west", "go north", "go west", "put down items to submit work"],
+    ["go east", "go east", "go east", "go north", "go south", "go west", "go west", "go west"] * 6
+    + ["go east", "go east"],
+    ["go east", "go east", "go east", "go south", "go north", "go under the bridge", "ford, ford, teleport"],
+    ["go east", "go upstairs", "pick up: key", "drop: key"],
+]
+
+# A complete winning playthrough, including the answers to the minigames
+WIN_PLAYTHROUGH = ["go east", "go upstairs", "pick up: key", "go downstairs", "go east", "go east", "talk to sadia",
+                   "go north", "go to dorm", "get usb drive", "2", "pick up: usb drive", "go downstairs", "go south",
+                   "go south", "pick up: mug", "go west", "go west", "go upstairs", "get laptop charger", "1", "1",
+                   "1", "pick up: laptop charger", "go downstairs", "go east", "go south", "pick up: presto card",
+                   "get on the streetcar", "buy potion", "go back to campus", "go north", "go west", "go north",
+                   "go west", "put down items to submit work"]
+
+
+def benchmark_batch_simulation(n_runs: int = 20000, worker_counts: tuple[int, ...] = (1, 2, 4)) -> dict[int, float]:
+    """Simulate n_runs recorded playthroughs with simulate_batch for each number of workers in worker_counts,
+    print the throughput and return a mapping from worker count to runs per second.
+
+    Preconditions:
+    - n_runs > 0
+    - all(count >= 1 for count in worker_counts)
+    """
+
+    command_lists = [BENCHMARK_PLAYTHROUGHS[i % len(BENCHMARK_PLAYTHROUGHS)] for i in range(n_runs)]
+    throughput = {}
+
+    for workers in worker_counts:
+        start = time.perf_counter()
+        simulate_batch('game_data.json', command_lists, max_workers=workers)
+        elapsed = time.perf_counter() - start
+
+        throughput[workers] = n_runs / elapsed
+        print(f"simulate_batch, {workers} worker(s): {n_runs} runs in {elapsed:.2f}s "
+              f"({throughput[workers]:.0f} runs/sec)")
+
+    return throughput
+
+
+def benchmark_step_throughput(n_games: int = 5000) -> float:
+    """Play WIN_PLAYTHROUGH n_games times through game_engine.step, print the throughput and return the number of
+    steps per second (including starting each game).
+
+    Preconditions:
+    - n_games > 0
+    """
+
+    start = time.perf_counter()
+    for _ in range(n_games):
+        state, _ = new_game()
+        for command in WIN_PLAYTHROUGH:
+            step(state, command)
+    elapsed = time.perf_counter() - start
+
+    steps_per_second = n_games * len(WIN_PLAYTHROUGH) / elapsed
+    print(f"step: {n_games} games in {elapsed:.2f}s ({steps_per_second:.0f} steps/sec)")
+    return steps_per_second
+
+
+async def _read_reply(reader: asyncio.StreamReader) -> bool:
+    """Read one reply of the game server from reader, and return whether it ended with a question (False if the
+    game ended instead)."""
+
+    while True:
+        line = await reader.readline()
+        if not line:
+            return False
+        if line.startswith(PROMPT_MARK.encode()):
+            return True
+
+
+async def _simulated_client(host: str, port: int, commands: list[str], latencies: list[float]) -> None:
+    """Play commands on the game server at host and port, appending the time (in seconds) between sending each
+    command and receiving its full reply to latencies."""
+
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        waiting = await _read_reply(reader)
+        for command in commands:
+            if not waiting:
+                break
+            start = time.perf_counter()
+            writer.write(command.encode() + b"\n")
+            waiting = await _read_reply(reader)
+            latencies.append(time.perf_counter() - start)
+    finally:
+        writer.close()
+
+
+async def _server_load(n_clients: int, commands: list[str],
+                       journal_directory: Optional[str] = None) -> tuple[list[float], float]:
+    """Start a game server on a free port (journaling its games to journal_directory, if not None), play commands
+    on it from n_clients simulated clients at once and return the command latencies and the total time (in
+    seconds)."""
+
+    server = await GameServer(journal_directory=journal_directory).start('localhost', 0)
+    port = server.sockets[0].getsockname()[1]
+    latencies = []
+    async with server:
+        start = time.perf_counter()
+        await asyncio.gather(*(_simulated_client('localhost', port, commands, latencies) for _ in range(n_clients)))
+        elapsed = time.perf_counter() - start
+    return latencies, elapsed
+
+
+def benchmark_server_load(n_clients: int = 1000, journaled: bool = False) -> dict[str, float]:
+    """Connect n_clients simulated players at once to a GameServer, each playing WIN_PLAYTHROUGH, and print and
+    return the p50 and p99 command latency (in milliseconds) and the number of sessions played per second on the
+    server's single core. If journaled, every game writes its journal to a temporary directory.
+
+    The clients run in the same process as the server, so they share its core and the figures are a lower bound.
+
+    Preconditions:
+    - n_clients >= 1
+    """
+
+    directory = tempfile.mkdtemp() if journaled else None
+    try:
+        latencies, elapsed = asyncio.run(_server_load(n_clients, WIN_PLAYTHROUGH, directory))
+    finally:
+        if directory is not None:
+            shutil.rmtree(directory)
+    percentiles = statistics.quantiles(latencies, n=100)
+    results = {'p50 (ms)': percentiles[49] * 1000, 'p99 (ms)': percentiles[98] * 1000,
+               'sessions/sec per core': n_clients / elapsed}
+
+    print(f"game server{' (journaled)' if journaled else ''}, {n_clients} concurrent clients, {len(latencies)} "
+          f"commands in {elapsed:.2f}s: p50 {results['p50 (ms)']:.2f}ms, p99 {results['p99 (ms)']:.2f}ms, "
+          f"{results['sessions/sec per core']:.0f} sessions/sec per core")
+    return results
+
+
+def _unslotted(cls: type) -> type:
+    """Return a copy of the slotted class cls whose instances store their attributes in a __dict__ instead,
+    i.e. the layout the entity classes had before they were slotted."""
+
+    namespace = {name: value for name, value in vars(cls).items()
+                 if name not in ('__slots__', '__dict__', '__weakref__') and name not in cls.__slots__}
+    return type(cls.__name__, (), namespace)
+
+
+def _copy_world(world: WorldDefinition, item_cls: type, location_cls: type) -> dict:
+    """Return a full per-session copy of world built from item_cls and location_cls objects, sharing every
+    string with world (how each game held its world before it was split into a shared definition and a
+    session overlay)."""
+
+    items = []
+    for item in world.items:
+        item_copy = item_cls(item.name, item.description, (item.start_position, item.target_position))
+        items.append(item_copy)
+
+    locations = {}
+    for slot, loc_id in enumerate(world.location_ids):
+        locations[loc_id] = location_cls((loc_id, world.names[slot]), world.descriptions[slot],
+                                         dict(world.commands[slot]),
+                                         [items[i] for i in world.initial_items[slot]])
+    return locations
+
+
+def _distance_index_operations(world: WorldDefinition, index: DistanceIndex,
+                               pairs: list[tuple[int, int]]) -> dict[str, tuple[Callable[[], object], int]]:
+    """Return the operations benchmark_distance_index times on index, the distance index of world: each runs on
+    pairs of slots (or only on the first thousandth of them, for updates) and is mapped to the number of
+    operations it does."""
+
+    updates = max(1, len(pairs) // 1000)
+    new_pairs = [(a, b) for a, b in pairs[:updates] if b not in world.target_slots(world.commands[a])]
+    return {
+        'distance (us)': (lambda: [index.distance(a, b) for a, b in pairs], len(pairs)),
+        'reachable_within (us)': (lambda: [index.reachable_within(a, 5) for a, _ in pairs], len(pairs)),
+        'add_edge + remove_edge (us)':
+            (lambda: [(index.add_edge(a, b), index.remove_edge(a, b)) for a, b in new_pairs], updates),
+        'copy + add_edge (us)': (lambda: [index.copy().add_edge(a, b) for a, b in new_pairs], updates),
+    }
+
+
+def _bytes_per_session(make_session: Callable[[], object], sessions: int) -> float:
+    """Return the average number of bytes allocated by each of sessions calls to make_session."""
+
+    tracemalloc.start()
+    start = tracemalloc.get_traced_memory()[0]
+    kept = [make_session() for _ in range(sessions)]
+    used = tracemalloc.get_traced_memory()[0] - start
+    tracemalloc.stop()
+    del kept
+    return used / sessions
+
+
+def synthetic_world_data(n_locations: int, n_items: int, item_locations: int = 0) -> dict:
+    """Return game data (in the format of game_data.json) for a world of n_locations locations connected in a
+    ring, with n_items items spread round-robin over the first item_locations locations (all of them if 0).
+
+    Preconditions:
+    - n_locations >= 2
+    - n_items >= 0
+    - 0 <= item_locations <= n_locations
+    """
+
+    item_locations = item_locations or n_locations
+    locations = [{"id": i, "name": f"Location {i}",
+                  "brief_description": f"You are at location {i}.", "long_description": f"This is location {i}.",
+                  "available_commands": {"go east": (i + 1) % n_locations, "go west": (i - 1) % n_locations},
+                  "items": []} for i in range(n_locations)]
+    items = []
+    for i in range(n_items):
+        position = i % item_locations
+        items.append({"name": f"item {i}", "description": f"Item number {i}.", "start_position": position,
+                      "target_position": 0})
+        locations[position]["items"].append(f"item {i}")
+
+    return {"locations": locations, "items": items}
+
+
+def write_world_file(data: dict) -> str:
+    """Write the given game data to a new temporary JSON file and return its filename."""
+
+    with tempfile.NamedTemporaryFile('w', suffix='.json', delete=False) as f:
+        json.dump(data, f)
+    return f.name
+
+
+def synthetic_world(n_locations: int, item_every: int = 100) -> WorldDefinition:
+    """Return a world of n_locations locations connected in a ring, with one item at every item_every-th
+    location.
+
+    Preconditions:
+    - n_locations >= 2
+    - item_every >= 1
+    """
+
+    filename = write_world_file(synthetic_world_data(n_locations, n_locations // item_every))
+    try:
+        return WorldDefinition(*load_game_data(filename))
+    finally:
+        os.remove(filename)
+
+
+def solver_world_data(n_locations: int, n_items: int) -> dict:
+    """Return game data for a world like synthetic_world_data's ring of n_locations locations, with n_items items
+    spread evenly around it, where every location also has a shortcut to a far away location, and the work can be
+    submitted at location 0.
+
+    Preconditions:
+    - n_locations >= 2
+    - 0 <= n_items <= n_locations
+    """
+
+    data = synthetic_world_data(n_locations, n_items)
+    for location in data["locations"]:
+        location["items"] = []
+    for i, item in enumerate(data["items"]):  # spread the items evenly around the ring
+        item["start_position"] = (i + 1) * n_locations // (n_items + 1)
+        data["locations"][item["start_position"]]["items"].append(item["name"])
+    for location in data["locations"]:
+        location["available_commands"]["take the shortcut"] = (location["id"] * 37 + n_locations // 2) % n_locations
+    data["locations"][0]["available_commands"]["put down items to submit work"] = 0
+    return data
+
+
+def benchmark_route_solver(sizes: tuple[int, ...] = (1000, 10000), n_items: int = 4) -> dict[str, tuple]:
+    """Print and return, for game_data.json and for a solver_world_data world of each size in sizes (with n_items
+    items the player must collect, and unlimited moves), the time (in seconds) the RouteSolver takes to find
+    the shortest winning route and then the max-score route, and the number of moves of each.
+
+    Preconditions:
+    - all(size >= n_items for size in sizes)
+    """
+
+    worlds = {'game_data.json': (None, None)}
+    for size in sizes:
+        worlds[f'{size} locations'] = (write_world_file(solver_world_data(size, n_items)),
+                                       [f"item {i}" for i in range(n_items)])
+    results = {}
+
+    for world_name, (filename, necessary_items) in worlds.items():
+        try:
+            if filename is None:
+                state, _ = new_game()
+            else:
+                state, _ = new_game(filename, 0, 10, necessary_items)
+                state.player.moves_left = 10 ** 6
+
+            solver = RouteSolver(state)
+            start = time.perf_counter()
+            shortest = solver.shortest_win()
+            middle = time.perf_counter()
+            if filename is not None:
+                state.player.moves_left = 50
+                solver = RouteSolver(state)
+            best = solver.max_score_route()
+            end = time.perf_counter()
+        finally:
+            if filename is not None:
+                os.remove(filename)
+
+        results[world_name] = (middle - start, shortest.moves, end - middle, best.moves, best.score)
+        print(f"route solver, {world_name}: shortest win ({shortest.moves} moves) in {middle - start:.3f}s, "
+              f"max score ({best.score} points in {best.moves} moves, exact: {best.exact}) in {end - middle:.3f}s")
+    return results
+
+
+def benchmark_route_solver_time_limit(time_limit: float = ROUTE_SOLVER_TIME_LIMIT,
+                                      repeats: int = 3) -> dict[str, float]:
+    """Print and return the fastest of repeats times (in seconds) the RouteSolver takes to find the shortest winning
+    route and the max-score route of game_data.json, each with a new solver, and assert that both are under
+    time_limit and that the max-score route is exact.
+
+    Preconditions:
+    - time_limit > 0
+    - repeats >= 1
+    """
+
+    state, _ = new_game()
+    searches = {'shortest_win (s)': RouteSolver.shortest_win, 'max_score_route (s)': RouteSolver.max_score_route}
+    results = {}
+    routes = {}
+    for name, search in searches.items():
+        times = []
+        for _ in range(repeats):
+            solver = RouteSolver(state)
+            start = time.perf_counter()
+            routes[name] = search(solver)
+            times.append(time.perf_counter() - start)
+        results[name] = min(times)
+
+    print("route solver, game_data.json: " + ", ".join(f"{name} {value:.3f}" for name, value in results.items())
+          + f" (limit {time_limit:.3f})")
+    assert all(value < time_limit for value in results.values()), f"the route solver took over {time_limit}s"
+    assert routes['max_score_route (s)'].exact, "the max-score route of game_data.json is not exact"
+    return results
+
+
+def benchmark_distance_index(sizes: tuple[int, ...] = (1000, 100000), queries: int = 100000) -> dict[str, dict]:
+    """Print and return, for game_data.json and for a solver_world_data world of each size in sizes, the time
+    (in seconds) to build the world's distance index, and the average time (in microseconds) of distance,
+    reachable_within (5 moves), of updating the index after a command is added and removed, and of copying the
+    index and adding a command to the copy (as a game does the first time its commands change).
+
+    Preconditions:
+    - all(size >= 2 for size in sizes)
+    - queries >= 1
+    """
+
+    worlds = {'game_data.json': world_cache.load('game_data.json')}
+    for size in sizes:
+        filename = write_world_file(solver_world_data(size, 0))
+        try:
+            worlds[f'{size} locations'] = WorldDefinition(*load_game_data(filename))
+        finally:
+            os.remove(filename)
+    results = {}
+
+    for world_name, world in worlds.items():
+        start = time.perf_counter()
+        index = world.distances()
+        results[world_name] = {'build (s)': time.perf_counter() - start}
+
+        n = len(world)
+        pairs = [((i * 7919) % n, (i * 104729) % n) for i in range(queries)]
+        for operation, (run, count) in _distance_index_operations(world, index, pairs).items():
+            start = time.perf_counter()
+            run()
+            results[world_name][operation] = (time.perf_counter() - start) / count * 1e6
+
+        print(f"distance index, {world_name} ({'exact' if index.exact else 'landmarks'}): "
+              + ", ".join(f"{operation} {value:.3f}" for operation, value in results[world_name].items()))
+    return results
+
+
+def benchmark_event_log(n_events: int = 100000, queries: int = 10000) -> dict[str, float]:
+    """Print and return the average time (in microseconds) of each event log operation on a log of n_events
+    events: adding and undoing an event, indexing, taking the last 10 events and getting the id log.
+
+    Preconditions:
+    - n_events >= 10
+    - queries >= 1
+    """
+
+    events = EventList()
+    start = time.perf_counter()
+    for i in range(n_events):
+        events.add_event(Event(i, "An event."), "go east")
+    results = {'add_event': (time.perf_counter() - start) / n_events * 1e6}
+
+    operations = {
+        'index': lambda: [events[i % n_events] for i in range(queries)],
+        'last 10 events': lambda: [events[-10:] for _ in range(queries)],
+        'get_id_log': lambda: [events.get_id_log() for _ in range(queries // 100 + 1)],
+        'remove_last_event + add_event':
+            lambda: [(events.remove_last_event(), events.add_event(Event(0, "Redone."), "go west"))
+                     for _ in range(queries)],
+    }
+    for operation, run in operations.items():
+        start = time.perf_counter()
+        count = len(run())
+        results[operation] = (time.perf_counter() - start) / count * 1e6
+
+    print(f"event log of {n_events} events (us): "
+          + ", ".join(f"{operation} {value:.3f}" for operation, value in results.items()))
+    return results
+
+
+def benchmark_event_journal(n_events: int = 1000000, group_size: int = 64) -> dict[str, float]:
+    """Print and return the append throughput (events per second) of an event log writing n_events events to a
+    journal with each fsync policy, the time (in seconds) to read the journal back, and the time (in
+    milliseconds) to recover a game by replaying the journal of WIN_PLAYTHROUGH.
+
+    FSYNC_ALWAYS waits for the disk after every event, so it only writes n_events // 1000 events.
+
+    Preconditions:
+    - n_events >= 1000
+    - group_size >= 1
+    """
+
+    directory = tempfile.mkdtemp()
+    commands = ["go east", "go west", "go north", "go south", "pick up: mug", "drop: mug"]
+    results = {}
+    try:
+        for policy, count in [(FSYNC_NEVER, n_events), (FSYNC_GROUP, n_events), (FSYNC_ALWAYS, n_events // 1000)]:
+            filename = os.path.join(directory, f'{policy}.journal')
+            journal = EventJournal(filename, group_size, policy)
+            events = EventList(journal)
+            start = time.perf_counter()
+            for i in range(count):
+                events.add_event(Event(i % 100, "An event."), commands[i % len(commands)])
+                if i % 10 == 9:
+                    events.remove_last_event()
+            journal.close()
+            results[f'append, fsync {policy} (events/s)'] = count / (time.perf_counter() - start)
+
+        start = time.perf_counter()
+        read_journal(os.path.join(directory, f'{FSYNC_GROUP}.journal'))
+        results[f'read {n_events} events (s)'] = time.perf_counter() - start
+
+        filename = os.path.join(directory, 'game.journal')
+        state, _ = new_game(journal=EventJournal(filename))
+        for command in WIN_PLAYTHROUGH:
+            step(state, command)  # the journal is closed when the game is won
+        start = time.perf_counter()
+        recovered = recover_game(filename)
+        results['recover a won game (ms)'] = (time.perf_counter() - start) * 1000
+        assert recovered.outcome == WON and recovered.player == state.player
+    finally:
+        shutil.rmtree(directory)
+
+    print("event journal: " + ", ".join(f"{name} {value:.3f}" for name, value in results.items()))
+    return results
+
+
+def benchmark_replay_log(n_sessions: int = 200000) -> dict[str, float]:
+    """Print and return the time (in seconds) to write n_sessions sessions to a replay log (cycling through the
+    events of BENCHMARK_PLAYTHROUGHS and WIN_PLAYTHROUGH) and to open it, and the time of scans over every event
+    with NumPy: the final score of every session, and how many events happened at each location.
+
+    Preconditions:
+    - n_sessions >= 1
+    """
+
+    playthroughs = [AdventureGameSimulation('game_data.json', 1, commands, 10).get_events()
+                    for commands in BENCHMARK_PLAYTHROUGHS + [WIN_PLAYTHROUGH]]
+    directory = tempfile.mkdtemp()
+    results = {}
+    try:
+        start = time.perf_counter()
+        writer = ReplayLogWriter(directory)
+        for session_id in range(n_sessions):
+            writer.add_session(session_id, playthroughs[session_id % len(playthroughs)])
+        writer.close()
+        results['write (s)'] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        log = ReplayLog(directory)
+        results['open (s)'] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        numpy.add.reduceat(log.columns['score_delta'], log.starts[:-1])
+        results['score of every session (s)'] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        numpy.bincount(log.columns['location'])
+        results['events per location (s)'] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for index in range(min(n_sessions, 10000)):
+            log.session(index)
+        results['session view (us)'] = (time.perf_counter() - start) / min(n_sessions, 10000) * 1e6
+        log.close()
+    finally:
+        shutil.rmtree(directory)
+
+    print(f"replay log of {n_sessions} sessions ({writer.n_rows} events): "
+          + ", ".join(f"{name} {value:.4f}" for name, value in results.items()))
+    return results
+
+
+def benchmark_monte_carlo(n_games: int = 1000000, seed: int = 111) -> dict[str, dict[str, float]]:
+    """Print and return, for the minigames and for whole games of game_data.json under each policy, the time (in
+    seconds) to simulate n_games games with NumPy, their win rate and their mean score.
+
+    Preconditions:
+    - n_games >= 1
+    """
+
+    rng = numpy.random.default_rng(seed)
+    results = {}
+    for name, play in [('shuffling drawers', lambda: simulate_drawers(rng, n_games)),
+                       ('lying backpacks', lambda: simulate_backpacks(rng, n_games))]:
+        start = time.perf_counter()
+        wins = play()
+        results[name] = {'time (s)': time.perf_counter() - start, 'win rate': float(wins.mean())}
+
+    state, _ = new_game()
+    start = time.perf_counter()
+    simulator = GameSimulator(state)
+    results['game graph'] = {'time (s)': time.perf_counter() - start, 'nodes': simulator.n_nodes}
+    for policy in (RANDOM_WALK, GREEDY, SOLVER):
+        start = time.perf_counter()
+        result = simulator.simulate(n_games, policy, rng)
+        results[policy] = {'time (s)': time.perf_counter() - start, 'win rate': result.win_rate(),
+                           'mean score': float(result.scores.mean())}
+
+    for name, values in results.items():
+        print(f"monte carlo, {name} ({n_games} games): "
+              + ", ".join(f"{key} {value:.4f}" for key, value in values.items()))
+    return results
+
+
+def benchmark_replay_cache(n_runs: int = 3000, seed: int = 111) -> dict[str, float]:
+    """Print and return the time (in seconds) to simulate n_runs command lists sharing their first commands, each
+    a prefix of WIN_PLAYTHROUGH followed by at most one other command, on new games seeded with seed, without and
+    with a ReplayCache, and the fraction of commands the cache did not have to play.
+
+    Preconditions:
+    - n_runs >= 1
+    """
+
+    rng = random.Random(seed)
+    command_lists = [WIN_PLAYTHROUGH[:rng.randint(1, len(WIN_PLAYTHROUGH))]
+                     + rng.choice([[], ["look"], ["go east"], ["undo"], ["1"]]) for _ in range(n_runs)]
+
+    start = time.perf_counter()
+    expected = [AdventureGameSimulation('game_data.json', 1, commands, 10, seed).result(run_id)
+                for run_id, commands in enumerate(command_lists)]
+    results = {'uncached': time.perf_counter() - start}
+
+    cache = ReplayCache('game_data.json')
+    start = time.perf_counter()
+    assert cache.simulate(command_lists, seed) == expected
+    results['cached'] = time.perf_counter() - start
+    results['reused'] = cache.steps_reused / (cache.steps_reused + cache.steps_played)
+
+    print(f"replay cache ({n_runs} runs): uncached {results['uncached']:.3f}s, cached {results['cached']:.3f}s "
+          f"({len(cache)} states stored, {results['reused']:.1%} of commands reused)")
+    return results
+
+
+def benchmark_item_lookups(n_items: int = 20000, n_locations: int = 1000, lookups: int = 100000) -> dict[str, float]:
+    """Print and return the time (in seconds) to load a world of n_items items, and the average time (in
+    microseconds) of each item lookup operation on it.
+
+    The items are spread over 10 locations, and the player carries 1000 of them.
+
+    Preconditions:
+    - n_items >= 1000
+    - n_locations >= 10
+    - lookups >= 1
+    """
+
+    filename = write_world_file(synthetic_world_data(n_locations, n_items, item_locations=10))
+    results = {}
+    try:
+        start = time.perf_counter()
+        load_game_data(filename)
+        results['load (s)'] = time.perf_counter() - start
+
+        game = AdventureGame(filename, 0, 10)
+        location = game.get_location(0)
+        player = Player()
+        player.inventory = [game.get_item(f"item {i}") for i in range(1, n_items, n_items // 1000)]
+        names = [f"item {(i * 7919) % n_items}" for i in range(lookups)]
+        location_names = [f"item {(i * 10) % n_items}" for i in range(lookups)]
+        inventory_names = [item.name for item in player.inventory]
+        last_item = location.get_item(location_names[-1])
+
+        operations = {
+            'AdventureGame.get_item (us)': lambda: [game.get_item(name) for name in names],
+            'Location.get_item (us)': lambda: [location.get_item(name) for name in location_names],
+            'Player.get_inventory_item (us)':
+                lambda: [player.get_inventory_item(inventory_names[i % 1000]) for i in range(lookups)],
+            'Location.remove_item + add_item (us)':
+                lambda: [(location.remove_item(last_item), location.add_item(last_item)) for _ in range(lookups)],
+        }
+        for operation, run in operations.items():
+            start = time.perf_counter()
+            run()
+            results[operation] = (time.perf_counter() - start) / lookups * 1e6
+    finally:
+        os.remove(filename)
+
+    for operation, value in results.items():
+        print(f"{n_items} items, {operation}: {value:.3f}")
+    return results
+
+
+def benchmark_session_memory(n_locations: int = 100000) -> dict[str, dict[str, float]]:
+    """Print and return the bytes used by each game session on game_data.json and on a synthetic world of
+    n_locations locations, for three layouts:
+        - dict: a full copy of the world per session, with __dict__-backed entities
+        - slots: a full copy of the world per session, with the slotted entities
+        - overlay: the shared WorldDefinition plus one SessionState per session
+
+    Each session also includes its Player.
+
+    Preconditions:
+    - n_locations >= 2
+    """
+
+    dict_item, dict_location, dict_player = _unslotted(Item), _unslotted(Location), _unslotted(Player)
+    worlds = {'game_data.json': (world_cache.load('game_data.json'), 1000),
+              f'synthetic ({n_locations} locations)': (synthetic_world(n_locations), 3)}
+    results = {}
+
+    for world_name, (world, sessions) in worlds.items():
+        layouts = {
+            'dict': lambda w=world: (_copy_world(w, dict_item, dict_location), dict_player()),
+            'slots': lambda w=world: (_copy_world(w, Item, Location), Player()),
+            'overlay': lambda w=world: (SessionState(w), Player()),
+        }
+        results[world_name] = {}
+        for layout, make_session in layouts.items():
+            per_session = _bytes_per_session(make_session, sessions)
+            results[world_name][layout] = per_session
+            print(f"{world_name}, {layout} layout: {per_session:,.0f} bytes per session")
+
+    return results
+
+
+def benchmark_undo_history(n_locations: int = 100000) -> dict[str, float]:
+    """Print and return the bytes kept per turn by the undo history of a game on a synthetic world of n_locations
+    locations, compared to the bytes of a full copy of its visited bits and item positions per turn, and the
+    average time (in microseconds) of a turn and of an undo.
+
+    The player walks east from the first location until they run out of moves, picking up the item lying at
+    every other location on the way.
+
+    Preconditions:
+    - n_locations >= 100
+    """
+
+    filename = write_world_file(synthetic_world_data(n_locations, 50, item_locations=50))
+    commands = [command for i in range(50) for command in (f"pick up: item {i}", "go east")
+                if i % 2 == 0 or command == "go east"]
+
+    def play(game_state: GameState) -> GameState:
+        """Play commands on game_state until the game ends, and return it."""
+        for command in commands:
+            if game_state.outcome is None:
+                step(game_state, command)
+        return game_state
+
+    state, _ = new_game(filename, 0, 10, seed=0)
+    start = time.perf_counter()
+    play(state)
+    turn_time = time.perf_counter() - start
+
+    traced, _ = new_game(filename, 0, 10, seed=0)
+    tracemalloc.start()
+    play(traced)
+    history_bytes = tracemalloc.get_traced_memory()[0]
+    traced.clear_history()
+    history_bytes -= tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    turns = len(state.log) - 1
+    full_copy = (n_locations + 7) // 8 + 4 * 50
+    state.outcome, state.game.ongoing = None, True  # so that the turns can be undone after running out of moves
+    start = time.perf_counter()
+    for _ in range(turns):
+        step(state, "undo")
+    undo_time = time.perf_counter() - start
+    os.remove(filename)
+
+    results = {'bytes per turn': history_bytes / turns, 'full copy bytes per turn': full_copy,
+               'turn (us)': turn_time / turns * 1e6, 'undo (us)': undo_time / turns * 1e6}
+    print(f"undo history ({n_locations} locations, {turns} turns): "
+          + ", ".join(f"{name} {value:,.1f}" for name, value in results.items()))
+    return results
+
+
+def benchmark_world_loading(sizes: tuple[int, ...] = (10000, 100000)) -> dict[str, dict[str, float]]:
+    """Print and return the time (in seconds) and the peak memory (in megabytes) of loading a synthetic world of
+    each number of locations in sizes (with one item per 10 locations), with the json.load loader
+    (adventure.load_game_data) and with the streaming loader, from a JSON file and from a JSON Lines file.
+
+    Preconditions:
+    - all(size >= 10 for size in sizes)
+    """
+
+    results = {}
+    for size in sizes:
+        filename = write_world_file(synthetic_world_data(size, size // 10))
+        jsonl_filename = filename + "l"
+        write_json_lines(filename, jsonl_filename)
+        loaders = {'json.load': (load_game_data, filename),
+                   'streaming JSON': (load_world, filename),
+                   'streaming JSON Lines': (load_world, jsonl_filename)}
+        for name, (loader, path) in loaders.items():
+            start = time.perf_counter()
+            loader(path)
+            load_time = time.perf_counter() - start
+            tracemalloc.start()
+            loader(path)
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            results[f'{size} locations, {name}'] = {'time (s)': load_time, 'peak (MB)': peak / 1e6}
+            print(f"world loading, {size} locations, {name}: {load_time:.3f}s, peak {peak / 1e6:.1f} MB")
+        os.remove(filename)
+        os.remove(jsonl_filename)
+    return results
+
+
+def benchmark_lazy_world(n_locations: int = 300000, n_moves: int = 10000) -> dict[str, float]:
+    """Print and return the time (in seconds) and the memory (in megabytes) of opening a JSON Lines synthetic world
+    of n_locations locations eagerly (world_loader.load_world) and as a LazyWorld, with its index missing and then
+    current, and the average time (in microseconds) of a move of a game walking n_moves moves east on the
+    LazyWorld, with the number of locations it hydrated.
+
+    Preconditions:
+    - n_locations >= 2
+    - n_moves >= 1
+    """
+
+    filename = write_world_file(synthetic_world_data(n_locations, n_locations // 100))
+    jsonl_filename = filename + "l"
+    write_json_lines(filename, jsonl_filename)
+    os.remove(filename)
+    results = {}
+
+    openers = {'eager': lambda: WorldDefinition(*load_world(jsonl_filename)),
+               'lazy, building the index': lambda: LazyWorld(jsonl_filename),
+               'lazy, index current': lambda: LazyWorld(jsonl_filename)}
+    for name, open_world in openers.items():
+        tracemalloc.start()
+        start = time.perf_counter()
+        world = open_world()
+        results[f'{name} (s)'] = time.perf_counter() - start
+        results[f'{name} (MB)'] = tracemalloc.get_traced_memory()[0] / 1e6
+        tracemalloc.stop()
+        del world
+
+    world = LazyWorld(jsonl_filename)
+    session = SessionState(world)
+    slot = 0
+    start = time.perf_counter()
+    for _ in range(n_moves):
+        session.set_visited(slot, True)
+        slot = world.target_slots(session.commands_at(slot))[0]
+    results['move (us)'] = (time.perf_counter() - start) / n_moves * 1e6
+    results['hydrations'] = world.hydrations
+
+    os.remove(jsonl_filename)
+    os.remove(index_filename(jsonl_filename))
+    print(f"lazy world ({n_locations} locations): "
+          + ", ".join(f"{name} {value:,.3f}" for name, value in results.items()))
+    return results
+
+
+def benchmark_compiled_world(sizes: tuple[int, ...] = (14, 10000, 100000)) -> dict[str, dict[str, float]]:
+    """Print and return the time (in milliseconds) of compiling a world of each number of locations in sizes, and of
+    starting a game of it (with the world cache empty) from its JSON file and from its compiled file. A world of 14
+    locations is game_data.json, any other size a synthetic world with one item per 100 locations.
+
+    Preconditions:
+    - all(size >= 2 for size in sizes)
+    """
+
+    results = {}
+    for size in sizes:
+        if size == 14:
+            filename, initial_location_id = 'game_data.json', 1
+        else:
+            filename, initial_location_id = write_world_file(synthetic_world_data(size, size // 100)), 0
+        compiled_filename = os.path.join(tempfile.gettempdir(), f"benchmark_{size}.ddw")
+        start = time.perf_counter()
+        compile_world(filename, compiled_filename)
+        result = {'compile (ms)': (time.perf_counter() - start) * 1000}
+        for name, path in (('JSON', filename), ('compiled', compiled_filename)):
+            world_cache.invalidate()
+            start = time.perf_counter()
+            AdventureGame(path, initial_location_id, 10).get_location()
+            result[f'{name} startup (ms)'] = (time.perf_counter() - start) * 1000
+        world_cache.invalidate()
+        results[f'{size} locations'] = result
+        print(f"compiled world, {size} locations: "
+              + ", ".join(f"{name} {value:.2f}" for name, value in result.items()))
+        if filename != 'game_data.json':
+            os.remove(filename)
+        os.remove(compiled_filename)
+    return results
+
+
+def _play_walk(game_data_file: str, seed: int, walks: Iterator[list[str]]) -> GameState:
+    """Play the next walk of walks (see _random_walk) in a new game of game_data_file seeded with seed, and return
+    the game."""
+
+    game_state, _ = new_game(game_data_file, necessary_items=[], seed=seed)
+    for command in next(walks):
+        step(game_state, command)
+    return game_state
+
+
+def _random_walk(world: WorldDefinition, rng: random.Random, n_moves: int) -> list[str]:
+    """Return the commands of a walk of n_moves random moves from the first location of a generated world, only
+    taking the "go to" commands (see world_generator)."""
+
+    slot, commands = 0, []
+    for _ in range(n_moves):
+        command = rng.choice([command for command in world.commands[slot] if command.startswith("go to ")])
+        commands.append(command)
+        slot = world.slot_of(world.commands[slot][command])
+    return commands
+
+
+def benchmark_scaling(sizes: tuple[int, ...] = (10, 1000, 100000, 1000000), seed: int = 111,
+                      results_file: str = 'scaling_results.json', n_steps: int = 2000,
+                      n_sessions: int = 200, n_simulations: int = 200) -> dict[str, dict[str, float]]:
+    """Measure the game on a world generated from seed (see world_generator) of each number of locations in sizes,
+    with one item per 100 locations, print the results and write them to results_file as JSON.
+
+    For each world, the results are the time (in seconds) of generating it, and of loading it from its JSON file
+    and from its compiled file (see world_store.compile_world) with the world cache empty; the mean, median and
+    99th percentile latency (in microseconds) of n_steps game_engine.step moves, in games walking at random; the
+    memory (in kilobytes) of each of n_sessions games after 20 moves; and the number of AdventureGameSimulation
+    runs of 40 random moves, and of their events, per second. Steps, games and simulations use the compiled world.
+
+    Preconditions:
+    - all(size >= 2 for size in sizes)
+    - n_steps >= 1 and n_sessions >= 1 and n_simulations >= 1
+    """
+
+    results = {}
+    rng = random.Random(seed)
+    for size in sizes:
+        filename = os.path.join(tempfile.gettempdir(), f"scaling_{size}.json")
+        compiled_filename = os.path.join(tempfile.gettempdir(), f"scaling_{size}.ddw")
+        start = time.perf_counter()
+        write_world(filename, size, max(1, size // 100), seed)
+        result = {'generate (s)': time.perf_counter() - start}
+
+        world_cache.invalidate()
+        start = time.perf_counter()
+        AdventureGame(filename, 1, 10)
+        result['load JSON (s)'] = time.perf_counter() - start
+        world_cache.invalidate()
+        compile_world(filename, compiled_filename)
+        start = time.perf_counter()
+        AdventureGame(compiled_filename, 1, 10)
+        result['load compiled (s)'] = time.perf_counter() - start
+        world = world_cache.load(compiled_filename)
+
+        latencies = []
+        while len(latencies) < n_steps:
+            state, _ = new_game(compiled_filename, necessary_items=[], seed=seed)
+            for command in _random_walk(world, rng, 49):
+                start = time.perf_counter()
+                step(state, command)
+                latencies.append(time.perf_counter() - start)
+        latencies = [latency * 1e6 for latency in latencies[:n_steps]]
+        result['step mean (us)'] = statistics.fmean(latencies)
+        result['step median (us)'] = statistics.median(latencies)
+        result['step p99 (us)'] = statistics.quantiles(latencies, n=100)[98]
+
+        walks = iter([_random_walk(world, rng, 20) for _ in range(n_sessions)])
+        result['session (KB)'] = _bytes_per_session(functools.partial(_play_walk, compiled_filename, seed, walks),
+                                                    n_sessions) / 1000
+
+        walks = [_random_walk(world, rng, 40) for _ in range(n_simulations)]
+        start = time.perf_counter()
+        n_events = sum(len(AdventureGameSimulation(compiled_filename, 1, walk, 10, seed).get_events())
+                       for walk in walks)
+        elapsed = time.perf_counter() - start
+        result['simulations per second'] = n_simulations / elapsed
+        result['events per second'] = n_events / elapsed
+
+        world_cache.invalidate()
+        os.remove(filename)
+        os.remove(compiled_filename)
+        results[f'{size} locations'] = result
+        print(f"scaling, {size} locations: " + ", ".join(f"{name} {value:,.2f}" for name, value in result.items()))
+
+    with open(results_file, 'w', encoding='utf-8') as file:
+        json.dump({'python': platform.python_version(), 'seed': seed, 'results': results}, file, indent=2)
+    return results
+
+
+def benchmark_instrumentation(n_games: int = 3000) -> dict[str, float]:
+    """Play WIN_PLAYTHROUGH n_games times through game_engine.step without instrumentation, with an
+    Instrumentation, and with an Instrumentation with a ProfileHook attached, and print and return the average time
+    (in microseconds) of a step in each case.
+
+    Preconditions:
+    - n_games > 0
+    """
+
+    results = {}
+    for name in ('off', 'on', 'on, profiled'):
+        instruments = None if name == 'off' else Instrumentation()
+        if name == 'on, profiled':
+            instruments.attach(ProfileHook())
+        start = time.perf_counter()
+        for _ in range(n_games):
+            state, _ = new_game(seed=111, instruments=instruments)
+            for command in WIN_PLAYTHROUGH:
+                step(state, command)
+        results[name] = (time.perf_counter() - start) / (n_games * len(WIN_PLAYTHROUGH)) * 1e6
+        print(f"instrumentation {name}: {results[name]:.1f}us per step")
+    return results
+
+
+def benchmark_rendering(n_games: int = 2000) -> dict[str, float]:
+    """Play WIN_PLAYTHROUGH n_games times, showing every turn on a line-buffered stream to os.devnull, and print and
+    return the average time (in microseconds) of showing a turn: printing each line on its own with the menu built
+    every turn (as the game used to), with a Renderer (one write per turn, menus cached) and with a NullRenderer.
+
+    Preconditions:
+    - n_games > 0
+    """
+
+    results = {}
+    with open(os.devnull, 'w', buffering=1, encoding='utf-8') as stream:
+        for name in ('print per line', 'Renderer', 'NullRenderer'):
+            elapsed = 0.0
+            turns = 0
+            for _ in range(n_games):
+                state, events = new_game(seed=111)
+                renderer = NullRenderer() if name == 'NullRenderer' else Renderer(stream)
+                for command in WIN_PLAYTHROUGH + [None]:
+                    start = time.perf_counter()
+                    if name == 'print per line':
+                        for line in Renderer().render(state, events)[0].splitlines():
+                            print(line, file=stream)
+                    else:
+                        renderer.show(state, events)
+                    elapsed += time.perf_counter() - start
+                    turns += 1
+                    if command is not None:
+                        state, events = step(state, command)
+            results[name] = elapsed / turns * 1e6
+            print(f"rendering, {name}: {results[name]:.2f}us per turn")
+    return results
+
+
+def benchmark_option_sets(item_counts: tuple[int, ...] = (10, 100, 500), n_rounds: int = 2000) -> dict[int, dict]:
+    """Print and return the average time (in microseconds) of validating a command at a location holding each
+    number of items in item_counts: building the list of pick up and drop commands every turn and searching it (as
+    the game used to), compiling the dispatch table again whenever the game's items change, and looking the
+    command up in the cached option sets of the location and the player (GameState.command).
+
+    Each of n_rounds rounds picks up an item, walks east and back, drops the item, looks around and enters an
+    invalid command, so the items of the location and the inventory change twice per round.
+
+    Preconditions:
+    - all(count > 0 for count in item_counts)
+    - n_rounds > 0
+    """
+
+    results = {}
+    for count in item_counts:
+        rounds = [[f"pick up: item {i % count}", "go east", "go west", f"drop: item {i % count}", "look",
+                   "pick up: nothing"] for i in range(n_rounds)]
+        filename = write_world_file(synthetic_world_data(4, count, item_locations=1))
+        results[count] = {}
+        for name in ('list per turn', 'table per change', 'option sets'):
+            state, _ = new_game(filename, 0, 10, seed=0)
+            state.player.moves_left = 3 * n_rounds
+            table, table_key = {}, ()
+            elapsed = 0.0
+            for round_commands in rounds:
+                for command in round_commands:
+                    start = time.perf_counter()
+                    location, player = state.game.get_location(), state.player
+                    if name == 'list per turn':
+                        pick_drop = ([f"pick up: {item.name}" for item in location.items]
+                                     + [f"drop: {item.name}" for item in player.inventory])
+                        valid = (command in location.available_commands or command in pick_drop
+                                 or command in game_engine.commands.menu_commands)
+                    elif name == 'table per change':
+                        key = (state.game.current_location_id, state.game.state_version(), player.inventory_version)
+                        if key != table_key:
+                            table = game_engine.commands.compile(location.available_commands,
+                                                                 item_options(PICK_UP_PREFIX, location.items),
+                                                                 item_options(DROP_PREFIX, player.inventory))
+                            table_key = key
+                        valid = command in table
+                    else:
+                        valid = state.command(command) is not None
+                    elapsed += time.perf_counter() - start
+                    if valid:
+                        step(state, command)
+            results[count][name] = elapsed / (n_rounds * len(rounds[0])) * 1e6
+        os.remove(filename)
+        print(f"option sets ({count} items at the location): "
+              + ", ".join(f"{name} {value:.2f}us" for name, value in results[count].items()))
+    return results
+
+
+def benchmark_command_matching(sizes: tuple[int, ...] = (100, 1000, 10000), queries: int = 1000,
+                               seed: int = 111) -> dict[int, dict[str, float]]:
+    """Print and return the average time (in microseconds) of matching mistyped commands at a location with each
+    number of available commands in sizes, with GameState.match and by scanning every command (str.startswith for
+    prefixes and difflib.get_close_matches for typos), along with the time (in milliseconds) of building the
+    location's tries and the average time of adding a command to the location and matching it (which updates the
+    tries rather than building them again).
+
+    Half of the queries are a prefix of a command missing its last three characters, and half are a command with
+    one character replaced.
+
+    Preconditions:
+    - all(size > 0 for size in sizes)
+    - queries > 0
+    """
+
+    rng = random.Random(seed)
+    with open(WORDS_FILE, encoding='utf-8') as file:
+        words = sorted({line.strip().lower() for line in file if line.strip()})
+
+    results = {}
+    for size in sizes:
+        names = set()
+        while len(names) < size:
+            names.add(f"{rng.choice(words)} {rng.choice(words)}")
+        available = {f"go to {name}": 1 for name in sorted(names)}
+        data = {"locations": [{"id": 0, "name": "Crossroads", "brief_description": "", "long_description": "",
+                               "available_commands": available, "items": []},
+                              {"id": 1, "name": "Elsewhere", "brief_description": "", "long_description": "",
+                               "available_commands": {"go back": 0}, "items": []}], "items": []}
+        filename = write_world_file(data)
+        state, _ = new_game(filename, 0, 10, seed=seed)
+        os.remove(filename)
+
+        targets = rng.sample(sorted(available), min(queries, size))
+        typed = []
+        for i, target in enumerate(targets):
+            if i % 2 == 0:
+                typed.append(target[:-3])
+            else:
+                j = rng.randrange(6, len(target))
+                typed.append(target[:j] + ("x" if target[j] != "x" else "y") + target[j + 1:])
+
+        start = time.perf_counter()
+        state.match("go to")
+        build = time.perf_counter() - start
+
+        start = time.perf_counter()
+        matched = sum(state.match(text) == target for text, target in zip(typed, targets))
+        trie = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for i, text in enumerate(typed):
+            if i % 2 == 0:
+                _ = [command for command in available if command.startswith(text)]
+            else:
+                difflib.get_close_matches(text, available, n=2, cutoff=0.9)
+        scan = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for i in range(100):
+            state.game.add_location_command(0, f"go to new place {i}", 1)
+            state.match(f"go to new place {i}")
+        update = time.perf_counter() - start
+
+        results[size] = {'trie (us)': trie / len(typed) * 1e6, 'scan (us)': scan / len(typed) * 1e6,
+                         'build (ms)': build * 1e3, 'update (us)': update / 100 * 1e6,
+                         'matched': matched / len(typed)}
+        print(f"command matching ({size} commands): "
+              + ", ".join(f"{name} {value:,.2f}" for name, value in results[size].items()))
+    return results
+
+
+if __name__ == "__main__":
+    # When you are ready to check your work with python_ta, uncomment the following lines.
+    # (Delete the "#" and space before each line.)
+    # IMPORTANT: keep this code indented inside the "if __name__ == '__main__'" block
+    # import python_ta
+    # python_ta.check_all(config={
+    #     'max-line-length': 120,
+    #     'disable': ['R1705', 'E9998', 'E9999']
+    # })
+
+    benchmark_batch_simulation()
+    benchmark_step_throughput()
+    benchmark_server_load()
+    benchmark_server_load(journaled=True)
+    benchmark_route_solver()
+    benchmark_route_solver_time_limit()
+    benchmark_distance_index()
+    benchmark_event_log()
+    benchmark_event_journal()
+    benchmark_replay_log()
+    benchmark_monte_carlo()
+    benchmark_replay_cache()
+    benchmark_undo_history()
+    benchmark_world_loading()
+    benchmark_lazy_world()
+    benchmark_compiled_world()
+    benchmark_scaling()
+    benchmark_instrumentation()
+    benchmark_rendering()
+    benchmark_option_sets()
+    benchmark_command_matching()
+    benchmark_session_memory()
+    benchmark_item_lookups()
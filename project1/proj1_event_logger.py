@@ -22,8 +22,10 @@ This file is Copyright (c) 2025 CSC111 Teaching Team
 """
 
 from __future__ import annotations
+from collections.abc import Iterator
 from dataclasses import dataclass
 from typing import Optional
+from event_journal import EventJournal
 from game_entities import Item
 
 
@@ -39,6 +41,7 @@ class Event:
     - next: Event object representing the next event in the game, or None if this is the last game event
     - prev: Event object representing the previous event in the game, None if this is the first game event
     - item_involved: Item involved in this event, None if no item is changed.
+    - score: the player's score at the end of the turn that led to this event
     """
 
     id_num: int
@@ -47,43 +50,87 @@ class Event:
     next: Optional[Event] = None
     prev: Optional[Event] = None
     item_involved: Optional[Item] = None
+    score: int = 0
 
 
 class EventList:
     """
-    A linked list of game events.
+    A list of game events, in the order they happened.
+
+    The events are also linked to each other through their next and prev attributes, so callers can still walk
+    the list from self.first, but the events are stored in an array: adding or undoing an event, and looking
+    one up by its index, take O(1) time, and the log of location ids is kept up to date as events are added.
 
     Instance Attributes:
         - first: first event node of the EventList, None if EventList is empty
         - last: last event node of the EventList, None if EventList is empty
+        - journal: the journal every event added to or removed from this list is written to, or None
 
     Representation Invariants:
         - self.first is None == self.last is None
+
+    >>> events = EventList()
+    >>> for id_num, command in [(1, None), (2, "go east"), (3, "go north")]:
+    ...     events.add_event(Event(id_num, f"Location {id_num}"), command)
+    >>> len(events), events[1].id_num, [event.id_num for event in events[-2:]]
+    (3, 2, [2, 3])
+    >>> events.remove_last_event()
+    >>> events.get_id_log(), events.display_events(), events.last.next is None
+    ([1, 2], [(1, 'go east'), (2, None)], True)
     """
-    first: Optional[Event]
-    last: Optional[Event]
 
-    def __init__(self) -> None:
-        """Initialize a new empty event list."""
+    journal: Optional[EventJournal]
+
+    # Private Instance Attributes:
+    #   - _events: the events of this list, in order
+    #   - _id_log: the location id of each event of this list, in order
+    _events: list[Event]
+    _id_log: list[int]
+
+    def __init__(self, journal: Optional[EventJournal] = None) -> None:
+        """Initialize a new empty event list, writing its events to journal if it is not None."""
+
+        self.journal = journal
+        self._events = []
+        self._id_log = []
+
+    @property
+    def first(self) -> Optional[Event]:
+        """Return the first event of this list, or None if it is empty."""
+
+        return self._events[0] if self._events else None
+
+    @property
+    def last(self) -> Optional[Event]:
+        """Return the last event of this list, or None if it is empty."""
 
-        self.first = None
-        self.last = None
+        return self._events[-1] if self._events else None
+
+    def __len__(self) -> int:
+        """Return the number of events in this list."""
+
+        return len(self._events)
+
+    def __getitem__(self, index: int | slice) -> Event | list[Event]:
+        """Return the event at index (counting from the end if negative), or a list of the events in the slice
+        index, e.g. events[-5:] for the last five events."""
+
+        return self._events[index]
+
+    def __iter__(self) -> Iterator[Event]:
+        """Return an iterator over the events of this list, in order."""
+
+        return iter(self._events)
 
     def display_events(self) -> list[tuple]:
         """Display all events in chronological order."""
-        event_lst = []
 
-        curr = self.first
-        while curr:
-            event_lst.append((curr.id_num, curr.next_command))
-            curr = curr.next
-
-        return event_lst
+        return [(event.id_num, event.next_command) for event in self._events]
 
     def is_empty(self) -> bool:
         """Return whether this event list is empty."""
 
-        return self.first is None
+        return not self._events
 
     def add_event(self, event: Event, command: str = None) -> None:
         """Add the given new event to the end of this event list.
@@ -91,39 +138,50 @@ class EventList:
         event in the game.
         """
 
-        if self.first is None:
-            self.first = event
-            self.last = event
-        else:
-            self.last.next_command = command
-            self.last.next = event
-            event.prev = self.last
-            self.last = event
+        if self._events:
+            last = self._events[-1]
+            last.next_command = command
+            last.next = event
+            event.prev = last
+        self._events.append(event)
+        self._id_log.append(event.id_num)
+        if self.journal is not None:
+            self.journal.record_event(event.id_num, command,
+                                      None if event.item_involved is None else event.item_involved.name)
 
     def remove_last_event(self) -> None:
         """Remove the last event from this event list.
         If the list is empty, do nothing."""
 
-        if self.first is None:
+        if not self._events:
             return
-        elif self.first.next is None:
+        elif len(self._events) == 1:
             print("You cannot undo the first event.")
         else:
-            self.last = self.last.prev
-            self.last.next = None
-            self.last.next_command = None
+            removed = self._events.pop()
+            self._id_log.pop()
+            removed.prev = None
+            last = self._events[-1]
+            last.next = None
+            last.next_command = None
+            if self.journal is not None:
+                self.journal.record_undo()
 
     def get_id_log(self) -> list[int]:
         """Return a list of all location IDs visited for each event in this list, in sequence."""
 
-        ids_so_far = []
-        curr = self.first
+        return list(self._id_log)
 
-        while curr is not None:
-            ids_so_far.append(curr.id_num)
-            curr = curr.next
+    def copy(self) -> EventList:
+        """Return a copy of this list, with its own copies of the events, that writes to no journal."""
 
-        return ids_so_far
+        other = EventList()
+        command = None
+        for event in self._events:
+            other.add_event(Event(event.id_num, event.description, item_involved=event.item_involved,
+                                  score=event.score), command)
+            command = event.next_command
+        return other
 
 
 if __name__ == "__main__":
@@ -22,57 +22,61 @@ please consult our Course Syllabus.
 This file is Copyright (c) 2025 CSC111 Teaching Team
 """
 from __future__ import annotations
-from proj1_event_logger import Event, EventList
-from adventure import AdventureGame
-from game_entities import Location
+import hashlib
+import random
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Optional, TextIO
+from adventure import world_cache
+from proj1_event_logger import EventList
+from game_engine import GameState, WON, new_game, step
+from instrumentation import Instrumentation
 
 
 class AdventureGameSimulation:
     """A simulation of an adventure game playthrough.
     """
     # Private Instance Attributes:
-    #   - _game: The AdventureGame instance that this simulation uses.
+    #   - _state: The state of the game that this simulation plays.
     #   - _events: A collection of the events to process during the simulation.
-    _game: AdventureGame
+    #   - _seed: The seed of the game's random number generator, or None if it was seeded randomly.
+    _state: GameState
     _events: EventList
+    _seed: Optional[int]
 
     def __init__(self, game_data_file: str, initial_location_id: int, commands: list[str],
-                 unlock_location_points: int) -> None:
+                 unlock_location_points: int, seed: Optional[int] = None,
+                 instruments: Optional[Instrumentation] = None) -> None:
         """Initialize a new game simulation based on the given game data, that runs through the given commands.
+        The game's minigames are played with a random number generator seeded with seed (randomly if None), and
+        its turns are recorded by instruments if it is not None.
 
         Preconditions:
         - len(commands) > 0
-        - all commands in the given list are valid commands at each associated location in the game
+        - all commands in the given list are valid commands (or answers to the game's questions) at each
+          associated location in the game
         """
-        self._events = EventList()
-        self._game = AdventureGame(game_data_file, initial_location_id, unlock_location_points)
+        self._state, _ = new_game(game_data_file, initial_location_id, unlock_location_points, seed=seed,
+                                  instruments=instruments)
+        self._events = self._state.log
+        self._seed = seed
 
-        initial_location = self._game.get_location()
-        initial_location_id_desc = initial_location.descriptions[1]
-        first_event = Event(id_num=initial_location_id,
-                            description=initial_location_id_desc)
+        self.generate_events(commands=commands)
 
-        self._events.add_event(event=first_event, command=None)
-
-        self.generate_events(commands=commands, current_location=initial_location)
-
-    def generate_events(self, commands: list[str], current_location: Location) -> None:
-        """Generate all events in this simulation.
+    def generate_events(self, commands: list[str]) -> None:
+        """Generate all events in this simulation, by playing the commands until the game ends.
 
         Preconditions:
         - len(commands) > 0
-        - all commands in the given list are valid commands at each associated location in the game
+        - all commands in the given list are valid commands (or answers to the game's questions) at each
+          associated location in the game
         """
 
         for command in commands:
-            next_location_id = current_location.available_commands[command]
-            next_location_id_desc = self._game.get_location(next_location_id).descriptions[1]
-
-            next_event = Event(id_num=next_location_id,
-                               description=next_location_id_desc)
-            self._events.add_event(event=next_event, command=command)
-
-            current_location = self._game.get_location(next_location_id)
+            if self._state.outcome is not None:
+                break
+            step(self._state, command)
 
     def get_id_log(self) -> list[int]:
         """
@@ -82,19 +86,142 @@ class AdventureGameSimulation:
 
         return self._events.get_id_log()
 
-    def run(self) -> None:
-        """Run the game simulation and log location descriptions."""
-        print("==========BEGIN SIMULATION==========")
+    def get_events(self) -> EventList:
+        """Return the events of this simulation."""
+
+        return self._events
+
+    def result(self, run_id: int = 0) -> SimulationResult:
+        """Return a compact summary of this simulation, labelled with the given run_id."""
+
+        return SimulationResult(run_id=run_id,
+                                id_log=self._events.get_id_log(),
+                                score=self._state.player.score,
+                                moves_left=self._state.player.moves_left,
+                                won=self._state.outcome == WON,
+                                seed=self._seed)
+
+    def run(self, stream: Optional[TextIO] = None) -> None:
+        """Run the game simulation and log location descriptions to stream (sys.stdout if None), in one write."""
+        lines = ["==========BEGIN SIMULATION=========="]
         current_event = self._events.first  # Start from the first event in the list
 
         while current_event:
-            print(current_event.description)
+            lines.append(current_event.description)
             if current_event is not self._events.last:
-                print("You choose:", current_event.next_command)
+                lines.append(f"You choose: {current_event.next_command}")
 
             # Move to the next event in the linked list
             current_event = current_event.next
-        print("==========END OF SIMULATION==========")
+        lines.append("==========END OF SIMULATION==========")
+
+        stream = sys.stdout if stream is None else stream
+        stream.write("".join(line + "\n" for line in lines))
+        stream.flush()
+
+
+@dataclass
+class SimulationResult:
+    """The compact outcome of one headless simulation run.
+
+    Instance Attributes:
+        - run_id: index of the run's command list in the batch it came from
+        - id_log: the location ids of every event of the run, in order
+        - score: the player's score at the end of the run
+        - moves_left: the number of moves the player had left at the end of the run
+        - won: whether the run ended by submitting the work with every required item
+        - seed: the seed of the run's random numbers, to play it again exactly, or None if it was seeded randomly
+
+    Representation Invariants:
+        - self.run_id >= 0
+        - self.moves_left >= 0
+    """
+
+    run_id: int
+    id_log: list[int]
+    score: int
+    moves_left: int
+    won: bool
+    seed: Optional[int] = None
+
+
+# The game settings (under 'settings') and the instrumentation recording the turns (under 'instruments', None if
+# there is none) of every run in this worker process, recorded by _init_worker
+_WORKER: dict[str, Any] = {}
+
+
+def _init_worker(game_data_file: str, initial_location_id: int, unlock_location_points: int,
+                 instruments: Optional[Instrumentation] = None) -> None:
+    """Record the game settings (and instrumentation) of this worker process and parse its world into the world
+    cache once."""
+
+    _WORKER['settings'] = (game_data_file, initial_location_id, unlock_location_points)
+    _WORKER['instruments'] = instruments
+    world_cache.load(game_data_file)
+
+
+def run_seed(seed: int, run_id: int) -> int:
+    """Return the seed of the run with id run_id in a batch seeded with seed: a 63-bit hash of both, so that the
+    runs of a batch draw unrelated random numbers and any one of them can be played again on its own.
+
+    >>> run_seed(111, 0) == run_seed(111, 0) != run_seed(111, 1)
+    True
+    """
+
+    digest = hashlib.blake2b(f"{seed}:{run_id}".encode(), digest_size=8).digest()
+    return int.from_bytes(digest, 'little') >> 1
+
+
+def batch_seed(seed: Optional[int]) -> int:
+    """Return seed, or a random seed if it is None, as the seed of a batch of runs."""
+
+    return random.SystemRandom().getrandbits(63) if seed is None else seed
+
+
+def _run_headless(job: tuple[int, list[str], int]) -> SimulationResult:
+    """Simulate one (run_id, commands, seed) job on a fresh game of this worker, without printing anything."""
+
+    run_id, commands, seed = job
+    game_data_file, initial_location_id, unlock_location_points = _WORKER['settings']
+    sim = AdventureGameSimulation(game_data_file, initial_location_id, commands, unlock_location_points, seed=seed,
+                                  instruments=_WORKER['instruments'])
+    return sim.result(run_id)
+
+
+def simulate_batch(game_data_file: str, command_lists: list[list[str]], initial_location_id: int = 1,
+                   unlock_location_points: int = 10, max_workers: Optional[int] = None,
+                   chunksize: int = 64, instruments: Optional[Instrumentation] = None,
+                   seed: Optional[int] = None) -> list[SimulationResult]:
+    """Simulate every command list in command_lists headlessly and return their results in the same order.
+
+    The run with id run_id is seeded with run_seed(seed, run_id), recorded in its result, so a batch plays the
+    same way for the same seed (with any number of workers) and each run can be played again on its own. If seed
+    is None, a random one is drawn.
+
+    The runs are spread over a pool of max_workers processes (one per CPU if None). Each worker parses
+    game_data_file once into its world cache and plays each run on a fresh copy of that world. With
+    max_workers == 1 the runs are simulated in this process instead, and their turns are recorded by instruments
+    if it is not None (hooks attached to it, such as an instrumentation.ProfileHook, see every run).
+
+    Preconditions:
+    - all(len(commands) > 0 for commands in command_lists)
+    - all commands in each list are valid commands at each associated location in the game
+    - max_workers is None or max_workers >= 1
+    - chunksize >= 1
+    - instruments is None or max_workers == 1
+    """
+
+    seed = batch_seed(seed)
+    jobs = [(run_id, commands, run_seed(seed, run_id)) for run_id, commands in enumerate(command_lists)]
+
+    if max_workers == 1:
+        _init_worker(game_data_file, initial_location_id, unlock_location_points, instruments)
+        return [_run_headless(job) for job in jobs]
+
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker,
+                             initargs=(game_data_file, initial_location_id, unlock_location_points,
+                                       instruments)) as executor:
+        return list(executor.map(_run_headless, jobs, chunksize=chunksize))
 
 
 if __name__ == "__main__":
@@ -160,7 +287,7 @@ if __name__ == "__main__":
 
     # demo for score
     score_demo = ["go east", "go east", "go east", "go south", "go north", "go under the bridge",
-                  "ford, ford, teleport"]
+                  "ford, ford, teleport", "10"]
 
     expected_log_score = [1, 2, 4, 8, 9, 8, 10, 10]  # expected score: 80
 
@@ -170,9 +297,9 @@ if __name__ == "__main__":
     assert expected_log_score == score_sim.get_id_log()
 
     # demo of special event - teleport
-    teleportation_demo = ["go east", "go east", "go east", "go under the bridge", "ford, ford, teleport"]
+    teleportation_demo = ["go east", "go east", "go east", "go under the bridge", "ford, ford, teleport", "10"]
 
-    expected_log_teleportation = [1, 2, 4, 8, 10, 10]  # next user input determines which place to teleport
+    expected_log_teleportation = [1, 2, 4, 8, 10, 10]  # the answer after the command is where to teleport
 
     teleportation_sim = AdventureGameSimulation('game_data.json',
                                                 1, teleportation_demo, 10)
@@ -0,0 +1,145 @@
+"""CSC111 Project 1: Text Adventure Game - Renderer
+
+Instructions (READ THIS FIRST!)
+===============================
+
+This Python module contains the renderers of Project 1, which show the output of each turn of a
+ game to the player. A Renderer builds the whole output of a turn as one string and writes it at
+ once, reusing the menu text of a location until its commands or items (or the player's
+ inventory) change. A NullRenderer shows nothing, for games played without a player.
+ Please consult the project handout for instructions and details.
+
+Copyright and Usage Information
+===============================
+
+This file is provided solely for the personal and private use of students
+taking CSC111 at the University of Toronto St. George campus. All forms of
+distribution of this code, whether as given or with any changes, are
+expressly prohibited. For more information on copyright for CSC111 materials,
+please consult our Course Syllabus.
+
+This file is Copyright (c) 2025 CSC111 Teaching Team
+"""
+from __future__ import annotations
+import sys
+from typing import Optional, TextIO
+import game_engine
+from game_engine import GameState, OutputEvent
+
+# The question asked when the player must enter a regular command
+ACTION_QUESTION = "Enter action:"
+
+
+class Renderer:
+    """A renderer of the turns of one game, writing the output of each turn to a text stream in one write.
+
+    Instance Attributes:
+        - stream: the stream the output is written to (sys.stdout if None)
+        - writes: the number of turns written so far
+
+    Representation Invariants:
+        - self.writes >= 0
+    """
+
+    stream: Optional[TextIO]
+    writes: int
+
+    # Private Instance Attributes:
+    #   - _menu_commands: the line listing the menu commands
+    #   - _menus: the (location version, inventory version) each location's menu text was built for, and the text
+    _menu_commands: str
+    _menus: dict[int, tuple[tuple[int, int], str]]
+
+    def __init__(self, stream: Optional[TextIO] = None) -> None:
+        """Initialize a renderer writing to stream (to sys.stdout if None) that has not written anything yet."""
+
+        self.stream = stream
+        self.writes = 0
+        self._menu_commands = "What to do? Choose from: " + ", ".join(game_engine.commands.menu_commands)
+        self._menus = {}
+
+    def render(self, state: GameState, events: list[OutputEvent], header: str = "") -> tuple[str, Optional[str]]:
+        """Return the text showing header and then events to the player, and the question the player must answer
+        next, or None if the game is over.
+
+        The text ends with the menu of the current location (the menu commands and every action available there)
+        when the player must enter a regular command, unless the last command was invalid.
+        """
+
+        lines = [header] if header else []
+        question = ACTION_QUESTION
+        for event in events:
+            if event.kind == game_engine.ITEM_DESCRIPTION:
+                lines.append(f"Item description: {event.text}")
+            elif event.kind == game_engine.LOCATION:
+                lines.append("==========")
+                lines.append(f"Location {event.location_id}: {state.game.get_location(event.location_id).name}")
+                lines.append(event.text)
+            elif event.kind == game_engine.PROMPT:
+                question = event.text
+            else:
+                lines.append(event.text)
+
+        if state.outcome is not None:
+            question = None
+        elif state.pending is None and (not events or events[0].kind != game_engine.INVALID):
+            lines.append(self._menu(state))
+        return "".join(line + "\n" for line in lines), question
+
+    def _menu(self, state: GameState) -> str:
+        """Return the menu text of the current location of state, building it only if the location's commands or
+        items, or the player's inventory, changed since it was last built."""
+
+        key = (state.game.get_location().version, state.player.inventory_version)
+        cached = self._menus.get(state.game.current_location_id)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        lines = ["", self._menu_commands, "At this location, you can also:"]
+        lines.extend("- " + action for action in game_engine.available_actions(state))
+        if not state.player.inventory:
+            lines.append("No drop options available.")
+        text = "\n".join(lines)
+        self._menus[state.game.current_location_id] = (key, text)
+        return text
+
+    def show(self, state: GameState, events: list[OutputEvent], header: str = "") -> Optional[str]:
+        """Write the text showing header and events to the player (see render) in one write, flush the stream, and
+        return the question the player must answer next, or None if the game is over."""
+
+        text, question = self.render(state, events, header)
+        stream = sys.stdout if self.stream is None else self.stream
+        stream.write(text)
+        stream.flush()
+        self.writes += 1
+        return question
+
+
+class NullRenderer(Renderer):
+    """A renderer that shows nothing, for games played without a player (such as replays and benchmarks)."""
+
+    def render(self, state: GameState, events: list[OutputEvent], header: str = "") -> tuple[str, Optional[str]]:
+        """Return no text, and the question the player must answer next, or None if the game is over."""
+
+        if state.outcome is not None:
+            return "", None
+        for event in reversed(events):
+            if event.kind == game_engine.PROMPT:
+                return "", event.text
+        return "", ACTION_QUESTION
+
+    def show(self, state: GameState, events: list[OutputEvent], header: str = "") -> Optional[str]:
+        """Write nothing, and return the question the player must answer next, or None if the game is over."""
+
+        return self.render(state, events, header)[1]
+
+
+if __name__ == "__main__":
+    # When you are ready to check your work with python_ta, uncomment the following lines.
+    # (Delete the "#" and space before each line.)
+    # IMPORTANT: keep this code indented inside the "if __name__ == '__main__'" block
+    import python_ta
+    python_ta.check_all(config={
+        'max-line-length': 120,
+        'disable': ['R1705', 'E9998', 'E9999']
+    })
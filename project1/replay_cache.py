@@ -0,0 +1,195 @@
+"""CSC111 Project 1: Text Adventure Game - Replay Cache
+
+Instructions (READ THIS FIRST!)
+===============================
+
+This Python module contains the replay cache for Project 1. A replay cache keeps the game states
+ reached by playing command lists, so that simulations sharing their first commands with earlier
+ ones only play the commands that differ.
+ Please consult the project handout for instructions and details.
+
+Copyright and Usage Information
+===============================
+
+This file is provided solely for the personal and private use of students
+taking CSC111 at the University of Toronto St. George campus. All forms of
+distribution of this code, whether as given or with any changes, are
+expressly prohibited. For more information on copyright for CSC111 materials,
+please consult our Course Syllabus.
+
+This file is Copyright (c) 2025 CSC111 Teaching Team
+"""
+from __future__ import annotations
+from typing import Optional
+from adventure import world_cache
+from game_engine import WON, GameState, new_game, step
+from proj1_simulation import SimulationResult
+
+
+class _PrefixNode:
+    """A command prefix in a replay cache's trie.
+
+    Instance Attributes:
+        - children: the node of each command played after this prefix
+        - state: the state reached by playing this prefix, if it is stored
+    """
+
+    __slots__ = ('children', 'state')
+    children: dict[str, _PrefixNode]
+    state: Optional[GameState]
+
+    def __init__(self, state: Optional[GameState] = None) -> None:
+        """Initialize a new node without children, storing state."""
+
+        self.children = {}
+        self.state = state
+
+
+class ReplayCache:
+    """A cache of the game states reached by playing command lists from new games, shared by every list starting
+    with the same commands.
+
+    The states are stored in a trie of commands with one root per (world digest, seed): a new game of the same world
+    with the same seed, given the same commands, always reaches the same state, since its minigames draw from its
+    own seeded random number generator, which is copied with the state. Playing a command list resumes from a copy
+    of the state stored for its longest stored prefix and plays only the commands after it, storing the states it
+    reaches (every snapshot_every commands, while no prompt is waiting for an answer) for later lists. Once
+    max_states states are stored, no more are. If the data file changes, its new world has a new digest, so states
+    of the old world are never resumed.
+
+    Instance Attributes:
+        - game_data_file: the data file of the games played
+        - initial_location_id: the id of the location the games start at
+        - unlock_location_points: the points for visiting a new location in the games
+        - snapshot_every: the number of commands played between stored states
+        - max_states: the maximum number of states stored
+        - steps_played: the number of commands played so far
+        - steps_reused: the number of commands not played because their state was stored
+
+    Representation Invariants:
+        - self.snapshot_every >= 1
+        - self.max_states >= 0
+
+    >>> cache = ReplayCache('game_data.json')
+    >>> commands = ["go east", "go upstairs", "pick up: key", "go downstairs"]
+    >>> cache.play(commands, seed=1).game.current_location_id
+    2
+    >>> cache.play(commands + ["go east"], seed=1).game.current_location_id
+    4
+    >>> cache.steps_played, cache.steps_reused
+    (5, 4)
+    """
+
+    game_data_file: str
+    initial_location_id: int
+    unlock_location_points: int
+    snapshot_every: int
+    max_states: int
+    steps_played: int
+    steps_reused: int
+
+    # Private Instance Attributes:
+    #   - _roots: the root of the trie of each (world digest, seed)
+    #   - _n_states: the number of states stored
+    _roots: dict[tuple[str, int], _PrefixNode]
+    _n_states: int
+
+    def __init__(self, game_data_file: str = 'game_data.json', initial_location_id: int = 1,
+                 unlock_location_points: int = 10, snapshot_every: int = 1, max_states: int = 100000) -> None:
+        """Initialize a new empty replay cache of games with the given settings.
+
+        Preconditions:
+            - game_data_file is the filename of a valid game data JSON file
+            - snapshot_every >= 1
+            - max_states >= 0
+        """
+
+        self.game_data_file = game_data_file
+        self.initial_location_id = initial_location_id
+        self.unlock_location_points = unlock_location_points
+        self.snapshot_every = snapshot_every
+        self.max_states = max_states
+        self.steps_played = 0
+        self.steps_reused = 0
+        self._roots = {}
+        self._n_states = 0
+
+    def __len__(self) -> int:
+        """Return the number of states stored in this cache."""
+
+        return self._n_states
+
+    def _root(self, seed: int) -> _PrefixNode:
+        """Return the root of the trie of the current world of self.game_data_file with seed, creating it (and
+        storing a new game) if needed."""
+
+        key = (world_cache.load(self.game_data_file).digest(), seed)
+        if key not in self._roots:
+            state, _ = new_game(self.game_data_file, self.initial_location_id, self.unlock_location_points,
+                                seed=seed)
+            self._roots[key] = _PrefixNode(state)
+        return self._roots[key]
+
+    def play(self, commands: list[str], seed: int) -> GameState:
+        """Return the state of a new game, seeded with seed, after playing commands until the game ends.
+
+        The state returned belongs to the caller, and its log writes to no journal.
+
+        Preconditions:
+            - all commands in the given list are valid commands (or answers to the game's questions) at each
+              associated location in the game
+        """
+
+        node = resume = self._root(seed)
+        resume_depth = 0
+        for depth, command in enumerate(commands, 1):
+            node = node.children.get(command)
+            if node is None:
+                break
+            if node.state is not None:
+                resume, resume_depth = node, depth
+
+        state = resume.state.copy()
+        self.steps_reused += resume_depth
+        node = resume
+        for depth in range(resume_depth, len(commands)):
+            if state.outcome is not None:
+                break
+            step(state, commands[depth])
+            self.steps_played += 1
+            if self._n_states >= self.max_states:
+                continue
+            if commands[depth] not in node.children:
+                node.children[commands[depth]] = _PrefixNode()
+            node = node.children[commands[depth]]
+            if node.state is None and state.pending is None and (depth + 1) % self.snapshot_every == 0:
+                node.state = state.copy()
+                self._n_states += 1
+        return state
+
+    def simulate(self, command_lists: list[list[str]], seed: int) -> list[SimulationResult]:
+        """Return the result of playing each command list in command_lists on a new game seeded with seed, in the
+        same order (see proj1_simulation.simulate_batch).
+
+        Preconditions:
+            - all commands in each list are valid commands at each associated location in the game
+        """
+
+        results = []
+        for run_id, commands in enumerate(command_lists):
+            state = self.play(commands, seed)
+            results.append(SimulationResult(run_id=run_id, id_log=state.log.get_id_log(), score=state.player.score,
+                                            moves_left=state.player.moves_left, won=state.outcome == WON,
+                                            seed=seed))
+        return results
+
+
+if __name__ == "__main__":
+    # When you are ready to check your work with python_ta, uncomment the following lines.
+    # (Delete the "#" and space before each line.)
+    # IMPORTANT: keep this code indented inside the "if __name__ == '__main__'" block
+    import python_ta
+    python_ta.check_all(config={
+        'max-line-length': 120,
+        'disable': ['R1705', 'E9998', 'E9999']
+    })
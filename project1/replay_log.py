@@ -0,0 +1,284 @@
+"""CSC111 Project 1: Text Adventure Game - Replay Log
+
+Instructions (READ THIS FIRST!)
+===============================
+
+This Python module contains the columnar replay log for Project 1. A replay log stores the event
+ lists of many playthroughs (sessions) as columns of integers, one file per column, so that they
+ can be memory-mapped and scanned with NumPy without creating any Python objects per event.
+ Please consult the project handout for instructions and details.
+
+Copyright and Usage Information
+===============================
+
+This file is provided solely for the personal and private use of students
+taking CSC111 at the University of Toronto St. George campus. All forms of
+distribution of this code, whether as given or with any changes, are
+expressly prohibited. For more information on copyright for CSC111 materials,
+please consult our Course Syllabus.
+
+This file is Copyright (c) 2025 CSC111 Teaching Team
+"""
+from __future__ import annotations
+import json
+import mmap
+import os
+import sys
+from array import array
+from collections.abc import Iterator
+from contextlib import ExitStack
+from typing import Optional
+import numpy
+from proj1_event_logger import EventList
+from proj1_simulation import AdventureGameSimulation, batch_seed, run_seed
+
+# The columns of a replay log, each with one int32 per event:
+#   - session: the id of the session the event belongs to
+#   - step: the index of the event in its session
+#   - location: the id of the event's location
+#   - command: the string id of the command that led to the event, -1 for the first event of a session
+#   - item: the string id of the item involved in the event, -1 if there is none
+#   - score_delta: how much the player's score changed with the event
+COLUMNS = ("session", "step", "location", "command", "item", "score_delta")
+
+# The name of the file describing a replay log, in its directory
+META_FILE = "meta.json"
+
+# The name of the file with the first row of each session (and the number of rows at the end), as int64s
+STARTS_FILE = "starts.i64"
+
+# The name of the file with the seed of the random numbers of each session (NO_SEED if unknown), as int64s
+SEEDS_FILE = "seeds.i64"
+NO_SEED = -1
+
+
+class ReplayLogWriter:
+    """A writer of a new replay log, one session at a time.
+
+    Instance Attributes:
+        - directory: the directory the replay log is written to
+        - seed: the seed of the batch of sessions written, or None if unknown
+        - n_rows: the number of events written so far
+        - n_sessions: the number of sessions written so far
+    """
+
+    directory: str
+    seed: Optional[int]
+    n_rows: int
+    n_sessions: int
+
+    # Private Instance Attributes:
+    #   - _stack: the exit stack closing the files of the columns
+    #   - _files: the file each column is written to, in the order of COLUMNS
+    #   - _starts: the first row of each session written so far
+    #   - _seeds: the seed of each session written so far
+    #   - _string_ids: the string id of each command and item name written so far
+    _stack: ExitStack
+    _files: list
+    _starts: array
+    _seeds: array
+    _string_ids: dict[str, int]
+
+    def __init__(self, directory: str, seed: Optional[int] = None) -> None:
+        """Start writing a new replay log to directory, creating it if needed and replacing any replay log in it,
+        of a batch of sessions seeded with seed (None if unknown).
+
+        The description of any replay log already in directory is removed first, so that until close is called,
+        the directory does not hold a replay log ReplayLog can open.
+        """
+
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.seed = seed
+        self.n_rows = 0
+        self.n_sessions = 0
+        try:
+            os.remove(os.path.join(directory, META_FILE))
+        except FileNotFoundError:
+            pass
+        with ExitStack() as stack:
+            self._files = [stack.enter_context(open(os.path.join(directory, name + ".i32"), 'wb'))
+                           for name in COLUMNS]
+            self._stack = stack.pop_all()
+        self._starts = array('q')
+        self._seeds = array('q')
+        self._string_ids = {}
+
+    def _string_id(self, string: Optional[str]) -> int:
+        """Return the string id of string, or -1 if it is None."""
+
+        if string is None:
+            return -1
+        return self._string_ids.setdefault(string, len(self._string_ids))
+
+    def add_session(self, session_id: int, events: EventList, seed: Optional[int] = None) -> None:
+        """Write the events of one session, with the given id and the seed of its random numbers (None if unknown),
+        after the sessions written so far."""
+
+        columns = [array('i') for _ in COLUMNS]
+        session, steps, locations, commands, items, score_deltas = columns
+        command, score = None, 0
+        for i, event in enumerate(events):
+            session.append(session_id)
+            steps.append(i)
+            locations.append(event.id_num)
+            commands.append(self._string_id(command))
+            items.append(-1 if event.item_involved is None else self._string_id(event.item_involved.name))
+            score_deltas.append(event.score - score)
+            command, score = event.next_command, event.score
+
+        for file, column in zip(self._files, columns):
+            column.tofile(file)
+        self._starts.append(self.n_rows)
+        self._seeds.append(NO_SEED if seed is None else seed)
+        self.n_rows += len(events)
+        self.n_sessions += 1
+
+    def abort(self) -> None:
+        """Stop writing the replay log without finishing it, closing its column files. The sessions written so far
+        are left in the directory, but without the description ReplayLog needs to open them."""
+
+        self._stack.close()
+
+    def close(self) -> None:
+        """Finish writing the replay log."""
+
+        self._stack.close()
+        self._starts.append(self.n_rows)
+        with open(os.path.join(self.directory, STARTS_FILE), 'wb') as file:
+            self._starts.tofile(file)
+        with open(os.path.join(self.directory, SEEDS_FILE), 'wb') as file:
+            self._seeds.tofile(file)
+        with open(os.path.join(self.directory, META_FILE), 'w', encoding='utf-8') as file:
+            json.dump({'n_rows': self.n_rows, 'n_sessions': self.n_sessions, 'byteorder': sys.byteorder,
+                       'seed': self.seed, 'strings': list(self._string_ids)}, file)
+
+
+class ReplayLog:
+    """A replay log opened for reading, with its columns memory-mapped as NumPy arrays.
+
+    The arrays are views of the files' pages, not copies: scanning a column reads the file through the page cache,
+    and slicing one (as session does) copies nothing.
+
+    Instance Attributes:
+        - directory: the directory of the replay log
+        - strings: the command and item names, indexed by their string id
+        - seed: the seed of the batch of sessions in the log, or None if unknown
+        - starts: the first row of each session, followed by the number of rows
+        - seeds: the seed of the random numbers of each session, or NO_SEED if unknown
+        - columns: the array of each column, by name
+
+    Representation Invariants:
+        - set(self.columns) == set(COLUMNS)
+        - all(len(column) == self.starts[-1] for column in self.columns.values())
+    """
+
+    directory: str
+    strings: list[str]
+    seed: Optional[int]
+    starts: numpy.ndarray
+    seeds: numpy.ndarray
+    columns: dict[str, numpy.ndarray]
+
+    # Private Instance Attributes:
+    #   - _maps: the memory maps of the files of the columns and of starts
+    _maps: list[mmap.mmap]
+
+    def __init__(self, directory: str) -> None:
+        """Open the replay log in directory.
+
+        Preconditions:
+            - directory contains a replay log written by ReplayLogWriter on a machine with the same byte order
+        """
+
+        self.directory = directory
+        with open(os.path.join(directory, META_FILE), encoding='utf-8') as file:
+            meta = json.load(file)
+        if meta['byteorder'] != sys.byteorder:
+            raise ValueError(f"the replay log in {directory} was written with another byte order")
+        self.strings = meta['strings']
+        self.seed = meta['seed']
+
+        self._maps = []
+        self.starts = self._map(STARTS_FILE, numpy.int64)
+        self.seeds = self._map(SEEDS_FILE, numpy.int64)
+        self.columns = {name: self._map(name + ".i32", numpy.int32) for name in COLUMNS}
+
+    def _map(self, filename: str, dtype: type) -> numpy.ndarray:
+        """Return the contents of filename, in the replay log's directory, as a read-only memory-mapped array."""
+
+        with open(os.path.join(self.directory, filename), 'rb') as file:
+            if os.fstat(file.fileno()).st_size == 0:  # an empty file cannot be mapped
+                return numpy.zeros(0, dtype)
+            self._maps.append(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ))
+        return numpy.frombuffer(self._maps[-1], dtype)
+
+    def __len__(self) -> int:
+        """Return the number of sessions in this replay log."""
+
+        return len(self.starts) - 1
+
+    def session(self, index: int) -> dict[str, numpy.ndarray]:
+        """Return the columns of the events of the index-th session, as views of the columns of this log."""
+
+        start, end = self.starts[index], self.starts[index + 1]
+        return {name: column[start:end] for name, column in self.columns.items()}
+
+    def __iter__(self) -> Iterator[dict[str, numpy.ndarray]]:
+        """Return an iterator over the columns of the events of each session, in order."""
+
+        return (self.session(index) for index in range(len(self)))
+
+    def close(self) -> None:
+        """Close the memory maps of this log. The arrays of this log must not be used afterwards."""
+
+        self.columns = {name: numpy.zeros(0, numpy.int32) for name in COLUMNS}
+        self.starts = numpy.zeros(1, numpy.int64)
+        self.seeds = numpy.zeros(0, numpy.int64)
+        for memory_map in self._maps:
+            try:
+                memory_map.close()
+            except BufferError:  # a view of the map is still alive: the map is closed when it is collected
+                pass
+        self._maps = []
+
+
+def export_simulations(directory: str, game_data_file: str, command_lists: list[list[str]],
+                       initial_location_id: int = 1, unlock_location_points: int = 10,
+                       seed: Optional[int] = None) -> None:
+    """Simulate every command list in command_lists and write their events to a new replay log in directory, the
+    session id of each being its index in command_lists.
+
+    As in proj1_simulation.simulate_batch, each session is seeded with run_seed(seed, session id), and a random
+    seed is drawn if seed is None. The seeds are written to the log (see ReplayLog.seed and ReplayLog.seeds).
+
+    If a simulation raises an error, the log is left unfinished (see ReplayLogWriter.abort) and the error is raised.
+
+    Preconditions:
+        - all(len(commands) > 0 for commands in command_lists)
+        - all commands in each list are valid commands at each associated location in the game
+    """
+
+    seed = batch_seed(seed)
+    writer = ReplayLogWriter(directory, seed=seed)
+    try:
+        for session_id, commands in enumerate(command_lists):
+            session_seed = run_seed(seed, session_id)
+            sim = AdventureGameSimulation(game_data_file, initial_location_id, commands, unlock_location_points,
+                                          seed=session_seed)
+            writer.add_session(session_id, sim.get_events(), session_seed)
+    except BaseException:
+        writer.abort()
+        raise
+    writer.close()
+
+
+if __name__ == "__main__":
+    # When you are ready to check your work with python_ta, uncomment the following lines.
+    # (Delete the "#" and space before each line.)
+    # IMPORTANT: keep this code indented inside the "if __name__ == '__main__'" block
+    import python_ta
+    python_ta.check_all(config={
+        'max-line-length': 120,
+        'disable': ['R1705', 'E9998', 'E9999']
+    })
@@ -0,0 +1,724 @@
+"""CSC111 Project 1: Text Adventure Game - Route Solver
+
+Instructions (READ THIS FIRST!)
+===============================
+
+This Python module contains a solver for Project 1 that finds the shortest winning route and the
+ highest-scoring route from any state of a game. The solver plays the game itself (through
+ game_engine.step) on copies of the state, so it follows exactly the same rules as the player.
+ Please consult the project handout for instructions and details.
+
+Copyright and Usage Information
+===============================
+
+This file is provided solely for the personal and private use of students
+taking CSC111 at the University of Toronto St. George campus. All forms of
+distribution of this code, whether as given or with any changes, are
+expressly prohibited. For more information on copyright for CSC111 materials,
+please consult our Course Syllabus.
+
+This file is Copyright (c) 2025 CSC111 Teaching Team
+"""
+from __future__ import annotations
+import dataclasses
+from dataclasses import dataclass
+from heapq import heappop, heappush
+from typing import Optional
+from distance_index import UNREACHABLE
+import game_engine
+from game_engine import (HOTDOG_COMMAND, HOTDOG_MOVES, LAPTOP_CHARGER_COMMAND, SUBMIT_COMMAND, TELEPORT_COMMAND,
+                         USB_DRIVE_COMMAND, WON, GameState, TeleportPrompt, moves_at_least, step)
+from game_entities import Player
+from minigames import LyingBackpacksGame, Prompt, ShufflingDrawersGame
+from proj1_event_logger import EventList
+
+# The moves_left given to the games the solver plays, so that they never run out of moves (the solver counts the
+# player's real moves itself)
+_UNLIMITED_MOVES = 10 ** 9
+
+
+@dataclass
+class Route:
+    """A sequence of commands played from some game state.
+
+    Instance Attributes:
+        - commands: the commands to enter, including the answers to the questions the game asks
+        - moves: the number of moves the route takes
+        - score: the player's score at the end of the route, counting only the points the route is sure to get
+          (a minigame that may be won by chance counts as lost)
+        - won: whether the route ends by winning the game
+        - exact: whether the route is certainly optimal (False if the search had to stop early to stay fast)
+
+    Representation Invariants:
+        - self.moves >= 0
+    """
+
+    commands: list[str]
+    moves: int
+    score: int
+    won: bool
+    exact: bool = True
+
+
+class _TrackingPlayer(Player):
+    """A player recording the name of every item the game checks for in its inventory.
+
+    Instance Attributes:
+        - checked_items: the names of the items checked so far (shared by every copy of this player)
+    """
+
+    __slots__ = ('checked_items',)
+    checked_items: set[str]
+
+    def has_item(self, item_name: str) -> bool:
+        """Record item_name as checked and return whether it is in this player's inventory."""
+
+        self.checked_items.add(item_name)
+        return super().has_item(item_name)
+
+    def copy(self) -> _TrackingPlayer:
+        """Return a copy of this player with its own inventory, recording into the same checked_items."""
+
+        other = super().copy()
+        other.checked_items = self.checked_items
+        return other
+
+
+class RouteSolver:
+    """A solver finding optimal routes from one game state.
+
+    The solver searches over game states deduplicated by their "node": the current location, the items and
+    commands of every location and the player's inventory. The transitions out of a node are found once and
+    cached: plain moves are read from the location's available commands, and every other command is played on a
+    copy of a game in the node's state. The visited locations and the player's score and moves are tracked by
+    the search itself, so the same node is expanded only once however it was reached. Teleporting only changes
+    the current location, so it is played to a single location and the transitions to the others are derived from
+    that one. Before any search, every special command of the start state is played once, so that the items the
+    game checks for are known to be worth picking up from the start.
+
+    The shortest winning route is found by an A* search, guided by a number of moves that winning takes at least
+    from each node (see _moves_to_win). The highest-scoring route is found by a branch and bound search: the routes
+    with the most points they may still end with are extended first, routes reaching a node with the same visited
+    locations and moves left as a higher-scoring one are dropped, and the search stops as soon as no route may
+    still beat the best one found (see _score_at_most).
+
+    Two kinds of commands are never part of a route, because they can only make a route longer without changing
+    what the player can do or score: dropping items, and picking up items that no command of the game ever checks
+    the player for (the win condition's items are always checked). Menu commands are not moves and are never
+    part of a route either.
+
+    Instance Attributes:
+        - nodes_expanded: the number of nodes whose transitions have been found so far
+    """
+
+    # Private Instance Attributes:
+    #   - _start: the state the routes start from
+    #   - _slots: a mapping from location id to its slot
+    #   - _start_visited: whether the location in each slot was visited in _start
+    #   - _relevant: the names of the items worth picking up
+    #   - _checked: the names of the items checked by the game while finding transitions
+    #   - _node_ids: a mapping from node key to node number
+    #   - _keys: the key (location id, game state key, inventory) of every node
+    #   - _games: a mapping from (game state key, inventory) to a game in that state, at any location
+    #   - _transitions: the transitions of every expanded node, as tuples of (commands, next node, slot of the
+    #                   location visited or -1, score gained, change in moves left, whether the game is won,
+    #                   the minigame played or None)
+    #   - _skipped: the names of the items that were not worth picking up when each node was expanded
+    #   - _unvisited: the number of locations not visited in _start
+    #   - _win_bounds: a mapping from node to a number of moves that winning from it takes at least
+    #   - _tours: a mapping from (game state key, inventory) to the locations of the missing items (or, for an item
+    #             no location has yet, the one it starts at) and a number of moves that getting each missing item
+    #             from the nearest of them and submitting takes at least
+    #   - _score_facts: a mapping from node to the moves to the nearest location to teleport from (or None if there
+    #                   is none), the slots of those locations, and the numbers of hotdogs and minigames left
+    #   - _score_bounds: a mapping from (node, unvisited locations, unvisited locations to teleport from, moves left)
+    #                    to the points that can be gained at most from there (see _score_at_most)
+    nodes_expanded: int
+    _start: GameState
+    _slots: dict[int, int]
+    _start_visited: bytearray
+    _relevant: set[str]
+    _checked: set[str]
+    _node_ids: dict[tuple, int]
+    _keys: list[tuple]
+    _games: dict[tuple, GameState]
+    _transitions: dict[int, list[tuple]]
+    _skipped: dict[int, set[str]]
+    _unvisited: int
+    _win_bounds: dict[int, int]
+    _tours: dict[tuple, tuple[int, list[int]]]
+    _score_facts: dict[int, tuple[Optional[int], list[int], int, int]]
+    _score_bounds: dict[tuple[int, int, int, int], int]
+
+    def __init__(self, state: GameState) -> None:
+        """Initialize a solver for routes starting from state. state itself is never changed.
+
+        Preconditions:
+            - state.outcome is None
+            - state.pending is None
+        """
+
+        self._start = state
+        self.nodes_expanded = 0
+        self._slots = {loc_id: slot for slot, loc_id in enumerate(state.game.all_location_ids())}
+        self._start_visited = bytearray(len(self._slots))
+        for loc_id, slot in self._slots.items():
+            self._start_visited[slot] = state.game.get_location(loc_id).visited
+        self._unvisited = self._start_visited.count(0)
+        self._relevant = set(state.win_condition.required_items)
+        self._checked = set()
+
+        player = _TrackingPlayer()
+        player.inventory = state.player.inventory
+        player.score = state.player.score
+        player.moves_left = _UNLIMITED_MOVES
+        player.checked_items = self._checked
+
+        game = state.game.copy()
+        for loc_id in self._slots:  # so that the game never awards points for visits: the search does that
+            game.get_location(loc_id).visited = True
+
+        self._node_ids = {}
+        self._keys = []
+        self._games = {}
+        self._transitions = {}
+        self._skipped = {}
+        self._win_bounds = {}
+        self._tours = {}
+        self._score_facts = {}
+        self._score_bounds = {}
+        self._node(dataclasses.replace(state, game=game, player=player, log=EventList(), _table_key=(), _table={},
+                                       _history=[]))
+        self._find_checked_items()
+
+    def _find_checked_items(self) -> None:
+        """Play every special command of the start state once, at its location, and consider the items the game
+        checked for worth picking up."""
+
+        start = self._games[self._keys[0][1:]]
+        for loc_id in self._slots:
+            for action in start.game.get_location(loc_id).available_commands:
+                if game_engine.commands.is_special(action):
+                    step(self._copy(start, loc_id), action)
+        self._relevant |= self._checked
+
+    def _node(self, state: GameState) -> int:
+        """Return the number of the node of state, creating it if it is new."""
+
+        state_key = state.game.state_key()
+        inventory = frozenset(item.name for item in state.player.inventory)
+        self._games.setdefault((state_key, inventory), state)
+        return self._node_of((state.game.current_location_id, state_key, inventory))
+
+    def _node_of(self, key: tuple) -> int:
+        """Return the number of the node with the given key, creating it if it is new."""
+
+        node = self._node_ids.get(key)
+        if node is None:
+            node = len(self._keys)
+            self._node_ids[key] = node
+            self._keys.append(key)
+        return node
+
+    def _copy(self, state: GameState, location_id: int) -> GameState:
+        """Return a copy of state at the location with id location_id, that can be played without changing state."""
+
+        other = dataclasses.replace(state, game=state.game.copy(), player=state.player.copy(), log=EventList(),
+                                    _history=[])
+        other.game.current_location_id = location_id
+        return other
+
+    def transitions(self, node: int) -> list[tuple]:
+        """Return the transitions out of node, finding them if node has not been expanded yet."""
+
+        if node in self._transitions:
+            return self._transitions[node]
+
+        location_id, state_key, inventory = self._keys[node]
+        game = self._games[state_key, inventory]
+        location = game.game.get_location(location_id)
+        found = []
+        skipped = set()
+
+        for action, target in location.available_commands.items():
+            if game_engine.commands.is_special(action):
+                found.extend(self._play(game, location_id, action))
+            else:  # a plain move only changes the current location, so there is no need to play it
+                found.append(((action,), self._node_of((target, state_key, inventory)), self._slots[target], 0, -1,
+                              False, None))
+
+        for item in location.items:
+            if item.name in self._relevant:
+                found.extend(self._play(game, location_id, f"pick up: {item.name}"))
+            else:
+                skipped.add(item.name)
+
+        self._transitions[node] = found
+        self._skipped[node] = skipped
+        self.nodes_expanded += 1
+        return found
+
+    def _play(self, game: GameState, location_id: int, action: str) -> list[tuple]:
+        """Return the transitions of playing action on game at the location with id location_id, one for each way
+        of answering the questions it asks."""
+
+        probe = self._copy(game, location_id)
+        step(probe, action)
+        if probe.pending is None:
+            return [self._transition(game, probe, [action], 0, None)]
+        if isinstance(probe.pending, TeleportPrompt):
+            return self._teleports(game, probe, action)
+
+        found = []
+        for i, answers in enumerate(_answers(probe.pending)):
+            state = probe
+            if i > 0:
+                state = self._copy(game, location_id)
+                step(state, action)
+
+            prompt = state.pending
+            for answer in answers:
+                if state.pending is None:
+                    break
+                step(state, answer)
+            if state.pending is None:
+                chance_points = prompt.win_points if isinstance(prompt, ShufflingDrawersGame) and prompt.won else 0
+                found.append(self._transition(game, state, [action] + answers, chance_points, prompt))
+        return found
+
+    def _teleports(self, game: GameState, probe: GameState, action: str) -> list[tuple]:
+        """Return the transitions of teleporting from game by playing action, which was played on probe (a copy of
+        game) up to Premier Ford's question.
+
+        Only the teleport to the first location is played: the others only differ in their target.
+        """
+
+        target_ids = probe.pending.current_game.all_location_ids()
+        step(probe, str(target_ids[0]))
+        _, node, _, score, moves, won, _ = self._transition(game, probe, [action, str(target_ids[0])], 0, None)
+        _, state_key, inventory = self._keys[node]
+        return [((action, str(loc_id)), self._node_of((loc_id, state_key, inventory)), self._slots[loc_id], score,
+                 moves, won, None) for loc_id in target_ids]
+
+    def _transition(self, game: GameState, state: GameState, commands: list[str], chance_points: int,
+                    minigame: Optional[Prompt]) -> tuple:
+        """Return the transition from game to state by playing commands, in which minigame (if not None) was
+        played, not counting chance_points of the score gained."""
+
+        event = state.log.last
+        visited_slot = self._slots[event.id_num] if event.item_involved is None else -1
+        return (tuple(commands), self._node(state), visited_slot,
+                state.player.score - game.player.score - chance_points,
+                state.player.moves_left - game.player.moves_left, state.outcome == WON,
+                minigame if isinstance(minigame, (LyingBackpacksGame, ShufflingDrawersGame)) else None)
+
+    def _gain(self, transition: tuple, visited: int) -> tuple[int, int]:
+        """Return the score gained by transition and the bitmask of the slots of the locations visited since the
+        start after it, given that bitmask before it."""
+
+        _, _, slot, score, _, _, _ = transition
+        if slot >= 0 and not self._start_visited[slot] and not visited >> slot & 1:
+            return score + self._start.game.unlock_location_points, visited | 1 << slot
+        return score, visited
+
+    def _moves_to_win(self, node: int) -> int:
+        """Return a number of moves that winning from node takes at least.
+
+        Getting each missing item takes a move and submitting takes one more. Before that, the player has to get to
+        every location where a missing item lies (or, for an item no location has yet, where it starts) and then to
+        a location where the work can be submitted. In whatever order, that takes at least the moves to the nearest
+        of those locations, plus the moves along a minimum spanning tree of them, plus the moves from the nearest of
+        them to a submit location, each bounded by game_engine.moves_at_least.
+        """
+
+        bound = self._win_bounds.get(node)
+        if bound is None:
+            location_id, state_key, inventory = self._keys[node]
+            game = self._games[state_key, inventory].game
+            teleport_ids = game.command_location_ids(TELEPORT_COMMAND)
+            tour, sites = self._tour(state_key, inventory)
+            targets = sites if sites else game.command_location_ids(SUBMIT_COMMAND)
+            bound = tour + min((moves_at_least(game, location_id, target_id, teleport_ids) for target_id in targets),
+                               default=0)
+            self._win_bounds[node] = bound
+        return bound
+
+    def _tour(self, state_key: tuple, inventory: frozenset[str]) -> tuple[int, list[int]]:
+        """Return the locations of the missing items of the game in the given state (see _moves_to_win), and a number
+        of moves that getting the missing items from the nearest of them and submitting takes at least."""
+
+        tour = self._tours.get((state_key, inventory))
+        if tour is not None:
+            return tour
+
+        state = self._games[state_key, inventory]
+        game = state.game
+        teleport_ids = game.command_location_ids(TELEPORT_COMMAND)
+        missing = state.win_condition.missing_items(state.player)
+        sites = set()
+        for item_name in missing:
+            item_location = game.item_location(item_name)
+            sites.add(game.get_item(item_name).start_position if item_location is None else item_location)
+        sites = list(sites)
+
+        moves = len(missing) + 1
+        if sites:
+            # Prim's algorithm, with the moves from the locations not in the tree yet to the nearest one in it
+            nearest = {site: moves_at_least(game, sites[0], site, teleport_ids) for site in sites[1:]}
+            while nearest:
+                site = min(nearest, key=nearest.get)
+                moves += nearest.pop(site)
+                for other in nearest:
+                    nearest[other] = min(nearest[other], moves_at_least(game, site, other, teleport_ids))
+            submit_ids = game.command_location_ids(SUBMIT_COMMAND)
+            moves += min(min((moves_at_least(game, site, submit_id, teleport_ids) for submit_id in submit_ids),
+                             default=0) for site in sites)
+
+        self._tours[state_key, inventory] = (moves, sites)
+        return moves, sites
+
+    def _search_shortest_win(self) -> Optional[Route]:
+        """Return the shortest winning route with the current relevant items, or None if there is none or the game
+        checked for an item that is not relevant yet."""
+
+        # every entry is (node, moves left, index of the previous entry, transition); the queue holds the moves a
+        # winning route extending an entry takes at least, the moves of the entry negated (so that the longest
+        # entry comes first among equals), its index and whether it won the game
+        entries = [(0, self._start.player.moves_left, -1, None)]
+        best_moves = {0: 0}
+        queue = [(self._moves_to_win(0), 0, 0, False)]
+
+        while queue:
+            _, moves, index, won = heappop(queue)
+            if won:
+                return self._route(entries, index)
+            moves = -moves
+            node, moves_left, _, _ = entries[index]
+            if moves > best_moves[node]:
+                continue  # the node was reached in fewer moves since
+
+            transitions = self.transitions(node)
+            if not self._checked <= self._relevant:
+                return None  # the search must start again, with more items worth picking up
+
+            for transition in transitions:
+                next_node, next_moves_left = transition[1], moves_left + transition[4]
+                if transition[5] and next_moves_left >= 0:
+                    entries.append((next_node, next_moves_left, index, transition))
+                    heappush(queue, (moves + 1, -moves - 1, len(entries) - 1, True))
+                elif next_moves_left > 0 and moves + 1 < best_moves.get(next_node, moves + 2):
+                    best_moves[next_node] = moves + 1
+                    entries.append((next_node, next_moves_left, index, transition))
+                    heappush(queue, (moves + 1 + self._moves_to_win(next_node), -moves - 1, len(entries) - 1,
+                                     False))
+
+        return None
+
+    def _score_at_most(self, node: int, visited: int, moves_left: int) -> int:
+        """Return a number of points that can be gained at most from node with moves_left moves left, given the
+        bitmask of the slots of the locations visited since the start.
+
+        Teleporting gains special_points a move, once the player got to a location to teleport from. A location
+        visited for the first time gains unlock_location_points: at most once for each move that is not a
+        teleport, and for a teleport only if it is the last one, or it ends at a location to teleport from, or a
+        move that is not a teleport follows it (to walk away). A minigame gains puzzle_points for its move, and
+        winning gains necessary_items_points for each required item, after a move for each missing item and one to
+        submit. A hotdog gives HOTDOG_MOVES moves for its move. The bound is the most points these add up to over
+        every way of sharing the moves between them.
+        """
+
+        facts = self._score_facts.get(node)
+        if facts is None:
+            facts = self._find_score_facts(node)
+        to_teleport, teleport_slots, hotdogs, minigames = facts
+
+        unvisited = self._unvisited - visited.bit_count()
+        unvisited_teleports = sum(1 for slot in teleport_slots
+                                  if not self._start_visited[slot] and not visited >> slot & 1)
+        key = (node, unvisited, unvisited_teleports, moves_left)
+        bound = self._score_bounds.get(key)
+        if bound is not None:
+            return bound
+
+        _, state_key, inventory = self._keys[node]
+        state = self._games[state_key, inventory]
+        to_win = len(state.win_condition.missing_items(state.player)) + 1
+        win_points = len(self._start.win_condition.required_items) * self._start.necessary_items_points
+        bound = 0
+        for moves in (moves_left, moves_left + hotdogs * (HOTDOG_MOVES - 1)):
+            bound = max(bound, self._points_at_most(moves, to_teleport, unvisited, unvisited_teleports, minigames))
+            if self._moves_to_win(node) <= moves:
+                bound = max(bound, win_points + self._points_at_most(moves - to_win, to_teleport, unvisited,
+                                                                     unvisited_teleports, minigames))
+
+        self._score_bounds[key] = bound
+        return bound
+
+    def _points_at_most(self, budget: int, to_teleport: Optional[int], unvisited: int, unvisited_teleports: int,
+                        minigames: int) -> int:
+        """Return the points that walking, teleporting and playing minigames for budget moves can gain at most (see
+        _score_at_most), with to_teleport moves to the nearest location to teleport from (None if there is none),
+        unvisited locations left, of which unvisited_teleports to teleport from, and minigames left.
+
+        The points are the most for one of a few numbers of moves that are not teleports: the fewest, the most,
+        and those where the locations left or the minigames left run out.
+        """
+
+        start = self._start
+        unlock_points = start.game.unlock_location_points
+        points = unlock_points * min(unvisited, budget) + start.puzzle_points * min(minigames, budget)
+        if to_teleport is None or to_teleport >= budget:
+            return points
+
+        middle = (unvisited - 1 - unvisited_teleports + to_teleport) // 2
+        for walks in (to_teleport, middle, middle + 1, budget - 1 - minigames, budget - 1):
+            if to_teleport <= walks < budget:
+                unlocks = unlock_points * min(unvisited, 2 * walks - to_teleport + 1 + unvisited_teleports)
+                for games in (0, min(minigames, budget - walks - 1)):
+                    points = max(points, start.special_points * (budget - walks - games)
+                                 + start.puzzle_points * games + unlocks)
+        return points
+
+    def _find_score_facts(self, node: int) -> tuple[Optional[int], list[int], int, int]:
+        """Return and remember the facts about node that _score_at_most needs (see _score_facts)."""
+
+        location_id, state_key, inventory = self._keys[node]
+        game = self._games[state_key, inventory].game
+        teleport_ids = game.command_location_ids(TELEPORT_COMMAND)
+        to_teleport = None
+        if teleport_ids:  # a location the current commands cannot reach may still be reached after a special event
+            to_teleport = min(game.moves_at_least(location_id, teleport_id) for teleport_id in teleport_ids)
+            to_teleport = 0 if to_teleport == UNREACHABLE else to_teleport
+        minigames = sum(len(game.command_location_ids(command))
+                        for command in (USB_DRIVE_COMMAND, LAPTOP_CHARGER_COMMAND))
+        facts = (to_teleport, [self._slots[teleport_id] for teleport_id in teleport_ids],
+                 len(game.command_location_ids(HOTDOG_COMMAND)), minigames)
+        self._score_facts[node] = facts
+        return facts
+
+    def _search_max_score(self, max_entries: int) -> Optional[Route]:
+        """Return the highest-scoring route with the current relevant items, stopping early once more than
+        max_entries routes were kept, or None if the game checked for an item that is not relevant yet."""
+
+        # every entry is (node, moves left, bitmask of the slots of the locations visited since the start, score,
+        # index of the previous entry, transition); the queue holds the points a route extending an entry may end
+        # with at most, its score and its index, negated so that the most promising entry comes first
+        start = self._start.player
+        entries = [(0, start.moves_left, 0, start.score, -1, None)]
+        best, exact = 0, True
+        best_scores = {}
+        queue = [(-start.score - self._score_at_most(0, 0, start.moves_left), -start.score, 0)]
+
+        while queue:
+            bound, _, index = heappop(queue)
+            if -bound <= entries[best][3]:
+                break  # no route can beat the best one any more
+            node, moves_left, visited, score, _, _ = entries[index]
+            if best_scores.get((node, visited, moves_left), score) > score:
+                continue  # a higher-scoring route got to the same node since
+            if len(entries) > max_entries:
+                exact = False
+                break
+
+            transitions = self.transitions(node)
+            if not self._checked <= self._relevant:
+                return None  # the search must start again, with more items worth picking up
+
+            for transition in transitions:
+                next_node, next_moves_left = transition[1], moves_left + transition[4]
+                if next_moves_left < 0:
+                    continue
+                gained, next_visited = self._gain(transition, visited)
+                next_score = score + gained
+                entries.append((next_node, next_moves_left, next_visited, next_score, index, transition))
+                if next_score > entries[best][3]:
+                    best = len(entries) - 1
+
+                key = (next_node, next_visited, next_moves_left)
+                if transition[5] or next_moves_left == 0 or best_scores.get(key, -1) >= next_score:
+                    continue  # the game is over, or a route at least as good got to the same node
+                best_scores[key] = next_score
+                next_bound = next_score + self._score_at_most(next_node, next_visited, next_moves_left)
+                if next_bound > entries[best][3]:
+                    heappush(queue, (-next_bound, -next_score, len(entries) - 1))
+
+        route = self._route(entries, best)
+        route.exact = exact
+        return route
+
+    def _search_max_score_beam(self, beam_width: int) -> Optional[Route]:
+        """Return the highest-scoring route with the current relevant items, keeping at most beam_width states
+        after each move, or None if the game checked for an item that is not relevant yet."""
+
+        # every entry is (node, moves left, bitmask of the slots of the locations visited since the start, score,
+        # index of the previous entry, transition)
+        entries = [(0, self._start.player.moves_left, 0, self._start.player.score, -1, None)]
+        best, exact = 0, True
+        frontier = [0]
+
+        while frontier:
+            layer = {}
+            for index in frontier:
+                node, moves_left, visited, score, _, _ = entries[index]
+                transitions = self.transitions(node)
+                if not self._checked <= self._relevant:
+                    return None  # the search must start again, with more items worth picking up
+
+                for transition in transitions:
+                    next_moves_left = moves_left + transition[4]
+                    if next_moves_left < 0:
+                        continue
+                    gained, next_visited = self._gain(transition, visited)
+                    entries.append((transition[1], next_moves_left, next_visited, score + gained, index, transition))
+                    if score + gained > entries[best][3]:
+                        best = len(entries) - 1
+
+                    if transition[5] or next_moves_left == 0:
+                        continue  # the game is over
+                    key = (transition[1], next_visited)
+                    other = layer.get(key)
+                    if other is None or (score + gained, next_moves_left) > (entries[other][3], entries[other][1]):
+                        layer[key] = len(entries) - 1
+
+            frontier = list(layer.values())
+            if len(frontier) > beam_width:
+                exact = False
+                frontier.sort(key=lambda i: (entries[i][3], entries[i][1]), reverse=True)
+                del frontier[beam_width:]
+
+        route = self._route(entries, best)
+        route.exact = exact
+        return route
+
+    def _route(self, entries: list[tuple], index: int) -> Route:
+        """Return the route ending with the entry at index, whose last two values are the index of the previous
+        entry and the transition leading to it."""
+
+        transitions = []
+        while entries[index][-1] is not None:
+            transitions.append(entries[index][-1])
+            index = entries[index][-2]
+        transitions.reverse()
+
+        commands = []
+        score, visited = self._start.player.score, 0
+        for transition in transitions:
+            commands.extend(transition[0])
+            gained, visited = self._gain(transition, visited)
+            score += gained
+        return Route(commands, len(transitions), score, bool(transitions) and transitions[-1][5])
+
+    def _relevance_changed(self) -> bool:
+        """Return whether the game checked for items that were not considered worth picking up, and if so,
+        consider them worth picking up from now on and forget the transitions of the nodes where they were
+        skipped."""
+
+        if self._checked <= self._relevant:
+            return False
+        self._relevant |= self._checked
+        for node, skipped in self._skipped.items():
+            if not skipped.isdisjoint(self._relevant):
+                del self._transitions[node]
+        self._skipped = {node: skipped for node, skipped in self._skipped.items() if node in self._transitions}
+        return True
+
+    def reachable_transitions(self) -> dict[int, list[tuple]]:
+        """Return the transitions of every node reachable from the start, as a mapping from node to its transitions.
+
+        Each transition is a tuple of (commands, next node, slot of the location visited or -1, score gained,
+        change in moves left, whether the game is won, the minigame played or None). The score gained does not
+        count the points of a shuffling drawers game, which can only be won by chance.
+        """
+
+        while True:
+            reached = {0}
+            frontier = [0]
+            while frontier:
+                node = frontier.pop()
+                for transition in self.transitions(node):
+                    if transition[1] not in reached:
+                        reached.add(transition[1])
+                        frontier.append(transition[1])
+            if not self._relevance_changed():
+                return {node: self._transitions[node] for node in reached}
+
+    def shortest_win(self) -> Optional[Route]:
+        """Return a winning route with the fewest moves, or None if the game cannot be won from the start state."""
+
+        route = self._search_shortest_win()
+        while self._relevance_changed():
+            route = self._search_shortest_win()
+        return route
+
+    def max_score_route(self, beam_width: int = 2000) -> Route:
+        """Return the route that ends with the highest score before the player runs out of moves.
+
+        If the branch and bound search has to keep more than 5 * beam_width routes (its bound is too loose on some
+        large worlds), a beam search keeping at most beam_width states (the highest-scoring ones) after each move
+        is run as well, and the higher-scoring route of the two is returned, marked as not exact.
+
+        Preconditions:
+            - beam_width >= 1
+        """
+
+        route = self._search_max_score(5 * beam_width)
+        while self._relevance_changed():
+            route = self._search_max_score(5 * beam_width)
+        if route.exact:
+            return route
+
+        beam_route = self._search_max_score_beam(beam_width)
+        while self._relevance_changed():
+            beam_route = self._search_max_score_beam(beam_width)
+        beam_route.exact = False
+        return beam_route if beam_route.score > route.score else route
+
+
+def _answers(prompt: Prompt) -> list[list[str]]:
+    """Return the ways the solver answers prompt, each as the list of answers to enter.
+
+    The lying backpacks game is answered correctly, and the shuffling drawers game (which cannot be guessed) with a
+    guess for each chance. Premier Ford's question is answered by RouteSolver._teleports instead.
+    """
+
+    if isinstance(prompt, LyingBackpacksGame):
+        return [[str(LyingBackpacksGame.ANSWER)]]
+    elif isinstance(prompt, ShufflingDrawersGame):
+        return [["1"] * prompt.guesses_left]
+    else:
+        return []
+
+
+def shortest_win(state: GameState) -> Optional[Route]:
+    """Return a winning route from state with the fewest moves, or None if the game cannot be won from state.
+
+    Preconditions:
+        - state.outcome is None
+        - state.pending is None
+    """
+
+    return RouteSolver(state).shortest_win()
+
+
+def max_score_route(state: GameState, beam_width: int = 2000) -> Route:
+    """Return the route from state that ends with the highest score before the player runs out of moves (see
+    RouteSolver.max_score_route).
+
+    Preconditions:
+        - state.outcome is None
+        - state.pending is None
+        - beam_width >= 1
+    """
+
+    return RouteSolver(state).max_score_route(beam_width)
+
+
+if __name__ == "__main__":
+    # When you are ready to check your work with python_ta, uncomment the following lines.
+    # (Delete the "#" and space before each line.)
+    # IMPORTANT: keep this code indented inside the "if __name__ == '__main__'" block
+    import python_ta
+    python_ta.check_all(config={
+        'max-line-length': 120,
+        'disable': ['R1705', 'E9998', 'E9999']
+    })
@@ -0,0 +1,129 @@
+"""CSC111 Project 1: Text Adventure Game - World Cache
+
+Instructions (READ THIS FIRST!)
+===============================
+
+This Python module contains the parsed-world cache for Project 1, to be imported and used by
+ the `adventure` module.
+ Please consult the project handout for instructions and details.
+
+Copyright and Usage Information
+===============================
+
+This file is provided solely for the personal and private use of students
+taking CSC111 at the University of Toronto St. George campus. All forms of
+distribution of this code, whether as given or with any changes, are
+expressly prohibited. For more information on copyright for CSC111 materials,
+please consult our Course Syllabus.
+
+This file is Copyright (c) 2025 CSC111 Teaching Team
+"""
+from __future__ import annotations
+import hashlib
+import os
+from collections import OrderedDict
+from typing import Callable, Optional
+from game_entities import Item, Location
+from game_world import WorldDefinition
+
+
+class WorldCache:
+    """A bounded cache of parsed game worlds, keyed by data file path.
+
+    Every world is parsed once into a read-only WorldDefinition that is shared by every game loaded from the
+    same file; each game keeps its own per-session state in a game_world.SessionState. A cached world is parsed
+    again when its file's modification time or size changes, or, if check_contents is True, when the file's
+    contents change, and when the world says it no longer matches the files it was built from (see
+    WorldDefinition.is_current), such as a compiled world whose game data file was edited.
+
+    Instance Attributes:
+        - max_worlds: the maximum number of worlds kept in the cache at once
+        - check_contents: whether the contents of a file are hashed to detect changes
+
+    Representation Invariants:
+        - self.max_worlds >= 1
+        - len(self._entries) <= self.max_worlds
+    """
+
+    # Private Instance Attributes:
+    #   - _loader: the function parsing a data file into a (locations, items) template, or opening it as a
+    #              WorldDefinition of its own (such as a world_store.LazyWorld)
+    #   - _entries: a mapping from absolute file path to the file's (signature, world), ordered from least
+    #               to most recently used
+    max_worlds: int
+    check_contents: bool
+    _loader: Callable[[str], tuple[dict[int, Location], list[Item]] | WorldDefinition]
+    _entries: OrderedDict[str, tuple[tuple, WorldDefinition]]
+
+    def __init__(self, loader: Callable[[str], tuple[dict[int, Location], list[Item]] | WorldDefinition],
+                 max_worlds: int = 8, check_contents: bool = False) -> None:
+        """Initialize a new empty cache of worlds parsed with loader.
+
+        Preconditions:
+            - max_worlds >= 1
+        """
+
+        self._loader = loader
+        self.max_worlds = max_worlds
+        self.check_contents = check_contents
+        self._entries = OrderedDict()
+
+    def __len__(self) -> int:
+        """Return the number of worlds currently cached."""
+
+        return len(self._entries)
+
+    def load(self, filename: str) -> WorldDefinition:
+        """Return the shared world stored in filename, parsing the file only if it is not cached or has changed
+        since it was cached.
+
+        Preconditions:
+            - filename is the filename of a valid game data JSON file
+        """
+
+        path = os.path.abspath(filename)
+        signature = self._signature(path)
+        entry = self._entries.get(path)
+
+        if entry is not None and entry[0] == signature and entry[1].is_current():
+            self._entries.move_to_end(path)
+            return entry[1]
+
+        loaded = self._loader(path)
+        world = loaded if isinstance(loaded, WorldDefinition) else WorldDefinition(*loaded)
+        self._entries[path] = (signature, world)
+        self._entries.move_to_end(path)
+        if len(self._entries) > self.max_worlds:
+            self._entries.popitem(last=False)
+
+        return world
+
+    def invalidate(self, filename: Optional[str] = None) -> None:
+        """Drop the cached world of filename, or every cached world if filename is None."""
+
+        if filename is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(os.path.abspath(filename), None)
+
+    def _signature(self, path: str) -> tuple:
+        """Return the values identifying the current version of the file at path."""
+
+        stat = os.stat(path)
+        if not self.check_contents:
+            return stat.st_mtime_ns, stat.st_size
+
+        with open(path, 'rb') as f:
+            digest = hashlib.sha256(f.read()).hexdigest()
+        return stat.st_mtime_ns, stat.st_size, digest
+
+
+if __name__ == "__main__":
+    # When you are ready to check your work with python_ta, uncomment the following lines.
+    # (Delete the "#" and space before each line.)
+    # IMPORTANT: keep this code indented inside the "if __name__ == '__main__'" block
+    import python_ta
+    python_ta.check_all(config={
+        'max-line-length': 120,
+        'disable': ['R1705', 'E9998', 'E9999']
+    })
@@ -0,0 +1,195 @@
+"""CSC111 Project 1: Text Adventure Game - World Generator
+
+Instructions (READ THIS FIRST!)
+===============================
+
+This Python module contains the procedural world generator for Project 1. It generates worlds of
+ any size in the format of game_data.json from a seed, so that the game can be measured on
+ worlds much larger than ours, and the same world can be generated again to compare results.
+ Please consult the project handout for instructions and details.
+
+Copyright and Usage Information
+===============================
+
+This file is provided solely for the personal and private use of students
+taking CSC111 at the University of Toronto St. George campus. All forms of
+distribution of this code, whether as given or with any changes, are
+expressly prohibited. For more information on copyright for CSC111 materials,
+please consult our Course Syllabus.
+
+This file is Copyright (c) 2025 CSC111 Teaching Team
+"""
+from __future__ import annotations
+import json
+import os
+import random
+from collections.abc import Iterator
+from typing import Optional
+from game_engine import NECESSARY_ITEMS, SUBMIT_COMMAND, TELEPORT_COMMAND
+from world_loader import ITEM, LOCATION
+
+# The file of the words location and item names are made from, next to this module
+WORDS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'common-7-letter-words.txt')
+
+# The kinds of places location names end with
+PLACES = ("Hall", "Library", "Cafe", "Quad", "Lab", "Office", "Station", "Garden", "Tower", "Lounge")
+
+# The number of paths added to a generated world, per location, on top of the ones connecting every location
+EXTRA_PATHS = 0.5
+
+# The special commands placed in generated worlds by default, with the id of the location each one is available at
+# (None for a random location). Only special commands whose events do not depend on the locations of
+# game_data.json can be placed in a generated world.
+DEFAULT_HOOKS = {SUBMIT_COMMAND: 1, TELEPORT_COMMAND: None}
+
+
+def _numbered_names(words: list[str], suffixes: tuple[str, ...], count: int) -> Iterator[str]:
+    """Return an iterator over count different names, each a word of words followed by a suffix of suffixes, and
+    then by a number once every combination has been used."""
+
+    for i in range(count):
+        cycle, i = divmod(i, len(words) * len(suffixes))
+        name = " ".join(filter(None, (words[i % len(words)], suffixes[i // len(words)])))
+        yield name if cycle == 0 else f"{name} {cycle + 1}"
+
+
+def iter_world_records(n_locations: int, n_items: int, seed: int = 0,
+                       hooks: Optional[dict[str, Optional[int]]] = None,
+                       required_items: Optional[list[str]] = None) -> Iterator[tuple[str, dict]]:
+    """Return an iterator over the (kind, record) of every item and then every location of a world generated from
+    seed, as world_loader.iter_records returns them.
+
+    The locations have ids 1 to n_locations and are all connected: every location after the first has a path to
+    a random earlier one, and EXTRA_PATHS * n_locations more paths join random pairs of locations. A path can be
+    taken both ways, with the command "go to <name of the other location>". Each special command of hooks
+    (DEFAULT_HOOKS if None) is available at its location, and leads back to it.
+
+    The world has the items the game needs to be won, required_items (NECESSARY_ITEMS if None), followed by n_items
+    more items. Each item lies at a random location at first. The target of a required item is where the work is
+    submitted (where SUBMIT_COMMAND is available, if it is in hooks), and the target of the others is another
+    random location.
+
+    Generating a world again with the same arguments gives exactly the same records.
+
+    Preconditions:
+        - n_locations >= 2
+        - n_items >= 0
+        - hooks is None or all(1 <= location_id <= n_locations for location_id in hooks.values() if location_id)
+    """
+
+    if hooks is None:
+        hooks = DEFAULT_HOOKS
+    if required_items is None:
+        required_items = NECESSARY_ITEMS
+    rng = random.Random(seed)
+    with open(WORDS_FILE, encoding='utf-8') as file:
+        words = list(dict.fromkeys(line.strip().title() for line in file if line.strip()))
+    rng.shuffle(words)
+
+    paths = [[] for _ in range(n_locations)]  # the slots (ids - 1) of the locations each location has paths to
+    for slot in range(1, n_locations):
+        other = rng.randrange(slot)
+        paths[slot].append(other)
+        paths[other].append(slot)
+    for _ in range(int(EXTRA_PATHS * n_locations)):
+        slot, other = rng.randrange(n_locations), rng.randrange(n_locations)
+        if slot != other and other not in paths[slot]:
+            paths[slot].append(other)
+            paths[other].append(slot)
+
+    hooks_at, submit_id = {}, 1
+    for command, location_id in hooks.items():
+        location_id = location_id or rng.randrange(n_locations) + 1
+        hooks_at.setdefault(location_id, []).append(command)
+        if command == SUBMIT_COMMAND:
+            submit_id = location_id
+
+    items_at = {}
+    for name in required_items:
+        start = rng.randrange(n_locations) + 1
+        items_at.setdefault(start, []).append(name)
+        yield ITEM, {"name": name, "description": f"Your {name}, which you need to submit your work.",
+                     "start_position": start, "target_position": submit_id}
+    for name in _numbered_names([word.lower() for word in words], ("",), n_items):
+        start, target = rng.randrange(n_locations) + 1, rng.randrange(n_locations) + 1
+        items_at.setdefault(start, []).append(name)
+        yield ITEM, {"name": name, "description": f"A {name}, lost somewhere on campus.", "start_position": start,
+                     "target_position": target}
+
+    names = list(_numbered_names(words, PLACES, n_locations))
+    for slot, name in enumerate(names):
+        location_id = slot + 1
+        commands = {f"go to {names[other].lower()}": other + 1 for other in paths[slot]}
+        for command in hooks_at.get(location_id, []):
+            commands[command] = location_id
+        yield LOCATION, {"id": location_id, "name": name, "brief_description": f"You are at {name}.",
+                         "long_description": f"You are at {name}. From here, you can go to "
+                                             + ", ".join(names[other] for other in paths[slot]) + ".",
+                         "available_commands": commands, "items": items_at.get(location_id, [])}
+
+
+def generate_world(n_locations: int, n_items: int, seed: int = 0,
+                   hooks: Optional[dict[str, Optional[int]]] = None,
+                   required_items: Optional[list[str]] = None) -> dict:
+    """Return the game data (in the format of game_data.json) of the world iter_world_records generates.
+
+    >>> world = generate_world(10, 3, seed=111)
+    >>> len(world['locations']), [item['name'] for item in world['items']][:len(NECESSARY_ITEMS)] == NECESSARY_ITEMS
+    (10, True)
+    >>> world == generate_world(10, 3, seed=111)
+    True
+
+    Preconditions:
+        - n_locations >= 2
+        - n_items >= 0
+        - hooks is None or all(1 <= location_id <= n_locations for location_id in hooks.values() if location_id)
+    """
+
+    data = {"locations": [], "items": []}
+    for kind, record in iter_world_records(n_locations, n_items, seed, hooks, required_items):
+        data["locations" if kind == LOCATION else "items"].append(record)
+    return data
+
+
+def write_world(filename: str, n_locations: int, n_items: int, seed: int = 0,
+                hooks: Optional[dict[str, Optional[int]]] = None, required_items: Optional[list[str]] = None) -> None:
+    """Write the world iter_world_records generates to filename one record at a time, as JSON Lines (see
+    world_loader.write_json_lines) if filename ends with ".jsonl" and as JSON otherwise, items first.
+
+    Preconditions:
+        - n_locations >= 2
+        - n_items >= 0
+        - hooks is None or all(1 <= location_id <= n_locations for location_id in hooks.values() if location_id)
+    """
+
+    records = iter_world_records(n_locations, n_items, seed, hooks, required_items)
+    with open(filename, 'w', encoding='utf-8') as file:
+        if filename.endswith(".jsonl"):
+            for kind, record in records:
+                file.write(json.dumps({"type": kind, **record}))
+                file.write("\n")
+            return
+
+        file.write('{"items": [')
+        kind_so_far, separator = ITEM, "\n"
+        for kind, record in records:
+            if kind != kind_so_far:
+                file.write('\n], "locations": [')
+                kind_so_far, separator = kind, "\n"
+            file.write(separator)
+            file.write(json.dumps(record))
+            separator = ",\n"
+        if kind_so_far == ITEM:
+            file.write('\n], "locations": [')
+        file.write("\n]}\n")
+
+
+if __name__ == "__main__":
+    # When you are ready to check your work with python_ta, uncomment the following lines.
+    # (Delete the "#" and space before each line.)
+    # IMPORTANT: keep this code indented inside the "if __name__ == '__main__'" block
+    import python_ta
+    python_ta.check_all(config={
+        'max-line-length': 120,
+        'disable': ['R1705', 'E9998', 'E9999']
+    })
@@ -0,0 +1,239 @@
+"""CSC111 Project 1: Text Adventure Game - Streaming World Loader
+
+Instructions (READ THIS FIRST!)
+===============================
+
+This Python module contains the streaming world loader for Project 1, to be imported and used by
+ the `adventure` module. It reads the locations and items of a game data file one record at a
+ time, so that very large worlds can be loaded without holding the whole parsed file in memory.
+ Please consult the project handout for instructions and details.
+
+Copyright and Usage Information
+===============================
+
+This file is provided solely for the personal and private use of students
+taking CSC111 at the University of Toronto St. George campus. All forms of
+distribution of this code, whether as given or with any changes, are
+expressly prohibited. For more information on copyright for CSC111 materials,
+please consult our Course Syllabus.
+
+This file is Copyright (c) 2025 CSC111 Teaching Team
+"""
+from __future__ import annotations
+import json
+import sys
+from collections.abc import Iterator
+from typing import Any, TextIO
+from game_entities import Item, Location
+
+# The kinds of records in a game data file
+LOCATION = "location"
+ITEM = "item"
+
+# The arrays of a game data JSON file holding each kind of record
+_ARRAYS = {"locations": LOCATION, "items": ITEM}
+
+# The number of characters read from a file at a time
+CHUNK_SIZE = 1 << 16
+
+_decoder = json.JSONDecoder()
+
+
+class _JSONStream:
+    """A JSON text read from a file a chunk at a time.
+
+    Instance Attributes:
+        - file: the file the text is read from
+
+    Representation Invariants:
+        - 0 <= self._position <= len(self._buffer)
+    """
+
+    file: TextIO
+
+    # Private Instance Attributes:
+    #   - _buffer: the text read from the file and not discarded yet
+    #   - _position: the position in _buffer of the next character to parse
+    #   - _eof: whether the whole file has been read into _buffer
+    _buffer: str
+    _position: int
+    _eof: bool
+
+    def __init__(self, file: TextIO) -> None:
+        """Initialize a stream of the JSON text in file, from its current position."""
+
+        self.file = file
+        self._buffer = ""
+        self._position = 0
+        self._eof = False
+
+    def _read_more(self) -> bool:
+        """Read the next chunk of the file into the buffer, discarding the text parsed so far. Return whether
+        anything was read."""
+
+        chunk = self.file.read(CHUNK_SIZE)
+        self._buffer = self._buffer[self._position:] + chunk
+        self._position = 0
+        self._eof = not chunk
+        return bool(chunk)
+
+    def peek(self) -> str:
+        """Return the next character that is not whitespace, without consuming it, or "" at the end of the text."""
+
+        while True:
+            while self._position < len(self._buffer) and self._buffer[self._position] in " \t\r\n":
+                self._position += 1
+            if self._position < len(self._buffer) or not self._read_more():
+                return self._buffer[self._position:self._position + 1]
+
+    def expect(self, char: str) -> None:
+        """Consume the next character that is not whitespace, which must be char."""
+
+        if self.peek() != char:
+            raise ValueError(f"expected {char!r} in {self.file.name}")
+        self._position += 1
+
+    def value(self) -> Any:
+        """Parse and return the next JSON value."""
+
+        self.peek()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self._buffer, self._position)
+            except json.JSONDecodeError:
+                if not self._read_more():
+                    raise
+                continue
+            # a number (or literal) ending the buffer might continue in the next chunk
+            if end < len(self._buffer) or self._eof or not self._read_more():
+                self._position = end
+                return value
+
+
+def _json_records(file: TextIO) -> Iterator[tuple[str, dict]]:
+    """Return an iterator over the (kind, record) of each element of the "locations" and "items" arrays of the JSON
+    object in file, parsing one element at a time. Every other member of the object is parsed and ignored."""
+
+    stream = _JSONStream(file)
+    stream.expect("{")
+    if stream.peek() == "}":
+        return
+    while True:
+        key = stream.value()
+        stream.expect(":")
+        if key in _ARRAYS and stream.peek() == "[":
+            stream.expect("[")
+            if stream.peek() != "]":
+                while True:
+                    yield _ARRAYS[key], stream.value()
+                    if stream.peek() != ",":
+                        break
+                    stream.expect(",")
+            stream.expect("]")
+        else:
+            stream.value()
+        if stream.peek() != ",":
+            break
+        stream.expect(",")
+    stream.expect("}")
+
+
+def _json_lines_records(file: TextIO) -> Iterator[tuple[str, dict]]:
+    """Return an iterator over the (kind, record) of each line of the JSON Lines file, skipping blank lines.
+
+    Every line is a JSON object with a "type" of LOCATION or ITEM and the members of that record in the JSON
+    format.
+    """
+
+    for line in file:
+        if line.strip():
+            record = json.loads(line)
+            yield record.pop("type"), record
+
+
+def iter_records(filename: str) -> Iterator[tuple[str, dict]]:
+    """Return an iterator over the (kind, record) of every location and item record in the game data file
+    filename, in the order they appear in it, reading the file one chunk at a time.
+
+    A file whose name ends with ".jsonl" is read as JSON Lines (see write_json_lines), any other file as JSON.
+
+    Preconditions:
+        - filename is the filename of a valid game data JSON or JSON Lines file
+    """
+
+    with open(filename, 'r', encoding='utf-8') as file:
+        if filename.endswith(".jsonl"):
+            yield from _json_lines_records(file)
+        else:
+            yield from _json_records(file)
+
+
+def load_world(filename: str) -> tuple[dict[int, Location], list[Item]]:
+    """Load locations and items from the game data file filename, building each one as its record is read, and
+    return them as adventure.load_game_data does.
+
+    The items of a location are found by name in an index of the items read so far; a location naming an item
+    that has not been read yet gets its items once the whole file has been read.
+
+    >>> locations, items = load_world('game_data.json')
+    >>> locations[20].name, [item.name for item in locations[20].items]
+    ('Sidney Smith Hall 2F', ['key'])
+
+    Preconditions:
+        - filename is the filename of a valid game data JSON or JSON Lines file
+    """
+
+    locations = {}
+    items = []
+    items_by_name = {}
+    pending = []  # the (location, item names) of the locations naming items that have not been read yet
+
+    for kind, record in iter_records(filename):
+        if kind == ITEM:
+            item = Item(record['name'], record['description'], (record['start_position'], record['target_position']))
+            items.append(item)
+            items_by_name[item.name] = item
+        elif kind == LOCATION:
+            # each record is parsed on its own, so the commands shared by many locations are interned here
+            commands = {sys.intern(command): target for command, target in record['available_commands'].items()}
+            location = Location((record['id'], record['name']),
+                                (record['brief_description'], record['long_description']), commands, [])
+            if all(name in items_by_name for name in record['items']):
+                for name in record['items']:
+                    location.add_item(items_by_name[name])
+            else:
+                pending.append((location, record['items']))
+            locations[location.id_num] = location
+
+    for location, names in pending:
+        for name in names:
+            location.add_item(items_by_name[name])
+
+    return locations, items
+
+
+def write_json_lines(filename: str, jsonl_filename: str) -> None:
+    """Write the records of the game data file filename to jsonl_filename in the JSON Lines format, items first
+    so that every location's items are known when the location is read.
+
+    Preconditions:
+        - filename is the filename of a valid game data JSON or JSON Lines file
+    """
+
+    with open(jsonl_filename, 'w', encoding='utf-8') as out:
+        for wanted in (ITEM, LOCATION):
+            for kind, record in iter_records(filename):
+                if kind == wanted:
+                    out.write(json.dumps({"type": kind, **record}))
+                    out.write("\n")
+
+
+if __name__ == "__main__":
+    # When you are ready to check your work with python_ta, uncomment the following lines.
+    # (Delete the "#" and space before each line.)
+    # IMPORTANT: keep this code indented inside the "if __name__ == '__main__'" block
+    import python_ta
+    python_ta.check_all(config={
+        'max-line-length': 120,
+        'disable': ['R1705', 'E9998', 'E9999']
+    })
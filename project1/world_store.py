@@ -0,0 +1,689 @@
+"""CSC111 Project 1: Text Adventure Game - Indexed World Store
+
+Instructions (READ THIS FIRST!)
+===============================
+
+This Python module contains the indexed world store for Project 1, to be imported and used by
+ the `adventure` module. A world stored in a JSON Lines file is opened through an index of the
+ file's records, and each location is only read from the file when a game first needs it. A
+ world can also be compiled (and validated) once into a binary file of fixed-width tables, which
+ is opened by memory-mapping it, without parsing anything.
+ Please consult the project handout for instructions and details.
+
+Copyright and Usage Information
+===============================
+
+This file is provided solely for the personal and private use of students
+taking CSC111 at the University of Toronto St. George campus. All forms of
+distribution of this code, whether as given or with any changes, are
+expressly prohibited. For more information on copyright for CSC111 materials,
+please consult our Course Syllabus.
+
+This file is Copyright (c) 2025 CSC111 Teaching Team
+"""
+from __future__ import annotations
+import io
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+from collections import OrderedDict
+from collections.abc import Mapping, Sequence
+from types import MappingProxyType
+from typing import Any, BinaryIO, Optional
+from game_entities import Item
+from game_world import NOWHERE, WorldDefinition
+from world_loader import ITEM, LOCATION, iter_records
+
+# The first bytes of every index file
+MAGIC = b"DDX2"
+
+# The header of an index file: the magic bytes, whether its arrays are little-endian, the stamp of the data file
+# it indexes (see _source_stamp), and the numbers of locations and items (40 bytes, so that the arrays after it
+# are aligned). The arrays are, in order: the offset of each location's line and of each item's line in the
+# data file (int64), the id of the location in each slot, the slots sorted by location id, and the id of the
+# location each item initially lies at or NOWHERE (int32).
+_HEADER = struct.Struct('<4s?3xqqqii')
+
+# The default number of locations kept hydrated by a LazyWorld
+CACHE_SIZE = 4096
+
+# The first bytes of every compiled world file, and the suffix of its name
+COMPILED_MAGIC = b"DDW2"
+COMPILED_SUFFIX = ".ddw"
+
+# The header of a compiled world file: the magic bytes, whether its tables are little-endian, the numbers of
+# locations, items, commands, location items (the items listed at the locations) and strings, the string id of the
+# absolute name of the game data file it was compiled from, the size of the string data and the stamp of the game
+# data file (see _source_stamp) when it was compiled (64 bytes, so that the tables after it are aligned). The
+# tables are, in order:
+#   - the offset of each string in the string data, followed by its size (int64)
+#   - the id of the location in each slot, and the slots sorted by location id (int32)
+#   - a row of LOCATION_FIELDS int32s per location: the string ids of its name and of its brief and long
+#     descriptions, and the first row and number of rows of its commands and of its location items
+#   - a row of COMMAND_FIELDS int32s per command: the string id of the command and the id of the location it
+#     leads to
+#   - the index of each location item (int32)
+#   - a row of ITEM_FIELDS int32s per item: the string ids of its name and description, its start and target
+#     positions (_NO_TARGET for None) and the id of the location it initially lies at, or NOWHERE
+# followed by the string data, every distinct string of the world encoded once in UTF-8.
+_COMPILED_HEADER = struct.Struct('<4s?3x5iiqqqq')
+LOCATION_FIELDS = 7
+COMMAND_FIELDS = 2
+ITEM_FIELDS = 5
+
+# The target position stored for an item whose target position is None
+_NO_TARGET = -2 ** 31
+
+
+def index_filename(filename: str) -> str:
+    """Return the name of the index file of the JSON Lines world in filename."""
+
+    return filename + ".idx"
+
+
+def _source_stamp(filename: str) -> tuple[int, int, int]:
+    """Return the size, modification time (in nanoseconds) and inode number of filename, which change whenever the
+    file is written or replaced by another one."""
+
+    stat = os.stat(filename)
+    return stat.st_size, stat.st_mtime_ns, stat.st_ino
+
+
+def _write_atomically(path: str, data: bytes) -> None:
+    """Write data to a new file at path, replacing any file there at once, so that no process ever opens the file
+    half written."""
+
+    temporary = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(temporary, 'wb') as file:
+            file.write(data)
+        os.replace(temporary, path)
+    finally:
+        if os.path.exists(temporary):
+            os.remove(temporary)
+
+
+def build_index(filename: str) -> bytes:
+    """Return the index of the JSON Lines world in filename.
+
+    The file is read again if it changed while it was read, so the index always matches the stamp it records.
+
+    Preconditions:
+        - filename is the filename of a valid game data JSON Lines file
+    """
+
+    while True:
+        stamp = _source_stamp(filename)
+        index = _build_index(filename, stamp)
+        if _source_stamp(filename) == stamp:
+            return index
+
+
+def _build_index(filename: str, stamp: tuple[int, int, int]) -> bytes:
+    """Return the index of the JSON Lines world in filename, reading the file once, recording stamp as the stamp
+    of the file."""
+
+    offsets, item_offsets, ids = array('q'), array('q'), array('i')
+    item_names = []
+    location_of_item = {}  # the id of the location each item name is listed at
+    with open(filename, 'rb') as file:
+        offset = 0
+        for line in file:
+            if line.strip():
+                record = json.loads(line)
+                if record['type'] == LOCATION:
+                    offsets.append(offset)
+                    ids.append(record['id'])
+                    for name in record['items']:
+                        location_of_item[name] = record['id']
+                elif record['type'] == ITEM:
+                    item_offsets.append(offset)
+                    item_names.append(record['name'])
+            offset += len(line)
+
+    order = array('i', sorted(range(len(ids)), key=ids.__getitem__))
+    positions = array('i', [location_of_item.get(name, NOWHERE) for name in item_names])
+    header = _HEADER.pack(MAGIC, sys.byteorder == 'little', *stamp, len(ids), len(item_names))
+    return b"".join([header, offsets.tobytes(), item_offsets.tobytes(), ids.tobytes(), order.tobytes(),
+                     positions.tobytes()])
+
+
+def _is_current(index: bytes | mmap.mmap, filename: str) -> bool:
+    """Return whether index is a whole index, in this machine's byte order, of the current contents of filename
+    (whose stamp is the one it records)."""
+
+    if len(index) < _HEADER.size:
+        return False
+    magic, little_endian, size, mtime_ns, inode, n_locations, n_items = _HEADER.unpack_from(index)
+    return (magic == MAGIC and little_endian == (sys.byteorder == 'little')
+            and (size, mtime_ns, inode) == _source_stamp(filename)
+            and len(index) == _HEADER.size + 16 * n_locations + 12 * n_items)
+
+
+class _LocationColumn(Sequence):
+    """One attribute of every location of a LazyWorld, indexed by slot, read from the world's hydrated locations.
+
+    Instance Attributes:
+        - world: the world whose locations this column reads
+        - field: the index of the attribute in a hydrated location (see LazyWorld.hydrate)
+    """
+
+    world: LazyWorld
+    field: int
+
+    def __init__(self, world: LazyWorld, field: int) -> None:
+        """Initialize a column of the attribute at index field of every hydrated location of world."""
+
+        self.world = world
+        self.field = field
+
+    def __len__(self) -> int:
+        """Return the number of locations of the world."""
+
+        return len(self.world)
+
+    def __getitem__(self, slot: int) -> Any:
+        """Return the attribute of the location in the given slot, hydrating the location if needed."""
+
+        if not -len(self.world) <= slot < len(self.world):
+            raise IndexError(slot)
+        return self.world.hydrate(slot % len(self.world))[self.field]
+
+
+class LazyWorld(WorldDefinition):
+    """A world read from a JSON Lines file through an index, hydrating each location only when it is needed.
+
+    The index (an offset table into the file, see build_index) is kept next to the file and rebuilt whenever the
+    file changes (its size, modification time or inode differs from the ones the index records), so opening a
+    world whose index is current only reads the items: the locations are read one at a time, the first time a
+    game needs them, and the most recently used cache_size of them are kept hydrated. A LazyWorld can be used
+    wherever a WorldDefinition can, and its names, descriptions, commands and initial_items read hydrated
+    locations.
+
+    Hydrated locations are never changed, since everything a game changes lives in its own SessionState; evicting
+    one therefore never needs to write anything back, and the memory of a game scales with the locations it uses
+    rather than with the size of the world.
+
+    Instance Attributes:
+        - filename: the JSON Lines file of this world
+        - cache_size: the maximum number of locations kept hydrated
+        - hydrations: the number of times a location was read from the file
+
+    Representation Invariants:
+        - self.cache_size >= 1
+        - len(self._hydrated) <= self.cache_size
+    """
+
+    filename: str
+    cache_size: int
+    hydrations: int
+
+    # Private Instance Attributes:
+    #   - _data: the memory map of the JSON Lines file
+    #   - _index: the index of the file, memory-mapped from its index file (or built in memory if that cannot be
+    #             written)
+    #   - _offsets: the offset of the line of the location in each slot
+    #   - _order: the slots, sorted by the id of their location
+    #   - _hydrated: the (name, descriptions, commands, initial item indexes) of the hydrated locations, by slot,
+    #                from least to most recently used
+    _data: mmap.mmap
+    _index: bytes | mmap.mmap
+    _offsets: memoryview
+    _order: memoryview
+    _hydrated: OrderedDict[int, tuple]
+
+    def __init__(self, filename: str, cache_size: int = CACHE_SIZE) -> None:
+        """Open the JSON Lines world in filename, building (and writing) its index first if it is not current.
+
+        Preconditions:
+            - filename is the filename of a valid, non-empty game data JSON Lines file
+            - cache_size >= 1
+        """
+
+        super().__init__({}, [])
+        self.filename = filename
+        self.cache_size = cache_size
+        self.hydrations = 0
+        self._hydrated = OrderedDict()
+        self._open()
+        self._item_indexes = {item.name: i for i, item in enumerate(self.items)}
+        self.names = _LocationColumn(self, 0)
+        self.descriptions = _LocationColumn(self, 1)
+        self.commands = _LocationColumn(self, 2)
+        self.initial_items = _LocationColumn(self, 3)
+
+    def _open(self) -> None:
+        """Open self.filename, reading its location ids and items, and mapping whatever hydrating its locations
+        needs."""
+
+        self._index = self._open_index()
+        with open(self.filename, 'rb') as file:
+            self._data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        n_locations, n_items = _HEADER.unpack_from(self._index)[-2:]
+        view = memoryview(self._index)
+        start = _HEADER.size
+        arrays = []
+        for typecode, length in (('q', n_locations), ('q', n_items), ('i', n_locations), ('i', n_locations),
+                                 ('i', n_items)):
+            end = start + length * (8 if typecode == 'q' else 4)
+            arrays.append(view[start:end].cast(typecode))
+            start = end
+        self._offsets, item_offsets, self.location_ids, self._order, positions = arrays
+
+        self.items = tuple(Item(record['name'], record['description'],
+                                (record['start_position'], record['target_position']))
+                           for record in map(self._record, item_offsets))
+        self.initial_positions = array('i', positions)
+
+    def _open_index(self) -> bytes | mmap.mmap:
+        """Return the index of self.filename, memory-mapped from its index file, which is written first if it is
+        missing or out of date. If it cannot be written, return an index built in memory."""
+
+        path = index_filename(self.filename)
+        if os.path.exists(path):
+            with open(path, 'rb') as file:
+                index = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            if _is_current(index, self.filename):
+                return index
+            index.close()
+
+        index = build_index(self.filename)
+        try:
+            _write_atomically(path, index)
+        except OSError:
+            return index
+        with open(path, 'rb') as file:
+            return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def _record(self, offset: int) -> dict:
+        """Return the record on the line of the JSON Lines file starting at offset."""
+
+        end = self._data.find(b"\n", offset)
+        return json.loads(self._data[offset:end if end != -1 else len(self._data)])
+
+    def __len__(self) -> int:
+        """Return the number of locations in this world."""
+
+        return len(self.location_ids)
+
+    def hydrate(self, slot: int) -> tuple[str, tuple[str, str], Mapping[str, int], tuple[int, ...]]:
+        """Return the name, descriptions, commands and initial item indexes of the location in the given slot,
+        reading it from the file if it is not hydrated, and evicting the least recently used location if more
+        than cache_size would be hydrated.
+
+        Preconditions:
+            - 0 <= slot < len(self)
+        """
+
+        location = self._hydrated.get(slot)
+        if location is not None:
+            self._hydrated.move_to_end(slot)
+            return location
+
+        location = self._read_location(slot)
+        self.hydrations += 1
+        self._hydrated[slot] = location
+        if len(self._hydrated) > self.cache_size:
+            self._hydrated.popitem(last=False)
+        return location
+
+    def _read_location(self, slot: int) -> tuple[str, tuple[str, str], Mapping[str, int], tuple[int, ...]]:
+        """Read the name, descriptions, commands and initial item indexes of the location in the given slot from
+        the file."""
+
+        record = self._record(self._offsets[slot])
+        return (record['name'], (record['brief_description'], record['long_description']),
+                MappingProxyType({sys.intern(command): target
+                                  for command, target in record['available_commands'].items()}),
+                tuple(self._item_indexes[name] for name in record['items']))
+
+    def _find(self, location_id: int) -> Optional[int]:
+        """Return the slot of the location with the given id, or None if there is none."""
+
+        i = bisect_left(self._order, location_id, key=self.location_ids.__getitem__)
+        if i < len(self._order) and self.location_ids[self._order[i]] == location_id:
+            return self._order[i]
+        return None
+
+    def slot_of(self, location_id: int) -> int:
+        """Return the slot of the location with the given id.
+
+        Preconditions:
+            - self.has_location(location_id)
+        """
+
+        return self._find(location_id)
+
+    def has_location(self, location_id: int) -> bool:
+        """Return whether this world has a location with the given id."""
+
+        return self._find(location_id) is not None
+
+    def target_slots(self, commands: Mapping[str, int]) -> list[int]:
+        """Return the slots of the locations (of this world) the given available commands lead to."""
+
+        slots = (self._find(target) for target in commands.values())
+        return [slot for slot in slots if slot is not None]
+
+
+class _WorldTables:
+    """The tables of a compiled world, built from the records of a game data file.
+
+    Instance Attributes:
+        - strings: the string id of every string of the world, in the order they were first added
+        - location_ids: the id of the location in each slot
+        - locations: the LOCATION_FIELDS fields of each location (see _COMPILED_HEADER)
+        - commands: the COMMAND_FIELDS fields of each command
+        - location_item_names: the name of each location item
+        - items: the ITEM_FIELDS fields of each item
+        - item_names: the name of each item
+    """
+
+    strings: dict[str, int]
+    location_ids: array
+    locations: array
+    commands: array
+    location_item_names: list[str]
+    items: array
+    item_names: list[str]
+
+    def __init__(self) -> None:
+        """Initialize empty tables."""
+
+        self.strings = {}
+        self.location_ids, self.locations, self.commands, self.items = array('i'), array('i'), array('i'), array('i')
+        self.location_item_names = []
+        self.item_names = []
+
+    def _string_id(self, string: str) -> int:
+        """Return the string id of string, adding it to the strings if needed."""
+
+        return self.strings.setdefault(string, len(self.strings))
+
+    def add(self, kind: str, record: dict) -> None:
+        """Add the location or item record of the given kind (LOCATION or ITEM) after the ones added so far."""
+
+        if kind == LOCATION:
+            self.location_ids.append(record['id'])
+            self.locations.extend([self._string_id(record['name']), self._string_id(record['brief_description']),
+                                   self._string_id(record['long_description']),
+                                   len(self.commands) // COMMAND_FIELDS, len(record['available_commands']),
+                                   len(self.location_item_names), len(record['items'])])
+            for command, target in record['available_commands'].items():
+                self.commands.extend([self._string_id(command), target])
+            self.location_item_names.extend(record['items'])
+        elif kind == ITEM:
+            target = record['target_position']
+            self.items.extend([self._string_id(record['name']), self._string_id(record['description']),
+                               record['start_position'], _NO_TARGET if target is None else target, NOWHERE])
+            self.item_names.append(record['name'])
+
+    def problems(self) -> list[str]:
+        """Return a description of every way these tables break the representation invariants of the Location
+        and Item classes (see game_entities), and every location or item name used more than once. An item target
+        position of None or 0 means the item has no target.
+        """
+
+        problems = []
+        ids = set()
+        for location_id in self.location_ids:
+            if location_id in ids:
+                problems.append(f"location {location_id} appears more than once")
+            ids.add(location_id)
+
+        item_names = set()
+        for name in self.item_names:
+            if name in item_names:
+                problems.append(f"item {name!r} appears more than once")
+            item_names.add(name)
+
+        strings = list(self.strings)
+        listed_at = {}  # the id of the first location listing each item name
+        for slot, location_id in enumerate(self.location_ids):
+            _, brief, long, first_command, n_commands, first_item, n_items = self._location(slot)
+            if not strings[brief] or not strings[long]:
+                problems.append(f"location {location_id} has an empty description")
+            if n_commands == 0:
+                problems.append(f"location {location_id} has no available commands")
+            for row in range(first_command, first_command + n_commands):
+                command, target = self.commands[row * COMMAND_FIELDS:(row + 1) * COMMAND_FIELDS]
+                if target not in ids:
+                    problems.append(f"command {strings[command]!r} of location {location_id} leads to {target}, "
+                                    "which is not a location")
+            for name in self.location_item_names[first_item:first_item + n_items]:
+                if name not in item_names:
+                    problems.append(f"location {location_id} lists {name!r}, which is not an item")
+                elif name in listed_at:
+                    problems.append(f"item {name!r} is listed at locations {listed_at[name]} and {location_id}")
+                else:
+                    listed_at[name] = location_id
+
+        for i, name in enumerate(self.item_names):
+            _, _, start, target, _ = self.items[i * ITEM_FIELDS:(i + 1) * ITEM_FIELDS]
+            if start not in ids:
+                problems.append(f"item {name!r} starts at {start}, which is not a location")
+            if target not in ids and target not in (_NO_TARGET, 0):
+                problems.append(f"item {name!r} has target {target}, which is not a location")
+        return problems
+
+    def _location(self, slot: int) -> list[int]:
+        """Return the LOCATION_FIELDS fields of the location in the given slot."""
+
+        return self.locations[slot * LOCATION_FIELDS:(slot + 1) * LOCATION_FIELDS].tolist()
+
+    def write(self, file: BinaryIO, source: str, stamp: tuple[int, int, int]) -> None:
+        """Write these tables to file in the compiled world format, resolving the items listed at each location,
+        and recording that they were read from the game data file source (an absolute file name) when its stamp was
+        stamp.
+
+        Preconditions:
+            - not self.problems()
+        """
+
+        item_indexes = {name: i for i, name in enumerate(self.item_names)}
+        location_items = array('i', [item_indexes[name] for name in self.location_item_names])
+        for slot, location_id in enumerate(self.location_ids):
+            first_item, n_items = self._location(slot)[5:]
+            for i in location_items[first_item:first_item + n_items]:
+                self.items[i * ITEM_FIELDS + 4] = location_id
+
+        source_id = self._string_id(source)
+        data = [string.encode() for string in self.strings]
+        offsets = array('q', [0])
+        for encoded in data:
+            offsets.append(offsets[-1] + len(encoded))
+        order = array('i', sorted(range(len(self.location_ids)), key=self.location_ids.__getitem__))
+
+        file.write(_COMPILED_HEADER.pack(COMPILED_MAGIC, sys.byteorder == 'little', len(self.location_ids),
+                                         len(self.item_names), len(self.commands) // COMMAND_FIELDS,
+                                         len(location_items), len(data), source_id, offsets[-1], *stamp))
+        for table in (offsets, self.location_ids, order, self.locations, self.commands, location_items, self.items):
+            table.tofile(file)
+        file.write(b"".join(data))
+
+
+def _read_tables(filename: str) -> _WorldTables:
+    """Return the tables of the game data file filename, reading it one record at a time."""
+
+    tables = _WorldTables()
+    for kind, record in iter_records(filename):
+        tables.add(kind, record)
+    return tables
+
+
+def validate_world(filename: str) -> list[str]:
+    """Return a description of every problem compile_world would reject in the game data file filename.
+
+    >>> validate_world('game_data.json')
+    []
+
+    Preconditions:
+        - filename is the filename of a game data JSON or JSON Lines file
+    """
+
+    return _read_tables(filename).problems()
+
+
+def compile_world(filename: str, compiled_filename: str) -> None:
+    """Validate the game data file filename and compile it to compiled_filename, to be opened as a CompiledWorld.
+
+    Raise a ValueError describing every problem found instead if the world breaks the invariants of game_entities
+    (see validate_world), so that a compiled world never needs to be checked while it is played.
+
+    The compiled world records the name and stamp of filename, so that it is compiled again when it is opened after
+    filename changed (see CompiledWorld), and it replaces any file at compiled_filename at once.
+
+    Preconditions:
+        - filename is the filename of a game data JSON or JSON Lines file
+    """
+
+    _write_atomically(compiled_filename, _compile(filename))
+
+
+def _compile(filename: str) -> bytes:
+    """Return the compiled world of the game data file filename (see compile_world).
+
+    The file is read again if it changed while it was read, so the compiled world always matches the stamp it
+    records.
+    """
+
+    while True:
+        stamp = _source_stamp(filename)
+        tables = _read_tables(filename)
+        if _source_stamp(filename) == stamp:
+            break
+    problems = tables.problems()
+    if problems:
+        raise ValueError(f"{filename} is not a valid world:\n" + "\n".join(problems))
+    file = io.BytesIO()
+    tables.write(file, os.path.abspath(filename), stamp)
+    return file.getvalue()
+
+
+class CompiledWorld(LazyWorld):
+    """A world opened from a compiled world file (see compile_world) by memory-mapping it.
+
+    Opening a compiled world parses nothing but its items: its tables are used in place, and each location's
+    strings and commands are only decoded the first time a game needs them, then kept hydrated like those of a
+    LazyWorld. The file was validated when it was compiled, so nothing is checked while it is opened.
+
+    If the game data file it was compiled from still exists but has changed since (its stamp differs from the one
+    the compiled world records), the world is compiled again first, replacing the file (or only in memory, if it
+    cannot be written). A compiled world whose game data file is gone is opened as it is.
+    """
+
+    # Private Instance Attributes:
+    #   - _data: the file, memory-mapped (or compiled again in memory if its game data file changed and it cannot
+    #     be replaced)
+    #   - _source: the absolute name of the game data file the world was compiled from
+    #   - _stamp: the stamp (see _source_stamp) of that game data file when the world was compiled
+    #   - _strings: the string data of the file
+    #   - _string_offsets: the offset of each string in _strings, followed by the size of _strings
+    #   - _locations: the LOCATION_FIELDS fields of each location
+    #   - _commands: the COMMAND_FIELDS fields of each command
+    #   - _location_items: the index of each location item
+    _data: bytes | mmap.mmap
+    _source: str
+    _stamp: tuple[int, int, int]
+    _strings: memoryview
+    _string_offsets: memoryview
+    _locations: memoryview
+    _commands: memoryview
+    _location_items: memoryview
+
+    def _open(self) -> None:
+        """Open self.filename, compiling it again first if its game data file changed since it was compiled, and
+        read its location ids and items.
+
+        Preconditions:
+            - self.filename is the filename of a world compiled by compile_world
+        """
+
+        self._data = self._map_compiled()
+        self._source, self._stamp = self._read_compiled()
+        if not self.is_current():
+            compiled = _compile(self._source)
+            try:
+                _write_atomically(self.filename, compiled)
+            except OSError:
+                self._data = compiled
+            else:
+                self._data = self._map_compiled()
+            self._source, self._stamp = self._read_compiled()
+
+    def is_current(self) -> bool:
+        """Return whether the game data file this world was compiled from is gone or unchanged since."""
+
+        try:
+            return _source_stamp(self._source) == self._stamp
+        except FileNotFoundError:
+            return True
+
+    def _map_compiled(self) -> mmap.mmap:
+        """Return a memory map of self.filename, raising a ValueError if it is not a world compiled by
+        compile_world on a machine with this byte order."""
+
+        with open(self.filename, 'rb') as file:
+            data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        if (len(data) < _COMPILED_HEADER.size or data[:len(COMPILED_MAGIC)] != COMPILED_MAGIC
+                or _COMPILED_HEADER.unpack_from(data)[1] != (sys.byteorder == 'little')):
+            data.close()
+            raise ValueError(f"{self.filename} is not a world compiled on a machine with this byte order")
+        return data
+
+    def _read_compiled(self) -> tuple[str, tuple[int, int, int]]:
+        """Read the location ids and items of the compiled world in self._data, and return the name of the game
+        data file it was compiled from and the stamp that file had then."""
+
+        _, _, n_locations, n_items, n_commands, n_location_items, n_strings, source_id, strings_size, *stamp = \
+            _COMPILED_HEADER.unpack_from(self._data)
+        view = memoryview(self._data)
+        start = _COMPILED_HEADER.size
+        tables = []
+        for typecode, length in (('q', n_strings + 1), ('i', n_locations), ('i', n_locations),
+                                 ('i', n_locations * LOCATION_FIELDS), ('i', n_commands * COMMAND_FIELDS),
+                                 ('i', n_location_items), ('i', n_items * ITEM_FIELDS)):
+            end = start + length * (8 if typecode == 'q' else 4)
+            tables.append(view[start:end].cast(typecode))
+            start = end
+        self._strings = view[start:start + strings_size]
+        self._string_offsets, self.location_ids, self._order, self._locations, self._commands, \
+            self._location_items, items = tables
+
+        self.items = tuple(Item(self._string(items[i]), self._string(items[i + 1]),
+                                (items[i + 2], None if items[i + 3] == _NO_TARGET else items[i + 3]))
+                           for i in range(0, len(items), ITEM_FIELDS))
+        self.initial_positions = array('i', items[ITEM_FIELDS - 1::ITEM_FIELDS])
+        return self._string(source_id), tuple(stamp)
+
+    def _string(self, string_id: int) -> str:
+        """Return the string with the given string id."""
+
+        return str(self._strings[self._string_offsets[string_id]:self._string_offsets[string_id + 1]], 'utf-8')
+
+    def _read_location(self, slot: int) -> tuple[str, tuple[str, str], Mapping[str, int], tuple[int, ...]]:
+        """Read the name, descriptions, commands and initial item indexes of the location in the given slot from
+        the tables."""
+
+        name, brief, long, first_command, n_commands, first_item, n_items = \
+            self._locations[slot * LOCATION_FIELDS:(slot + 1) * LOCATION_FIELDS]
+        rows = self._commands[first_command * COMMAND_FIELDS:(first_command + n_commands) * COMMAND_FIELDS]
+        commands = {sys.intern(self._string(rows[i])): rows[i + 1] for i in range(0, len(rows), COMMAND_FIELDS)}
+        return (self._string(name), (self._string(brief), self._string(long)), MappingProxyType(commands),
+                tuple(self._location_items[first_item:first_item + n_items]))
+
+
+if __name__ == "__main__":
+    # When you are ready to check your work with python_ta, uncomment the following lines.
+    # (Delete the "#" and space before each line.)
+    # IMPORTANT: keep this code indented inside the "if __name__ == '__main__'" block
+    import python_ta
+    python_ta.check_all(config={
+        'max-line-length': 120,
+        'disable': ['R1705', 'E9998', 'E9999']
+    })